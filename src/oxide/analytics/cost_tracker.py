@@ -156,6 +156,7 @@ class CostTracker:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_costs_timestamp ON llm_costs(timestamp)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_costs_service ON llm_costs(service)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_costs_task_id ON llm_costs(task_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_costs_service_timestamp ON llm_costs(service, timestamp)")
 
         conn.commit()
         conn.close()
@@ -488,11 +489,27 @@ class CostTracker:
         week_ago = now - (7 * 86400)
         month_ago = now - (30 * 86400)
 
+        # All period totals in a single scan
+        conn = sqlite3.connect(str(self.db_path))
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT
+                SUM(cost_usd),
+                SUM(CASE WHEN timestamp >= ? THEN cost_usd ELSE 0 END),
+                SUM(CASE WHEN timestamp >= ? THEN cost_usd ELSE 0 END),
+                SUM(CASE WHEN timestamp >= ? THEN cost_usd ELSE 0 END)
+            FROM llm_costs
+        """, (day_ago, week_ago, month_ago))
+
+        total_cost, cost_24h, cost_7d, cost_30d = cursor.fetchone()
+        conn.close()
+
         return {
-            "total_cost": self.get_total_cost(),
-            "cost_24h": self.get_total_cost(start_time=day_ago),
-            "cost_7d": self.get_total_cost(start_time=week_ago),
-            "cost_30d": self.get_total_cost(start_time=month_ago),
+            "total_cost": total_cost or 0.0,
+            "cost_24h": cost_24h or 0.0,
+            "cost_7d": cost_7d or 0.0,
+            "cost_30d": cost_30d or 0.0,
             "by_service": self.get_cost_by_service(),
             "token_usage": self.get_token_usage(),
             "daily_costs": self.get_daily_costs(days=30)
@@ -6,6 +6,7 @@ Enables multi-machine cooperation and task distribution.
 from .coordinator import (
     ClusterCoordinator,
     NodeInfo,
+    TaskResult,
     get_cluster_coordinator,
     init_cluster_coordinator
 )
@@ -13,6 +14,7 @@ from .coordinator import (
 __all__ = [
     "ClusterCoordinator",
     "NodeInfo",
+    "TaskResult",
     "get_cluster_coordinator",
     "init_cluster_coordinator"
 ]
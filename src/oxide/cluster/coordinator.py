@@ -46,6 +46,13 @@ class NodeInfo:
             self.features = []
 
 
+@dataclass(slots=True)
+class TaskResult:
+    """Outcome of a task executed on a remote node"""
+    ok: bool
+    payload: Dict[str, Any]
+
+
 class ClusterCoordinator:
     """
     Coordinates task distribution across multiple Oxide instances.
@@ -62,7 +69,8 @@ class ClusterCoordinator:
         node_id: str,
         broadcast_port: int = 8888,
         api_port: int = 8000,
-        discovery_interval: int = 30
+        discovery_interval: int = 30,
+        status_refresh_interval: float = 1.0
     ):
         """
         Initialize cluster coordinator.
@@ -72,21 +80,25 @@ class ClusterCoordinator:
             broadcast_port: Port for discovery broadcasts
             api_port: Port for Oxide API
             discovery_interval: Seconds between discovery broadcasts
+            status_refresh_interval: Seconds between cluster status snapshot refreshes
         """
         self.logger = get_logger(__name__)
         self.node_id = node_id
         self.broadcast_port = broadcast_port
         self.api_port = api_port
         self.discovery_interval = discovery_interval
+        self.status_refresh_interval = status_refresh_interval
 
         # Cluster state
         self.nodes: Dict[str, NodeInfo] = {}
         self.local_node: Optional[NodeInfo] = None
+        self._status_snapshot: Optional[Dict[str, Any]] = None
 
         # Discovery tasks
         self._discovery_task: Optional[asyncio.Task] = None
         self._broadcast_task: Optional[asyncio.Task] = None
         self._health_check_task: Optional[asyncio.Task] = None
+        self._status_task: Optional[asyncio.Task] = None
 
         # SQLite persistence for discovered nodes
         self.config_storage = ConfigStorageSQLite()
@@ -110,6 +122,7 @@ class ClusterCoordinator:
         self._discovery_task = asyncio.create_task(self._listen_for_nodes())
         self._broadcast_task = asyncio.create_task(self._broadcast_presence())
         self._health_check_task = asyncio.create_task(self._monitor_node_health())
+        self._status_task = asyncio.create_task(self._refresh_status_snapshot())
 
         self.logger.info("Cluster coordinator started")
 
@@ -121,6 +134,8 @@ class ClusterCoordinator:
             self._broadcast_task.cancel()
         if self._health_check_task:
             self._health_check_task.cancel()
+        if self._status_task:
+            self._status_task.cancel()
 
         self.logger.info("Cluster coordinator stopped")
 
@@ -360,6 +375,32 @@ class ClusterCoordinator:
         except asyncio.CancelledError:
             self.logger.info("Health check task cancelled")
 
+    async def _refresh_status_snapshot(self):
+        """Periodically rebuild the cluster status snapshot served to API readers"""
+        try:
+            while True:
+                self._status_snapshot = self.get_cluster_status()
+                await asyncio.sleep(self.status_refresh_interval)
+
+        except asyncio.CancelledError:
+            self.logger.info("Status refresh task cancelled")
+
+    def get_status_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the latest cluster status snapshot.
+
+        Refreshed in the background every status_refresh_interval seconds so
+        concurrent readers share one computation. Falls back to computing the
+        status directly until the first refresh has run.
+
+        Returns:
+            Cluster status (same shape as get_cluster_status)
+        """
+        snapshot = self._status_snapshot
+        if snapshot is None:
+            snapshot = self.get_cluster_status()
+        return snapshot
+
     def get_cluster_status(self) -> Dict[str, Any]:
         """Get cluster status"""
         return {
@@ -424,7 +465,7 @@ class ClusterCoordinator:
         prompt: str,
         files: Optional[List[str]] = None,
         preferences: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> TaskResult:
         """
         Execute task on a remote node.
 
@@ -435,7 +476,7 @@ class ClusterCoordinator:
             preferences: Task preferences
 
         Returns:
-            Task result
+            TaskResult with ok=False and an error payload on failure
         """
         import aiohttp
 
@@ -453,15 +494,15 @@ class ClusterCoordinator:
                     if response.status == 200:
                         result = await response.json()
                         self.logger.info(f"Task completed on node: {node.hostname}")
-                        return result
+                        return TaskResult(ok=True, payload=result)
                     else:
                         error = await response.text()
                         self.logger.error(f"Task failed on node {node.hostname}: {error}")
-                        return {"error": error, "status": "failed"}
+                        return TaskResult(ok=False, payload={"error": error, "status": "failed"})
 
         except Exception as e:
             self.logger.error(f"Failed to execute task on {node.hostname}: {e}")
-            return {"error": str(e), "status": "failed"}
+            return TaskResult(ok=False, payload={"error": str(e), "status": "failed"})
 
     def enable_node(self, node_id: str) -> bool:
         """
@@ -481,6 +522,7 @@ class ClusterCoordinator:
             # Enable in memory if present
             if node_id in self.nodes:
                 self.nodes[node_id].enabled = True
+                self._status_snapshot = None
 
             self.logger.info(f"Enabled node: {node_id}")
             return True
@@ -506,6 +548,7 @@ class ClusterCoordinator:
             # Disable in memory if present
             if node_id in self.nodes:
                 self.nodes[node_id].enabled = False
+                self._status_snapshot = None
 
             self.logger.info(f"Disabled node: {node_id}")
             return True
@@ -85,6 +85,8 @@ class ExecutionConfig(BaseModel):
     streaming: bool = True
     retry_on_failure: bool = True
     max_retries: int = 2
+    task_workers: int = 8
+    task_queue_size: int = 1024
 
 
 class LoggingConfig(BaseModel):
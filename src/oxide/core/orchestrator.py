@@ -4,6 +4,7 @@ Core orchestration system for Oxide.
 Coordinates task classification, routing, and execution across LLM services.
 """
 from typing import AsyncIterator, List, Optional, Dict, Any
+import asyncio
 import time
 import hashlib
 
@@ -300,8 +301,10 @@ class Orchestrator:
                 service_responses = {}  # {service_name: [chunks]}
                 service_chunks_count = {}  # {service_name: count}
 
-                # Execute on all services simultaneously and merge streams
-                async for chunk_data in self._execute_broadcast_all(
+                # Execute on all services simultaneously and merge streams.
+                # Chunks arrive as dicts and are serialized once for callers,
+                # so per-service tracking needs no parse of its own.
+                async for chunk_obj in self._broadcast_chunks(
                     decision.broadcast_services,
                     enhanced_prompt,
                     files,
@@ -310,49 +313,44 @@ class Orchestrator:
                 ):
                     # Yield chunks with service identifier
                     # Format: {"service": "gemini", "chunk": "text...", "done": false}
+                    chunk_data = json.dumps(chunk_obj)
                     yield chunk_data
                     response_chunks.append(chunk_data)
 
-                    # Parse and track per-service responses
-                    try:
-                        chunk_obj = json.loads(chunk_data)
-                        service_name = chunk_obj.get("service")
-                        chunk_text = chunk_obj.get("chunk", "")
-                        is_done = chunk_obj.get("done", False)
-                        error = chunk_obj.get("error")
-
-                        if service_name:
-                            # Initialize tracking for this service
-                            if service_name not in service_responses:
-                                service_responses[service_name] = []
-                                service_chunks_count[service_name] = 0
-
-                            # Append chunk
-                            if chunk_text:
-                                service_responses[service_name].append(chunk_text)
-
-                            # Count chunks
-                            if chunk_text or is_done:
-                                service_chunks_count[service_name] += 1
-
-                            # Store final result when service completes
-                            if is_done:
-                                result_text = "".join(service_responses[service_name])
-                                self.task_storage.add_broadcast_result(
-                                    task_id=task_id,
-                                    service=service_name,
-                                    result=result_text if not error else None,
-                                    error=error,
-                                    chunks=service_chunks_count[service_name]
-                                )
-                                self.logger.info(
-                                    f"Stored broadcast result for {service_name}: "
-                                    f"{len(result_text)} chars, {service_chunks_count[service_name]} chunks"
-                                )
-
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"Failed to parse broadcast chunk: {chunk_data[:100]}")
-                        continue
+                    # Track per-service responses
+                    service_name = chunk_obj.get("service")
+                    chunk_text = chunk_obj.get("chunk", "")
+                    is_done = chunk_obj.get("done", False)
+                    error = chunk_obj.get("error")
+
+                    if service_name:
+                        # Initialize tracking for this service
+                        if service_name not in service_responses:
+                            service_responses[service_name] = []
+                            service_chunks_count[service_name] = 0
+
+                        # Append chunk
+                        if chunk_text:
+                            service_responses[service_name].append(chunk_text)
+
+                        # Count chunks
+                        if chunk_text or is_done:
+                            service_chunks_count[service_name] += 1
+
+                        # Store final result when service completes
+                        if is_done:
+                            result_text = "".join(service_responses[service_name])
+                            self.task_storage.add_broadcast_result(
+                                task_id=task_id,
+                                service=service_name,
+                                result=result_text if not error else None,
+                                error=error,
+                                chunks=service_chunks_count[service_name]
+                            )
+                            self.logger.info(
+                                f"Stored broadcast result for {service_name}: "
+                                f"{len(result_text)} chars, {service_chunks_count[service_name]} chunks"
+                            )
 
             elif decision.execution_mode == "parallel" and files and len(files) > 1:
                 # Use parallel execution for large file sets
@@ -591,6 +589,34 @@ class Orchestrator:
             JSON-formatted chunks: {"service": "name", "chunk": "text", "done": false, "timestamp": float}
         """
         import json
+
+        async for chunk_data in self._broadcast_chunks(services, prompt, files, timeout_seconds, task_id):
+            yield json.dumps(chunk_data)
+
+    async def _broadcast_chunks(
+        self,
+        services: List[str],
+        prompt: str,
+        files: Optional[List[str]],
+        timeout_seconds: int,
+        task_id: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream broadcast_all chunks as dicts, in arrival order.
+
+        Same stream as _execute_broadcast_all() before serialization, so
+        callers that need the fields do not parse JSON back.
+
+        Args:
+            services: List of service names to broadcast to
+            prompt: Task prompt
+            files: Optional file paths
+            timeout_seconds: Execution timeout
+            task_id: Task identifier for tracking
+
+        Yields:
+            Chunk dicts: {"service": "name", "chunk": "text", "done": False, "timestamp": float}
+        """
         import asyncio
         from asyncio import Queue
 
@@ -614,7 +640,7 @@ class Orchestrator:
                         "error": "Adapter not found",
                         "timestamp": time.time()
                     }
-                    await chunk_queue.put(json.dumps(error_chunk))
+                    await chunk_queue.put(error_chunk)
                     return
 
                 self.logger.info(f"Broadcasting to {service_name}")
@@ -633,7 +659,7 @@ class Orchestrator:
                         "done": False,
                         "timestamp": time.time()
                     }
-                    await chunk_queue.put(json.dumps(chunk_data))
+                    await chunk_queue.put(chunk_data)
 
                 # Send completion marker
                 done_chunk = {
@@ -643,7 +669,7 @@ class Orchestrator:
                     "timestamp": time.time(),
                     "total_chunks": chunk_count
                 }
-                await chunk_queue.put(json.dumps(done_chunk))
+                await chunk_queue.put(done_chunk)
 
                 self.logger.info(f"Broadcast to {service_name} completed ({chunk_count} chunks)")
 
@@ -657,7 +683,7 @@ class Orchestrator:
                     "error": str(e),
                     "timestamp": time.time()
                 }
-                await chunk_queue.put(json.dumps(error_chunk))
+                await chunk_queue.put(error_chunk)
 
         # Start all service executions in parallel
         for service_name in services:
@@ -670,15 +696,14 @@ class Orchestrator:
         while len(completed_services) < len(services):
             try:
                 # Wait for next chunk with timeout
-                chunk_json = await asyncio.wait_for(chunk_queue.get(), timeout=1.0)
+                chunk_data = await asyncio.wait_for(chunk_queue.get(), timeout=1.0)
 
-                # Parse to check if service completed
-                chunk_data = json.loads(chunk_json)
+                # Check if service completed
                 if chunk_data.get("done"):
                     completed_services.add(chunk_data["service"])
 
                 # Yield the chunk
-                yield chunk_json
+                yield chunk_data
 
             except asyncio.TimeoutError:
                 # No chunks received in 1 second, check if all tasks are still running
@@ -694,8 +719,8 @@ class Orchestrator:
         # Drain any remaining chunks in queue
         while not chunk_queue.empty():
             try:
-                chunk_json = chunk_queue.get_nowait()
-                yield chunk_json
+                chunk_data = chunk_queue.get_nowait()
+                yield chunk_data
             except asyncio.QueueEmpty:
                 break
 
@@ -725,18 +750,24 @@ class Orchestrator:
         """
         Get status of all services.
 
+        Health checks run concurrently, so latency is bounded by the slowest
+        service rather than the sum of all of them.
+
         Returns:
             Dictionary with service status information
         """
-        status = {}
+        service_names = list(self.adapters)
+        health = await asyncio.gather(
+            *(self._check_service_health(name) for name in service_names)
+        )
 
-        for service_name, adapter in self.adapters.items():
-            is_healthy = await self._check_service_health(service_name)
+        status = {}
 
+        for service_name, is_healthy in zip(service_names, health):
             status[service_name] = {
                 "enabled": True,  # Only enabled adapters are initialized
                 "healthy": is_healthy,
-                "info": adapter.get_service_info()
+                "info": self.adapters[service_name].get_service_info()
             }
 
         return status
@@ -4,9 +4,15 @@ Context Memory System for Oxide
 Manages conversation history and context retrieval for LLM tasks.
 Enables continuity across multiple task executions.
 """
+import heapq
 import json
+import os
+import sys
 import time
-from typing import List, Dict, Any, Optional
+import uuid
+from collections import Counter, OrderedDict
+from itertools import chain
+from typing import List, Dict, Any, FrozenSet, Optional, Set, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -21,9 +27,15 @@ class ContextMemory:
     - Store conversation history
     - Retrieve relevant context for new tasks
     - Automatic context pruning based on time/size
-    - Semantic similarity search (optional)
+    - Keyword similarity search backed by an inverted word index
     """
 
+    # Maximum number of cached search results
+    SEARCH_CACHE_SIZE = 128
+
+    # Journal entries accumulated before they are compacted into the snapshot
+    JOURNAL_COMPACT_THRESHOLD = 500
+
     def __init__(self, storage_path: Optional[Path] = None):
         """
         Initialize context memory.
@@ -39,14 +51,30 @@ class ContextMemory:
         self.storage_path = storage_path
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Append-only log of changes made since the snapshot was last written
+        self.journal_path = self.storage_path.with_name(self.storage_path.name + ".journal")
+        self._journal_entries = 0
+
         # In-memory cache
         self._memory: Dict[str, Any] = {}
+
+        # Search index: word -> conversation ids, and conversation id -> distinct words
+        self._word_index: Dict[str, Set[str]] = {}
+        self._conv_words: Dict[str, Set[str]] = {}
+
+        # Recent search results by (query words, limit, min_similarity), in LRU order.
+        # Cleared whenever the index changes, so entries never go stale.
+        self._search_cache: "OrderedDict[Tuple[FrozenSet[str], int, float], List[Dict[str, Any]]]" = OrderedDict()
+
+        # Last get_statistics() result, cleared together with the search cache
+        self._stats_cache: Optional[Dict[str, Any]] = None
+
         self._load_memory()
 
         self.logger.info(f"Context memory initialized at {self.storage_path}")
 
     def _load_memory(self):
-        """Load memory from disk"""
+        """Load memory from disk (snapshot plus journal)"""
         if self.storage_path.exists():
             try:
                 with open(self.storage_path, 'r') as f:
@@ -55,18 +83,140 @@ class ContextMemory:
             except Exception as e:
                 self.logger.warning(f"Failed to load memory: {e}")
                 self._memory = {}
+            self._replay_journal()
         else:
+            # A journal without its snapshot is stale (the memory file was
+            # removed); start from an empty snapshot so the two stay paired
             self._memory = {}
+            self._save_memory()
+
+        self._rebuild_index()
+
+    def _replay_journal(self):
+        """Apply journal entries written after the snapshot"""
+        self._journal_entries = 0
+        if not self.journal_path.exists():
+            return
+
+        # Conversation id -> ids of messages already loaded, so entries that
+        # also reached the snapshot are not re-added
+        seen: Dict[str, Set[str]] = {}
+
+        try:
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write from an interrupted append
+                        self.logger.warning("Skipping malformed memory journal entry")
+                        continue
+
+                    conv_id = entry["conversation_id"]
+                    if entry["op"] == "add":
+                        message = entry["message"]
+                        conversation = self._memory.get(conv_id)
+                        if conversation is None:
+                            conversation = self._memory[conv_id] = {
+                                "id": conv_id,
+                                "created_at": message["timestamp"],
+                                "updated_at": message["timestamp"],
+                                "messages": [],
+                                "metadata": message["metadata"]
+                            }
+
+                        if conv_id not in seen:
+                            seen[conv_id] = {m["id"] for m in conversation["messages"]}
+                        if message["id"] not in seen[conv_id]:
+                            seen[conv_id].add(message["id"])
+                            conversation["messages"].append(message)
+                            conversation["updated_at"] = message["timestamp"]
+                    elif entry["op"] == "delete":
+                        self._memory.pop(conv_id, None)
+                        seen.pop(conv_id, None)
+
+                    self._journal_entries += 1
+        except Exception as e:
+            self.logger.warning(f"Failed to replay memory journal: {e}")
+
+        self.logger.debug(f"Replayed {self._journal_entries} memory journal entries")
+
+    def _rebuild_index(self):
+        """Rebuild the word index from all stored messages"""
+        self._word_index = {}
+        self._conv_words = {}
+        self._invalidate_caches()
+
+        for conv_id, conversation in self._memory.items():
+            for msg in conversation["messages"]:
+                self._index_message(conv_id, msg["content"])
+
+    def _invalidate_caches(self):
+        """Drop cached search results and statistics after a memory change"""
+        self._search_cache.clear()
+        self._stats_cache = None
+
+    def _index_message(self, conversation_id: str, content: str):
+        """Add the words of a message to the search index"""
+        self._invalidate_caches()
+        conv_words = self._conv_words.setdefault(conversation_id, set())
+
+        for word in set(content.lower().split()) - conv_words:
+            # Interned so every conversation and the index share one copy of each word
+            word = sys.intern(word)
+            conv_words.add(word)
+            self._word_index.setdefault(word, set()).add(conversation_id)
+
+    def _unindex_conversation(self, conversation_id: str):
+        """Remove a conversation from the search index"""
+        self._invalidate_caches()
+        for word in self._conv_words.pop(conversation_id, ()):
+            conv_ids = self._word_index.get(word)
+            if conv_ids is not None:
+                conv_ids.discard(conversation_id)
+                if not conv_ids:
+                    del self._word_index[word]
 
     def _save_memory(self):
-        """Save memory to disk"""
+        """Save a full memory snapshot to disk and reset the journal"""
         try:
-            with open(self.storage_path, 'w') as f:
+            # Write-then-rename so a crash never leaves a truncated snapshot
+            tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
                 json.dump(self._memory, f, indent=2)
+            os.replace(tmp_path, self.storage_path)
+            self.journal_path.unlink(missing_ok=True)
+            self._journal_entries = 0
             self.logger.debug("Memory saved to disk")
         except Exception as e:
             self.logger.error(f"Failed to save memory: {e}")
 
+    def _append_journal(self, *entries: Dict[str, Any]):
+        """
+        Persist changes by appending them to the journal in one write.
+
+        Costs one small append instead of rewriting every conversation;
+        the journal is folded into the snapshot once it reaches
+        JOURNAL_COMPACT_THRESHOLD entries.
+
+        Args:
+            *entries: Journal entries ("add" with a message, or "delete")
+        """
+        if not entries:
+            return
+
+        try:
+            with open(self.journal_path, 'a') as f:
+                f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+        except Exception as e:
+            self.logger.error(f"Failed to append memory journal: {e}")
+            self._save_memory()
+            return
+
+        self._journal_entries += len(entries)
+        if self._journal_entries >= self.JOURNAL_COMPACT_THRESHOLD:
+            self._save_memory()
+
     def add_context(
         self,
         conversation_id: str,
@@ -86,11 +236,53 @@ class ContextMemory:
         Returns:
             Message ID
         """
+        entry = self._add_message(conversation_id, role, content, metadata)
+        self._append_journal(entry)
+
+        self.logger.debug(f"Added message to conversation {conversation_id}")
+        return entry["message"]["id"]
+
+    def add_messages(self, conversation_id: str, messages: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several messages to a conversation with a single disk write.
+
+        Equivalent to calling add_context() per message, but the journal is
+        appended once for the whole batch, which suits bulk imports.
+
+        Args:
+            conversation_id: Unique conversation identifier
+            messages: Messages with "role", "content" and optional "metadata"
+
+        Returns:
+            Message IDs in input order, unique even when the messages
+            share a timestamp
+        """
+        entries = [
+            self._add_message(conversation_id, msg["role"], msg["content"], msg.get("metadata"))
+            for msg in messages
+        ]
+        self._append_journal(*entries)
+
+        self.logger.debug(f"Added {len(entries)} messages to conversation {conversation_id}")
+        return [entry["message"]["id"] for entry in entries]
+
+    def _add_message(
+        self,
+        conversation_id: str,
+        role: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Add a message in memory and index it; returns its journal entry"""
         timestamp = time.time()
-        message_id = f"{conversation_id}_{int(timestamp * 1000)}"
+        # The random suffix keeps ids unique when messages share a timestamp,
+        # which journal replay relies on to skip already-applied entries
+        message_id = f"{conversation_id}_{int(timestamp * 1000)}_{uuid.uuid4().hex}"
 
         # Create conversation if doesn't exist
         if conversation_id not in self._memory:
+            # Drop index entries left behind by a conversation deleted from _memory directly
+            self._unindex_conversation(conversation_id)
             self._memory[conversation_id] = {
                 "id": conversation_id,
                 "created_at": timestamp,
@@ -110,11 +302,9 @@ class ContextMemory:
 
         self._memory[conversation_id]["messages"].append(message)
         self._memory[conversation_id]["updated_at"] = timestamp
+        self._index_message(conversation_id, content)
 
-        self._save_memory()
-
-        self.logger.debug(f"Added message to conversation {conversation_id}")
-        return message_id
+        return {"op": "add", "conversation_id": conversation_id, "message": message}
 
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -128,6 +318,27 @@ class ContextMemory:
         """
         return self._memory.get(conversation_id)
 
+    def list_conversations(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get a page of conversations, most recently updated first.
+
+        Uses a heap to select only the first offset + limit conversations
+        instead of sorting the whole history for every page.
+
+        Args:
+            limit: Maximum number of conversations to return
+            offset: Number of conversations to skip
+
+        Returns:
+            List of conversation dicts
+        """
+        newest = heapq.nlargest(
+            offset + limit,
+            self._memory.values(),
+            key=lambda conv: conv["updated_at"]
+        )
+        return newest[offset:]
+
     def get_recent_context(
         self,
         conversation_id: str,
@@ -168,9 +379,16 @@ class ContextMemory:
         """
         Search for conversations similar to query.
 
-        Note: This is a simple keyword-based search.
+        Note: This is a simple keyword-based search (Jaccard similarity over
+        distinct words). Only conversations sharing at least one word with the
+        query are scored, found through the inverted word index, so the cost
+        grows with the matches rather than with the total stored history.
         For production, consider using vector embeddings (e.g., sentence-transformers).
 
+        Results are cached per normalized query (its distinct lowercase
+        words), so repeated or reordered queries skip scoring until the
+        memory changes.
+
         Args:
             query: Search query
             limit: Maximum results to return
@@ -179,41 +397,76 @@ class ContextMemory:
         Returns:
             List of conversations with similarity scores
         """
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
+        query_words = frozenset(query.lower().split())
+        cache_key = (query_words, limit, min_similarity)
 
-        results = []
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self._search_cache.move_to_end(cache_key)
+            return list(cached)
 
-        for conv_id, conversation in self._memory.items():
-            # Calculate simple keyword overlap similarity
-            conv_text = ""
-            for msg in conversation["messages"]:
-                conv_text += msg["content"].lower() + " "
+        results = self._score_conversations(query_words, limit, min_similarity)
+
+        self._search_cache[cache_key] = results
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
 
-            conv_words = set(conv_text.split())
+        return list(results)
 
-            if not conv_words:
+    def _score_conversations(
+        self,
+        query_words: FrozenSet[str],
+        limit: int,
+        min_similarity: float
+    ) -> List[Dict[str, Any]]:
+        """Score indexed conversations against the query words (uncached)"""
+        # Shared word counts per candidate conversation
+        if min_similarity > 0:
+            # A conversation without shared words scores 0 and cannot qualify.
+            # Counter tallies the posting lists in C.
+            overlaps = Counter(chain.from_iterable(
+                self._word_index.get(word, ()) for word in query_words
+            ))
+        else:
+            overlaps = {
+                conv_id: len(query_words & words)
+                for conv_id, words in self._conv_words.items()
+            }
+
+        query_size = len(query_words)
+        scored = []
+
+        for conv_id, intersection in overlaps.items():
+            conversation = self._memory.get(conv_id)
+            conv_word_count = len(self._conv_words.get(conv_id, ()))
+
+            if conversation is None or not conv_word_count:
                 continue
 
             # Jaccard similarity
-            intersection = len(query_words & conv_words)
-            union = len(query_words | conv_words)
+            union = query_size + conv_word_count - intersection
             similarity = intersection / union if union > 0 else 0
 
             if similarity >= min_similarity:
-                results.append({
-                    "conversation_id": conv_id,
-                    "similarity": similarity,
-                    "created_at": conversation["created_at"],
-                    "updated_at": conversation["updated_at"],
-                    "message_count": len(conversation["messages"]),
-                    "metadata": conversation.get("metadata", {})
-                })
+                scored.append((similarity, conversation["updated_at"], conv_id))
 
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x["similarity"], reverse=True)
+        # Top-k by similarity (descending), most recently updated first on ties;
+        # a heap avoids sorting every match when only `limit` are returned
+        top = heapq.nlargest(limit, scored)
 
-        return results[:limit]
+        results = []
+        for similarity, _, conv_id in top:
+            conversation = self._memory[conv_id]
+            results.append({
+                "conversation_id": conv_id,
+                "similarity": similarity,
+                "created_at": conversation["created_at"],
+                "updated_at": conversation["updated_at"],
+                "message_count": len(conversation["messages"]),
+                "metadata": conversation.get("metadata", {})
+            })
+
+        return results
 
     def get_context_for_task(
         self,
@@ -285,9 +538,11 @@ class ContextMemory:
 
         for conv_id in to_remove:
             del self._memory[conv_id]
+            self._unindex_conversation(conv_id)
+
+        self._append_journal(*({"op": "delete", "conversation_id": conv_id} for conv_id in to_remove))
 
         if to_remove:
-            self._save_memory()
             self.logger.info(f"Pruned {len(to_remove)} old conversations")
 
         return len(to_remove)
@@ -296,27 +551,31 @@ class ContextMemory:
         """
         Get memory statistics.
 
+        Computed in one pass over the conversations and cached until the
+        memory changes.
+
         Returns:
             Statistics dict
         """
+        if self._stats_cache is not None:
+            return dict(self._stats_cache)
+
         total_conversations = len(self._memory)
-        total_messages = sum(
-            len(conv["messages"]) for conv in self._memory.values()
-        )
+        total_messages = 0
+        oldest = None
+        newest = None
 
-        if total_conversations > 0:
-            avg_messages = total_messages / total_conversations
+        for conv in self._memory.values():
+            total_messages += len(conv["messages"])
+            created_at = conv["created_at"]
+            if oldest is None or created_at < oldest:
+                oldest = created_at
+            if newest is None or created_at > newest:
+                newest = created_at
 
-            # Find oldest and newest
-            timestamps = [conv["created_at"] for conv in self._memory.values()]
-            oldest = min(timestamps)
-            newest = max(timestamps)
-        else:
-            avg_messages = 0
-            oldest = None
-            newest = None
+        avg_messages = total_messages / total_conversations if total_conversations > 0 else 0
 
-        return {
+        self._stats_cache = {
             "total_conversations": total_conversations,
             "total_messages": total_messages,
             "average_messages_per_conversation": round(avg_messages, 2),
@@ -324,10 +583,30 @@ class ContextMemory:
             "newest_conversation": datetime.fromtimestamp(newest).isoformat() if newest else None,
             "storage_path": str(self.storage_path)
         }
+        return dict(self._stats_cache)
+
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """
+        Delete a conversation.
+
+        Args:
+            conversation_id: Conversation identifier
+
+        Returns:
+            True if the conversation existed and was removed
+        """
+        if conversation_id not in self._memory:
+            return False
+
+        del self._memory[conversation_id]
+        self._unindex_conversation(conversation_id)
+        self._append_journal({"op": "delete", "conversation_id": conversation_id})
+        return True
 
     def clear_all(self):
         """Clear all memory (use with caution!)"""
         self._memory = {}
+        self._rebuild_index()
         self._save_memory()
         self.logger.warning("All memory cleared")
 
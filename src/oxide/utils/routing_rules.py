@@ -35,6 +35,9 @@ class RoutingRulesManager:
         # Thread lock for file operations
         self._lock = threading.Lock()
 
+        # Incremented on every write so callers can cache derived data
+        self._version = 0
+
         self.logger = logger.getChild("routing_rules")
 
         # Ensure file exists
@@ -59,9 +62,15 @@ class RoutingRulesManager:
             with self._lock:
                 with open(self.storage_path, 'w') as f:
                     json.dump(rules, f, indent=2)
+                self._version += 1
         except Exception as e:
             self.logger.error(f"Failed to write rules: {e}")
 
+    @property
+    def version(self) -> int:
+        """Number of writes made through this manager; changes whenever the rules do."""
+        return self._version
+
     def get_all_rules(self) -> Dict[str, str]:
         """
         Get all routing rules.
@@ -0,0 +1,124 @@
+"""
+Background system metrics sampling.
+
+psutil.cpu_percent() needs a measurement window, so calling it with an
+interval inside a request handler blocks the event loop for that long.
+A single background task samples CPU and memory on a fixed interval and
+handlers read the latest values without blocking.
+"""
+import asyncio
+import time
+from typing import Any, Optional, Tuple
+
+import psutil
+
+from .logging import logger
+
+
+class SystemMetricsSampler:
+    """
+    Periodically samples CPU and memory usage.
+
+    CPU usage is measured with psutil.cpu_percent(interval=None), which
+    reports utilization since the previous call, so the sampling interval
+    doubles as the measurement window.
+
+    Example:
+        sampler = SystemMetricsSampler(interval=1.0)
+        sampler.start()
+
+        # In handlers (never blocks)
+        cpu, memory = sampler.latest()
+    """
+
+    def __init__(self, interval: float = 1.0):
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.cpu_percent: Optional[float] = None
+        self.memory: Optional[Any] = None
+        self.timestamp: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background sampling task is active."""
+        return self._task is not None and not self._task.done()
+
+    def sample(self) -> None:
+        """Take a sample now (non-blocking)."""
+        self.cpu_percent = psutil.cpu_percent(interval=None)
+        self.memory = psutil.virtual_memory()
+        self.timestamp = time.time()
+
+    def latest(self) -> Tuple[float, Any]:
+        """
+        Get the latest CPU percent and memory usage without blocking.
+
+        Returns the background sample while sampling is running; otherwise
+        (or before the first sample) reads psutil directly with
+        non-blocking calls.
+
+        Returns:
+            Tuple of (cpu_percent, virtual_memory)
+        """
+        if self.running and self.memory is not None:
+            return self.cpu_percent, self.memory
+        return psutil.cpu_percent(interval=None), psutil.virtual_memory()
+
+    def start(self) -> None:
+        """Start background sampling on the running event loop."""
+        if self.running:
+            return
+
+        # Prime the CPU counters; the first interval=None call always returns 0.0
+        psutil.cpu_percent(interval=None)
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"System metrics sampler started (interval={self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop background sampling."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Sampling loop."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"Failed to sample system metrics: {e}")
+
+
+# Global sampler instance
+_system_metrics_sampler: Optional[SystemMetricsSampler] = None
+
+
+def get_system_metrics_sampler(interval: float = 1.0) -> SystemMetricsSampler:
+    """
+    Get or create global system metrics sampler.
+
+    Args:
+        interval: Seconds between samples (used on first creation)
+
+    Returns:
+        SystemMetricsSampler instance
+    """
+    global _system_metrics_sampler
+
+    if _system_metrics_sampler is None:
+        _system_metrics_sampler = SystemMetricsSampler(interval=interval)
+
+    return _system_metrics_sampler
@@ -0,0 +1,127 @@
+"""
+Bounded background task queue.
+
+Scheduling every submitted task with its own asyncio task lets bursts
+fan out without limit. Jobs are instead put on a bounded queue drained
+by a fixed pool of long-lived workers, so concurrency and memory stay
+flat and a full queue pushes back on callers.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+from .logging import logger
+
+
+class TaskQueue:
+    """
+    Fixed pool of workers draining a bounded job queue.
+
+    Example:
+        queue = TaskQueue(workers=8, maxsize=1024)
+        queue.start()
+
+        # In handlers (raises asyncio.QueueFull when saturated)
+        queue.submit(run_task, task_id, prompt)
+    """
+
+    def __init__(self, workers: int = 8, maxsize: int = 1024):
+        """
+        Initialize task queue.
+
+        Args:
+            workers: Number of concurrent worker tasks
+            maxsize: Maximum number of pending jobs
+        """
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are active."""
+        return any(not worker.done() for worker in self._workers)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """Start the workers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"Task queue started (workers={self.workers}, maxsize={self.maxsize})")
+
+    async def stop(self) -> None:
+        """Stop the workers, dropping jobs that have not started."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+
+    def submit(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> None:
+        """
+        Queue a coroutine function call for a worker.
+
+        Starts the workers first if they are not running on this loop.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Raises:
+            asyncio.QueueFull: If maxsize jobs are already pending
+        """
+        if not self.running or self._loop is not asyncio.get_running_loop():
+            self.start()
+        self._queue.put_nowait((func, args, kwargs))
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time."""
+        queue = self._queue
+        while True:
+            func, args, kwargs = await queue.get()
+            try:
+                await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Queued task {getattr(func, '__name__', func)} failed: {e}")
+            finally:
+                queue.task_done()
+
+
+# Global task queue instance
+_task_queue: Optional[TaskQueue] = None
+
+
+def get_task_queue(workers: int = 8, maxsize: int = 1024) -> TaskQueue:
+    """
+    Get or create global task queue.
+
+    Args:
+        workers: Number of concurrent worker tasks (used on first creation)
+        maxsize: Maximum number of pending jobs (used on first creation)
+
+    Returns:
+        TaskQueue instance
+    """
+    global _task_queue
+
+    if _task_queue is None:
+        _task_queue = TaskQueue(workers=workers, maxsize=maxsize)
+
+    return _task_queue
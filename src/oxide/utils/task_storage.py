@@ -4,13 +4,17 @@ Shared task storage for Oxide.
 Provides persistent storage for task history that can be accessed by both
 the MCP server and Web backend.
 """
+import heapq
 import json
 import asyncio
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import threading
 
+import orjson
+
 from .logging import logger
 
 
@@ -37,6 +41,9 @@ class TaskStorage:
         # Thread lock for file operations
         self._lock = threading.Lock()
 
+        # Bumped on every write from this process
+        self._version = 0
+
         self.logger = logger.getChild("task_storage")
 
         # Ensure file exists
@@ -61,9 +68,25 @@ class TaskStorage:
             with self._lock:
                 with open(self.storage_path, 'w') as f:
                     json.dump(tasks, f, indent=2)
+                self._version += 1
         except Exception as e:
             self.logger.error(f"Failed to write tasks: {e}")
 
+    @property
+    def version(self) -> str:
+        """
+        Token that changes whenever stored tasks change.
+
+        Combines the in-process write counter with the file's mtime and
+        size, so writes from other processes (e.g. the MCP server) are
+        noticed too. Costs one stat() instead of reading the file.
+        """
+        try:
+            stat = self.storage_path.stat()
+        except OSError:
+            return str(self._version)
+        return f"{self._version}-{stat.st_mtime_ns}-{stat.st_size}"
+
     def add_task(
         self,
         task_id: str,
@@ -91,7 +114,58 @@ class TaskStorage:
         """
         tasks = self._read_tasks()
 
-        task_record = {
+        task_record = self._new_task_record(
+            task_id, prompt, files, preferences, service, task_type, execution_mode
+        )
+
+        tasks[task_id] = task_record
+        self._write_tasks(tasks)
+
+        self.logger.debug(f"Added task: {task_id} (mode: {execution_mode})")
+        return task_record
+
+    def add_tasks_bulk(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add several tasks with a single write.
+
+        Args:
+            specs: One dict per task holding add_task arguments, plus
+                optional status, result and error applied as update_task would
+
+        Returns:
+            Created task records
+        """
+        tasks = self._read_tasks()
+        records = []
+
+        for spec in specs:
+            spec = dict(spec)
+            status = spec.pop("status", None)
+            result = spec.pop("result", None)
+            error = spec.pop("error", None)
+
+            task_record = self._new_task_record(**spec)
+            self._apply_update(task_record, status, result, error, {})
+            tasks[task_record["id"]] = task_record
+            records.append(task_record)
+
+        self._write_tasks(tasks)
+
+        self.logger.debug(f"Added {len(records)} tasks")
+        return records
+
+    @staticmethod
+    def _new_task_record(
+        task_id: str,
+        prompt: str,
+        files: Optional[List[str]] = None,
+        preferences: Optional[Dict[str, Any]] = None,
+        service: Optional[str] = None,
+        task_type: Optional[str] = None,
+        execution_mode: str = "single"
+    ) -> Dict[str, Any]:
+        """Build a queued task record."""
+        return {
             "id": task_id,
             "status": "queued",
             "prompt": prompt,
@@ -109,12 +183,6 @@ class TaskStorage:
             "duration": None
         }
 
-        tasks[task_id] = task_record
-        self._write_tasks(tasks)
-
-        self.logger.debug(f"Added task: {task_id} (mode: {execution_mode})")
-        return task_record
-
     def update_task(
         self,
         task_id: str,
@@ -122,7 +190,7 @@ class TaskStorage:
         result: Optional[str] = None,
         error: Optional[str] = None,
         **kwargs
-    ):
+    ) -> Optional[Dict[str, Any]]:
         """
         Update task fields.
 
@@ -132,41 +200,54 @@ class TaskStorage:
             result: Task result
             error: Error message if failed
             **kwargs: Additional fields to update
+
+        Returns:
+            Updated task record, or None if the task does not exist
         """
         tasks = self._read_tasks()
 
         if task_id not in tasks:
             self.logger.warning(f"Task not found: {task_id}")
-            return
+            return None
+
+        self._apply_update(tasks[task_id], status, result, error, kwargs)
 
-        # Update fields
+        self._write_tasks(tasks)
+        self.logger.debug(f"Updated task: {task_id} (status: {status})")
+        return tasks[task_id]
+
+    @staticmethod
+    def _apply_update(
+        task: Dict[str, Any],
+        status: Optional[str],
+        result: Optional[str],
+        error: Optional[str],
+        fields: Dict[str, Any]
+    ):
+        """Apply update_task changes to a task record in place."""
         if status:
-            tasks[task_id]["status"] = status
+            task["status"] = status
 
             # Auto-set timestamps based on status
-            if status == "running" and not tasks[task_id].get("started_at"):
-                tasks[task_id]["started_at"] = datetime.now().timestamp()
+            if status == "running" and not task.get("started_at"):
+                task["started_at"] = datetime.now().timestamp()
             elif status in ("completed", "failed"):
-                if not tasks[task_id].get("completed_at"):
-                    tasks[task_id]["completed_at"] = datetime.now().timestamp()
+                if not task.get("completed_at"):
+                    task["completed_at"] = datetime.now().timestamp()
 
                 # Calculate duration if not set
-                if tasks[task_id].get("started_at") and not tasks[task_id].get("duration"):
-                    duration = tasks[task_id]["completed_at"] - tasks[task_id]["started_at"]
-                    tasks[task_id]["duration"] = duration
+                if task.get("started_at") and not task.get("duration"):
+                    task["duration"] = task["completed_at"] - task["started_at"]
 
         if result is not None:
-            tasks[task_id]["result"] = result
+            task["result"] = result
 
         if error is not None:
-            tasks[task_id]["error"] = error
+            task["error"] = error
 
         # Update additional fields
-        for key, value in kwargs.items():
-            tasks[task_id][key] = value
-
-        self._write_tasks(tasks)
-        self.logger.debug(f"Updated task: {task_id} (status: {status})")
+        for key, value in fields.items():
+            task[key] = value
 
     def add_broadcast_result(
         self,
@@ -253,6 +334,30 @@ class TaskStorage:
         # Limit results
         return tasks[:limit]
 
+    def list_and_count(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List tasks like list_tasks() and count all stored tasks in one read.
+
+        Args:
+            status: Filter by status
+            limit: Maximum number of tasks to return
+
+        Returns:
+            Tuple of (task records newest first, total number of tasks)
+        """
+        tasks = self._read_tasks().values()
+        if status:
+            matching = (t for t in tasks if t.get("status") == status)
+        else:
+            matching = tasks
+
+        page = heapq.nlargest(limit, matching, key=lambda t: t.get("created_at", 0))
+        return page, len(tasks)
+
     def delete_task(self, task_id: str) -> bool:
         """
         Delete a task from storage.
@@ -329,6 +434,79 @@ class TaskStorage:
 
         return stats
 
+    def get_aggregate_stats(self, limit: int = 1000) -> Dict[str, Any]:
+        """
+        Get execution statistics for the most recent tasks in one pass.
+
+        Args:
+            limit: Number of most recent tasks to aggregate
+
+        Returns:
+            Dictionary with total, by_status counts and the average duration
+            of completed tasks
+        """
+        tasks = heapq.nlargest(
+            limit,
+            self._read_tasks().values(),
+            key=lambda t: t.get("created_at", 0)
+        )
+
+        by_status: Counter = Counter()
+        duration_sum = 0.0
+        duration_count = 0
+
+        for task in tasks:
+            status = task["status"]
+            by_status[status] += 1
+
+            if status == "completed" and task.get("duration"):
+                duration_sum += task["duration"]
+                duration_count += 1
+
+        return {
+            "total": len(tasks),
+            "by_status": dict(by_status),
+            "avg_duration": duration_sum / duration_count if duration_count else 0
+        }
+
+
+class MemoryTaskStorage(TaskStorage):
+    """
+    TaskStorage that keeps tasks in memory instead of a JSON file.
+
+    Same behaviour as TaskStorage within one instance, but nothing is
+    persisted or shared across processes. Meant for tests that do not
+    inspect the storage file.
+    """
+
+    def __init__(self):
+        """Initialize empty in-memory storage."""
+        self.storage_path = None
+        self._lock = threading.Lock()
+        self._version = 0
+        # Encoded like the file, so records handed out never alias stored state
+        self._data = b"{}"
+        self.logger = logger.getChild("task_storage")
+
+    def _read_tasks(self) -> Dict[str, Dict[str, Any]]:
+        """Decode the stored tasks, as a file read would."""
+        with self._lock:
+            return orjson.loads(self._data)
+
+    def _write_tasks(self, tasks: Dict[str, Dict[str, Any]]):
+        """Encode and store the tasks."""
+        try:
+            with self._lock:
+                self._data = orjson.dumps(tasks)
+                self._version += 1
+        except Exception as e:
+            self.logger.error(f"Failed to write tasks: {e}")
+
+    @property
+    def version(self) -> str:
+        """Token that changes whenever stored tasks change."""
+        return str(self._version)
+
 
 # Global singleton instance
 _task_storage: Optional[TaskStorage] = None
@@ -8,10 +8,11 @@ High-performance replacement for JSON file storage with:
 - ACID transactions
 - No additional dependencies
 """
+import itertools
 import sqlite3
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import threading
 from contextlib import contextmanager
@@ -27,6 +28,20 @@ class TaskStorageSQLite:
     better performance and concurrency.
     """
 
+    # Shared by add_task and add_tasks_bulk
+    _INSERT_TASK = """
+        INSERT INTO tasks (
+            id, status, prompt, files, preferences,
+            service, task_type, result, error,
+            created_at, started_at, completed_at, duration
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # UPDATE ... RETURNING needs SQLite 3.35+; older system libraries
+    # fall back to UPDATE followed by SELECT on the same connection
+    _USE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
     def __init__(self, storage_path: Optional[Path] = None):
         """
         Initialize SQLite task storage.
@@ -43,6 +58,10 @@ class TaskStorageSQLite:
         # Thread-local connections for thread safety
         self._local = threading.local()
 
+        # Bumped after every committed write from this process
+        self._versions = itertools.count(1)
+        self._version = 0
+
         self.logger = logger.getChild("task_storage_sqlite")
 
         # Initialize database schema
@@ -64,13 +83,29 @@ class TaskStorageSQLite:
             # Return dicts instead of tuples
             self._local.conn.row_factory = sqlite3.Row
 
+        conn = self._local.conn
+        changes = conn.total_changes
         try:
-            yield self._local.conn
+            yield conn
         except Exception as e:
-            self._local.conn.rollback()
+            conn.rollback()
             raise
         else:
-            self._local.conn.commit()
+            conn.commit()
+            if conn.total_changes != changes:
+                self._version = next(self._versions)
+
+    @property
+    def version(self) -> str:
+        """
+        Token that changes whenever stored tasks change.
+
+        Combines the in-process write counter with SQLite's data_version,
+        which changes when another connection (e.g. the MCP server) commits.
+        """
+        with self._get_connection() as conn:
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return f"{self._version}-{data_version}"
 
     def _init_schema(self):
         """Initialize database schema with indexes."""
@@ -133,9 +168,64 @@ class TaskStorageSQLite:
         Returns:
             Created task record
         """
-        created_at = datetime.now().timestamp()
+        task_record = self._new_task_record(task_id, prompt, files, preferences, service, task_type)
+
+        with self._get_connection() as conn:
+            conn.execute(self._INSERT_TASK, self._insert_params(task_record))
+
+        self.logger.debug(f"Added task: {task_id}")
+        return task_record
+
+    def add_tasks_bulk(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add several tasks in a single transaction.
+
+        Args:
+            specs: One dict per task holding add_task arguments, plus
+                optional status, result and error applied as update_task would
+
+        Returns:
+            Created task records
+        """
+        records = []
+
+        for spec in specs:
+            spec = dict(spec)
+            status = spec.pop("status", None)
+            result = spec.pop("result", None)
+            error = spec.pop("error", None)
+
+            task_record = self._new_task_record(**spec)
+            if status:
+                task_record["status"] = status
+                # New rows have no started_at, so no duration either
+                if status == "running":
+                    task_record["started_at"] = task_record["created_at"]
+                elif status in ("completed", "failed"):
+                    task_record["completed_at"] = task_record["created_at"]
+            if result is not None:
+                task_record["result"] = result
+            if error is not None:
+                task_record["error"] = error
+            records.append(task_record)
 
-        task_record = {
+        with self._get_connection() as conn:
+            conn.executemany(self._INSERT_TASK, map(self._insert_params, records))
+
+        self.logger.debug(f"Added {len(records)} tasks")
+        return records
+
+    @staticmethod
+    def _new_task_record(
+        task_id: str,
+        prompt: str,
+        files: Optional[List[str]] = None,
+        preferences: Optional[Dict[str, Any]] = None,
+        service: Optional[str] = None,
+        task_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a queued task record."""
+        return {
             "id": task_id,
             "status": "queued",
             "prompt": prompt,
@@ -145,38 +235,30 @@ class TaskStorageSQLite:
             "task_type": task_type,
             "result": None,
             "error": None,
-            "created_at": created_at,
+            "created_at": datetime.now().timestamp(),
             "started_at": None,
             "completed_at": None,
             "duration": None
         }
 
-        with self._get_connection() as conn:
-            conn.execute("""
-                INSERT INTO tasks (
-                    id, status, prompt, files, preferences,
-                    service, task_type, result, error,
-                    created_at, started_at, completed_at, duration
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task_id,
-                "queued",
-                prompt,
-                json.dumps(files or []),
-                json.dumps(preferences or {}),
-                service,
-                task_type,
-                None,
-                None,
-                created_at,
-                None,
-                None,
-                None
-            ))
-
-        self.logger.debug(f"Added task: {task_id}")
-        return task_record
+    @staticmethod
+    def _insert_params(task: Dict[str, Any]) -> tuple:
+        """Map a task record to _INSERT_TASK parameters."""
+        return (
+            task["id"],
+            task["status"],
+            task["prompt"],
+            json.dumps(task["files"]),
+            json.dumps(task["preferences"]),
+            task["service"],
+            task["task_type"],
+            task["result"],
+            task["error"],
+            task["created_at"],
+            task["started_at"],
+            task["completed_at"],
+            task["duration"]
+        )
 
     def update_task(
         self,
@@ -185,78 +267,82 @@ class TaskStorageSQLite:
         result: Optional[str] = None,
         error: Optional[str] = None,
         **kwargs
-    ):
+    ) -> Optional[Dict[str, Any]]:
         """
         Update task fields.
 
+        Timestamps are derived from the stored row inside the UPDATE itself,
+        so each call is a single UPDATE ... RETURNING statement (UPDATE then
+        SELECT on SQLite older than 3.35).
+
         Args:
             task_id: Task identifier
             status: New status (queued, running, completed, failed)
             result: Task result
             error: Error message if failed
             **kwargs: Additional fields to update
+
+        Returns:
+            Updated task record, or None if the task does not exist
         """
-        with self._get_connection() as conn:
-            # Get current task to check timestamps
-            row = conn.execute(
-                "SELECT started_at, completed_at FROM tasks WHERE id = ?",
-                (task_id,)
-            ).fetchone()
+        # Build update query dynamically
+        updates = []
+        params = []
 
-            if not row:
-                self.logger.warning(f"Task not found: {task_id}")
-                return
+        if status:
+            updates.append("status = ?")
+            params.append(status)
 
-            # Build update query dynamically
-            updates = []
-            params = []
+            # Auto-set timestamps based on status
+            if status == "running":
+                updates.append("started_at = COALESCE(started_at, ?)")
+                params.append(datetime.now().timestamp())
 
-            if status:
-                updates.append("status = ?")
-                params.append(status)
+            elif status in ("completed", "failed"):
+                now = datetime.now().timestamp()
 
-                # Auto-set timestamps based on status
-                if status == "running" and row["started_at"] is None:
-                    updates.append("started_at = ?")
-                    params.append(datetime.now().timestamp())
+                updates.append("completed_at = COALESCE(completed_at, ?)")
+                params.append(now)
 
-                elif status in ("completed", "failed"):
-                    now = datetime.now().timestamp()
-
-                    if row["completed_at"] is None:
-                        updates.append("completed_at = ?")
-                        params.append(now)
+                # Calculate duration if we have started_at
+                updates.append("duration = CASE WHEN started_at IS NULL THEN duration ELSE ? - started_at END")
+                params.append(now)
 
-                    # Calculate duration if we have started_at
-                    if row["started_at"] is not None:
-                        duration = now - row["started_at"]
-                        updates.append("duration = ?")
-                        params.append(duration)
+        if result is not None:
+            updates.append("result = ?")
+            params.append(result)
 
-            if result is not None:
-                updates.append("result = ?")
-                params.append(result)
+        if error is not None:
+            updates.append("error = ?")
+            params.append(error)
 
-            if error is not None:
-                updates.append("error = ?")
-                params.append(error)
+        # Handle additional kwargs
+        for key, value in kwargs.items():
+            if key in ("service", "task_type"):
+                updates.append(f"{key} = ?")
+                params.append(value)
 
-            # Handle additional kwargs
-            for key, value in kwargs.items():
-                if key in ("service", "task_type"):
-                    updates.append(f"{key} = ?")
-                    params.append(value)
+        if not updates:
+            return self.get_task(task_id)
 
-            if not updates:
-                return
+        # Execute update
+        params.append(task_id)
+        query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
 
-            # Execute update
-            params.append(task_id)
-            query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
+        with self._get_connection() as conn:
+            if self._USE_RETURNING:
+                row = conn.execute(f"{query} RETURNING *", params).fetchone()
+            elif conn.execute(query, params).rowcount:
+                row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            else:
+                row = None
 
-            conn.execute(query, params)
+        if not row:
+            self.logger.warning(f"Task not found: {task_id}")
+            return None
 
         self.logger.debug(f"Updated task: {task_id} (status: {status})")
+        return self._row_to_dict(row)
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific task by ID."""
@@ -303,6 +389,43 @@ class TaskStorageSQLite:
 
             return [self._row_to_dict(row) for row in rows]
 
+    def list_and_count(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List tasks like list_tasks() and count all stored tasks.
+
+        Both queries run on one connection and transaction, so the count
+        matches the page.
+
+        Args:
+            status: Filter by status
+            limit: Maximum number of tasks to return
+
+        Returns:
+            Tuple of (task records newest first, total number of tasks)
+        """
+        with self._get_connection() as conn:
+            if status:
+                rows = conn.execute("""
+                    SELECT * FROM tasks
+                    WHERE status = ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """, (status, limit)).fetchall()
+            else:
+                rows = conn.execute("""
+                    SELECT * FROM tasks
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """, (limit,)).fetchall()
+
+            total = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+        return [self._row_to_dict(row) for row in rows], total
+
     def delete_task(self, task_id: str) -> bool:
         """
         Delete a task from storage.
@@ -386,6 +509,40 @@ class TaskStorageSQLite:
 
         return stats
 
+    def get_aggregate_stats(self, limit: int = 1000) -> Dict[str, Any]:
+        """
+        Get execution statistics for the most recent tasks in one query.
+
+        Args:
+            limit: Number of most recent tasks to aggregate
+
+        Returns:
+            Dictionary with total, by_status counts and the average duration
+            of completed tasks
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT status,
+                       COUNT(*) AS count,
+                       SUM(CASE WHEN status = 'completed' AND duration != 0 THEN duration END) AS duration_sum,
+                       COUNT(CASE WHEN status = 'completed' AND duration != 0 THEN 1 END) AS duration_count
+                FROM (
+                    SELECT status, duration FROM tasks
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                )
+                GROUP BY status
+            """, (limit,)).fetchall()
+
+        duration_sum = sum(row["duration_sum"] or 0.0 for row in rows)
+        duration_count = sum(row["duration_count"] for row in rows)
+
+        return {
+            "total": sum(row["count"] for row in rows),
+            "by_status": {row["status"]: row["count"] for row in rows},
+            "avg_duration": duration_sum / duration_count if duration_count else 0
+        }
+
     def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
         """Convert SQLite row to task dictionary."""
         return {
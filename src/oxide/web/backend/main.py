@@ -10,6 +10,7 @@ from typing import Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import _rate_limit_exceeded_handler
@@ -20,6 +21,8 @@ from ...config.loader import load_config
 from ...config.hot_reload import init_hot_reload, get_hot_reload_manager
 from ...utils.logging import logger, setup_logging
 from ...utils.metrics_cache import get_metrics_cache
+from ...utils.system_metrics import get_system_metrics_sampler
+from ...utils.task_queue import get_task_queue
 from ...cluster import init_cluster_coordinator, get_cluster_coordinator
 from .routes import services, tasks, monitoring, routing, machines, memory, cluster, costs, config, auth, api_keys
 from .auth import initialize_default_user
@@ -35,6 +38,8 @@ class AppState:
         self.orchestrator: Optional[Orchestrator] = None
         self.ws_manager: Optional[WebSocketManager] = None
         self.metrics_cache = get_metrics_cache(ttl=2.0)
+        self.system_metrics = get_system_metrics_sampler(interval=1.0)
+        self.task_queue = None
         self.hot_reload_manager = None
         self.cluster_coordinator = None
 
@@ -48,8 +53,6 @@ async def broadcast_periodic_updates(state: AppState):
     Args:
         state: Application state container
     """
-    import psutil
-
     while True:
         try:
             # Only broadcast if there are connected clients
@@ -60,19 +63,8 @@ async def broadcast_periodic_updates(state: AppState):
                 # Get cached or compute metrics asynchronously
                 metrics_cache = state.metrics_cache
 
-                # CPU monitoring (blocking call - run in executor with cache)
-                cpu_percent = await metrics_cache.get_or_compute_async(
-                    "cpu_percent",
-                    lambda: psutil.cpu_percent(interval=0.1),
-                    use_executor=True
-                )
-
-                # Memory monitoring (fast, but cache anyway)
-                memory = await metrics_cache.get_or_compute_async(
-                    "memory",
-                    lambda: psutil.virtual_memory(),
-                    use_executor=False
-                )
+                # CPU and memory from the background sampler (never blocks)
+                cpu_percent, memory = state.system_metrics.latest()
 
                 # Service status (async, cache to reduce load)
                 service_status = await metrics_cache.get_or_compute_async(
@@ -91,8 +83,12 @@ async def broadcast_periodic_updates(state: AppState):
 
                 # Count services
                 total_services = len(service_status)
-                enabled_services = sum(1 for s in service_status.values() if s.get("enabled"))
-                healthy_services = sum(1 for s in service_status.values() if s.get("healthy"))
+                enabled_services = healthy_services = 0
+                for status in service_status.values():
+                    if status.get("enabled"):
+                        enabled_services += 1
+                    if status.get("healthy"):
+                        healthy_services += 1
 
                 # Task stats
                 total_tasks = stats["total"]
@@ -201,6 +197,16 @@ async def lifespan(app: FastAPI):
     # Store state in app for dependency injection
     app.state.oxide = state
 
+    # Start background CPU/memory sampling (keeps psutil off the request path)
+    state.system_metrics.start()
+
+    # Start the worker pool that runs submitted tasks
+    state.task_queue = get_task_queue(
+        workers=cfg.execution.task_workers,
+        maxsize=cfg.execution.task_queue_size
+    )
+    state.task_queue.start()
+
     # Start background task for periodic WebSocket broadcasts
     broadcast_task = asyncio.create_task(broadcast_periodic_updates(state))
     logger.info("Started periodic WebSocket broadcast task")
@@ -235,6 +241,12 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         logger.info("Periodic broadcast task stopped")
 
+    # Stop system metrics sampler
+    await state.system_metrics.stop()
+
+    # Stop task workers
+    await state.task_queue.stop()
+
     # Stop hot reload manager
     if state.hot_reload_manager:
         state.hot_reload_manager.stop()
@@ -393,6 +405,9 @@ app.add_middleware(
     max_age=600,  # Cache preflight requests for 10 minutes
 )
 
+# Compress larger responses (conversation and rules listings are text-heavy JSON)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Optional authentication middleware (enabled via OXIDE_AUTH_ENABLED=true)
 @app.middleware("http")
 async def auth_middleware(request: Request, call_next):
@@ -613,7 +628,10 @@ def main():
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # "auto" runs on uvloop when it is installed (oxide[performance])
+        # and falls back to the stdlib asyncio loop otherwise.
+        loop="auto"
     )
 
 
@@ -0,0 +1,20 @@
+"""
+Response classes shared by the web backend routes.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Used by frequently polled endpoints that return plain dicts, where
+    orjson is several times faster than the stdlib json encoder. FastAPI's
+    own ORJSONResponse is deprecated in recent releases, hence this class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
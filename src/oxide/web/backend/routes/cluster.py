@@ -6,9 +6,12 @@ Provides REST API for cluster operations:
 - List nodes
 - Execute distributed tasks
 """
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List, Dict, Any, Iterator
+
+import orjson
 
 from ....cluster import get_cluster_coordinator
 from ....utils.logging import get_logger
@@ -20,6 +23,9 @@ router = APIRouter(prefix="/api/cluster", tags=["cluster"])
 # Request/Response models
 class TaskExecuteRequest(BaseModel):
     """Request to execute a distributed task"""
+    # Forwarded as-is to the target node: never mutated, unknown fields dropped
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     prompt: str
     files: Optional[List[str]] = None
     preferences: Optional[Dict[str, Any]] = None
@@ -55,7 +61,7 @@ async def get_status():
             healthy_nodes=0
         )
 
-    status = coordinator.get_cluster_status()
+    status = coordinator.get_status_snapshot()
 
     return ClusterStatus(
         enabled=True,
@@ -82,7 +88,7 @@ async def list_nodes():
             "message": "Cluster coordination not enabled"
         }
 
-    status = coordinator.get_cluster_status()
+    status = coordinator.get_status_snapshot()
 
     return {
         "local_node": status["local_node"],
@@ -166,13 +172,13 @@ async def execute_distributed_task(request: TaskExecuteRequest):
             )
 
             return {
-                "status": "completed" if "error" not in result else "failed",
+                "status": "completed" if result.ok else "failed",
                 "node": {
                     "id": target_node.node_id,
                     "hostname": target_node.hostname,
                     "local": False
                 },
-                "result": result
+                "result": result.payload
             }
 
     except HTTPException:
@@ -245,15 +251,19 @@ async def cluster_health():
 
 
 @router.post("/nodes/{node_id}/enable")
-async def enable_node(node_id: str):
+async def enable_node(
+    node_id: str,
+    no_content: bool = Query(False, description="Return 204 No Content instead of a JSON body")
+):
     """
     Enable a discovered node.
 
     Args:
         node_id: Node identifier
+        no_content: Return an empty 204 response instead of a status message
 
     Returns:
-        Success message or error
+        Success message, or 204 No Content when no_content is set
     """
     coordinator = get_cluster_coordinator()
 
@@ -271,6 +281,9 @@ async def enable_node(node_id: str):
             detail=f"Node '{node_id}' not found"
         )
 
+    if no_content:
+        return Response(status_code=204)
+
     return {
         "status": "success",
         "node_id": node_id,
@@ -280,15 +293,19 @@ async def enable_node(node_id: str):
 
 
 @router.post("/nodes/{node_id}/disable")
-async def disable_node(node_id: str):
+async def disable_node(
+    node_id: str,
+    no_content: bool = Query(False, description="Return 204 No Content instead of a JSON body")
+):
     """
     Disable a discovered node.
 
     Args:
         node_id: Node identifier
+        no_content: Return an empty 204 response instead of a status message
 
     Returns:
-        Success message or error
+        Success message, or 204 No Content when no_content is set
     """
     coordinator = get_cluster_coordinator()
 
@@ -306,6 +323,9 @@ async def disable_node(node_id: str):
             detail=f"Node '{node_id}' not found"
         )
 
+    if no_content:
+        return Response(status_code=204)
+
     return {
         "status": "success",
         "node_id": node_id,
@@ -369,11 +389,25 @@ async def get_services_matrix():
             if node.enabled:
                 matrix[service_name]["enabled_nodes"] += 1
 
-    return {
-        "services": matrix,
-        "total_nodes": len(all_nodes),
-        "total_services": len(matrix)
-    }
+    return StreamingResponse(
+        _iter_services_matrix(matrix, total_nodes=len(all_nodes)),
+        media_type="application/json"
+    )
+
+
+def _iter_services_matrix(matrix: Dict[str, Dict[str, Any]], total_nodes: int) -> Iterator[bytes]:
+    """
+    Encode the services matrix as JSON one service entry at a time.
+
+    Yields:
+        Chunks of {"services": {...}, "total_nodes": N, "total_services": M}
+    """
+    yield b'{"services":{'
+    separator = b""
+    for service_name, entry in matrix.items():
+        yield separator + orjson.dumps(service_name) + b":" + orjson.dumps(entry)
+        separator = b","
+    yield b'},"total_nodes":%d,"total_services":%d}' % (total_nodes, len(matrix))
 
 
 @router.post("/nodes/{node_id}/ping")
@@ -3,17 +3,123 @@ Configuration Management API Endpoints
 
 Provides REST API for viewing, validating, and reloading configuration.
 """
+import asyncio
+from pathlib import Path
+
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, TypeAdapter
+from typing import Optional, Dict, Any, List, Tuple
 
-from ....config.loader import load_config, Config, ConfigError, save_config
+from ....config.loader import (
+    load_config, Config, ConfigError, RoutingRuleConfig, ServiceConfig, save_config
+)
 from ....config.hot_reload import get_hot_reload_manager
 from ....utils.logging import get_logger
+from ..responses import OrjsonResponse
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/config", tags=["config"])
 
+# Config file written by the PATCH endpoints (project root / config / default.yaml)
+_CONFIG_PATH = Path(__file__).parents[5] / "config" / "default.yaml"
+
+# Serialized forms of the last config served: (config object, reload count,
+# dumps keyed by section name, with _FULL_DUMP for the whole config)
+_dump_cache: Optional[Tuple[Config, int, Dict[str, Any]]] = None
+_FULL_DUMP = "*"
+
+# Serializers for the sections that are served on their own
+_SECTION_ADAPTERS: Dict[str, TypeAdapter] = {
+    "services": TypeAdapter(Dict[str, ServiceConfig]),
+    "routing_rules": TypeAdapter(Dict[str, RoutingRuleConfig]),
+}
+
+
+def _cached_dumps(config: Config, manager=None) -> Dict[str, Any]:
+    """
+    Get the dump cache entry for a config, starting a fresh one on a miss.
+
+    The cache is keyed on the config object itself (not just its id) and the
+    hot reload count, so a reload or a freshly loaded config always misses.
+
+    Args:
+        config: Configuration being served
+        manager: Hot reload manager, if enabled
+
+    Returns:
+        Mutable dict of dumps for this config
+    """
+    global _dump_cache
+    reload_count = manager.reload_count if manager else 0
+
+    cached = _dump_cache
+    if cached is not None and cached[0] is config and cached[1] == reload_count:
+        return cached[2]
+
+    _dump_cache = (config, reload_count, {})
+    return _dump_cache[2]
+
+
+def _dump(config: Config, manager=None) -> Dict[str, Any]:
+    """
+    Serialize configuration, reusing the previous dump for the same config.
+
+    Args:
+        config: Configuration to serialize
+        manager: Hot reload manager, if enabled
+
+    Returns:
+        Configuration dict (None values excluded). Enum fields are left as
+        enum members; the response encoder serializes them directly.
+    """
+    dumps = _cached_dumps(config, manager)
+
+    if _FULL_DUMP not in dumps:
+        dumps[_FULL_DUMP] = config.model_dump(exclude_none=True)
+    return dumps[_FULL_DUMP]
+
+
+def _dump_section(config: Config, section: str, manager=None) -> Dict[str, Any]:
+    """
+    Serialize a single config section without dumping the whole tree.
+
+    Args:
+        config: Configuration to serialize
+        section: Section name (a key of _SECTION_ADAPTERS)
+        manager: Hot reload manager, if enabled
+
+    Returns:
+        Section dict (None values excluded, enum members kept)
+    """
+    dumps = _cached_dumps(config, manager)
+
+    if section not in dumps:
+        if _FULL_DUMP in dumps:
+            dumps[section] = dumps[_FULL_DUMP][section]
+        else:
+            dumps[section] = _SECTION_ADAPTERS[section].dump_python(
+                getattr(config, section), exclude_none=True
+            )
+    return dumps[section]
+
+
+def _save_and_reload(config: Config, manager) -> None:
+    """
+    Write an edited config to disk and reload it (blocking file I/O).
+
+    Args:
+        config: Edited configuration
+        manager: Hot reload manager
+    """
+    save_config(config, _CONFIG_PATH)
+    manager.reload()
+
+
+def _invalidate_dump_cache() -> None:
+    """Drop the cached config dump (after reloads or in-place edits)."""
+    global _dump_cache
+    _dump_cache = None
+
 
 # Request/Response models
 class ConfigResponse(BaseModel):
@@ -58,7 +164,7 @@ class RoutingRulePatchRequest(BaseModel):
 
 # API Endpoints
 
-@router.get("/", response_model=ConfigResponse)
+@router.get("/", response_model=None, response_class=OrjsonResponse, responses={200: {"model": ConfigResponse}})
 async def get_configuration():
     """
     Get current configuration.
@@ -75,17 +181,20 @@ async def get_configuration():
             # Fallback to loading from file
             config = load_config()
 
-        # Convert to dict
-        config_dict = config.model_dump(mode="json", exclude_none=True)
+        # Convert to dict (already validated, and orjson handles the enum
+        # members, so no ConfigResponse round-trip or jsonable_encoder pass)
+        config_dict = _dump(config, manager)
 
-        return ConfigResponse(**config_dict)
+        return OrjsonResponse(content={
+            field: config_dict.get(field) for field in ConfigResponse.model_fields
+        })
 
     except Exception as e:
         logger.error(f"Failed to get configuration: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/services")
+@router.get("/services", response_class=OrjsonResponse)
 async def get_services_config():
     """
     Get services configuration.
@@ -96,16 +205,16 @@ async def get_services_config():
         manager = get_hot_reload_manager()
         config = manager.current_config if manager else load_config()
 
-        return {
-            "services": config.model_dump(mode="json")["services"]
-        }
+        return OrjsonResponse(content={
+            "services": _dump_section(config, "services", manager)
+        })
 
     except Exception as e:
         logger.error(f"Failed to get services config: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/services/{service_name}")
+@router.get("/services/{service_name}", response_class=OrjsonResponse)
 async def get_service_config(service_name: str):
     """
     Get configuration for a specific service.
@@ -126,12 +235,10 @@ async def get_service_config(service_name: str):
                 detail=f"Service '{service_name}' not found"
             )
 
-        service_config = config.services[service_name]
-
-        return {
+        return OrjsonResponse(content={
             "service_name": service_name,
-            "config": service_config.model_dump(mode="json")
-        }
+            "config": _dump_section(config, "services", manager)[service_name]
+        })
 
     except HTTPException:
         raise
@@ -140,7 +247,7 @@ async def get_service_config(service_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/routing-rules")
+@router.get("/routing-rules", response_class=OrjsonResponse)
 async def get_routing_rules():
     """
     Get routing rules configuration.
@@ -151,16 +258,16 @@ async def get_routing_rules():
         manager = get_hot_reload_manager()
         config = manager.current_config if manager else load_config()
 
-        return {
-            "routing_rules": config.model_dump(mode="json")["routing_rules"]
-        }
+        return OrjsonResponse(content={
+            "routing_rules": _dump_section(config, "routing_rules", manager)
+        })
 
     except Exception as e:
         logger.error(f"Failed to get routing rules: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/routing-rules/{task_type}")
+@router.get("/routing-rules/{task_type}", response_class=OrjsonResponse)
 async def get_routing_rule(task_type: str):
     """
     Get routing rule for a specific task type.
@@ -181,12 +288,10 @@ async def get_routing_rule(task_type: str):
                 detail=f"Routing rule for '{task_type}' not found"
             )
 
-        rule = config.routing_rules[task_type]
-
-        return {
+        return OrjsonResponse(content={
             "task_type": task_type,
-            "rule": rule.model_dump(mode="json")
-        }
+            "rule": _dump_section(config, "routing_rules", manager)[task_type]
+        })
 
     except HTTPException:
         raise
@@ -213,28 +318,27 @@ async def validate_configuration(config_data: Dict[str, Any]):
         # Try to parse configuration
         config = Config(**config_data)
 
-        # Additional validation checks
-        enabled_services = config.get_enabled_services()
+        # Additional validation checks. Disabled services are collected in one
+        # pass; the routing rule checks below are then plain set lookups.
+        disabled = frozenset(
+            name for name, service in config.services.items() if not service.enabled
+        )
 
-        if len(enabled_services) == 0:
+        if len(disabled) == len(config.services):
             warnings.append("No services are enabled")
 
         # Check routing rules
         for task_type, rule in config.routing_rules.items():
-            # Check if primary service is enabled
-            primary_config = config.services.get(rule.primary)
-            if primary_config and not primary_config.enabled:
+            if rule.primary in disabled:
                 warnings.append(
                     f"Routing rule '{task_type}' uses disabled primary service: {rule.primary}"
                 )
 
-            # Check fallbacks
-            for fallback in rule.fallback:
-                fallback_config = config.services.get(fallback)
-                if fallback_config and not fallback_config.enabled:
-                    warnings.append(
-                        f"Routing rule '{task_type}' uses disabled fallback service: {fallback}"
-                    )
+            warnings.extend(
+                f"Routing rule '{task_type}' uses disabled fallback service: {fallback}"
+                for fallback in rule.fallback
+                if fallback in disabled
+            )
 
         return ValidationResponse(
             valid=True,
@@ -273,6 +377,7 @@ async def reload_configuration():
 
         # Reload configuration
         new_config = manager.reload()
+        _invalidate_dump_cache()
 
         # Get changes from last reload event
         changes = {}
@@ -381,20 +486,19 @@ async def patch_service_config(
         if patch.default_model is not None:
             service_config.default_model = patch.default_model
 
-        # Save configuration back to file
-        from pathlib import Path
-        config_path = Path(__file__).parent.parent.parent.parent.parent.parent / "config" / "default.yaml"
-        save_config(config, config_path)
+        # Capture the response before the reload swaps in a new config object
+        patched = service_config.model_dump()
 
-        # Reload
-        manager.reload()
+        # Save configuration back to file and reload, off the event loop
+        await asyncio.to_thread(_save_and_reload, config, manager)
+        _invalidate_dump_cache()
 
         logger.info(f"Service '{service_name}' configuration updated")
 
         return {
             "status": "updated",
             "service_name": service_name,
-            "config": service_config.model_dump(mode="json")
+            "config": patched
         }
 
     except HTTPException:
@@ -438,10 +542,11 @@ async def patch_routing_rule(
 
         # Update routing rule
         rule = config.routing_rules[task_type]
+        service_names = config.services.keys()
 
         if patch.primary is not None:
             # Validate service exists
-            if patch.primary not in config.services:
+            if patch.primary not in service_names:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Unknown service: {patch.primary}"
@@ -450,31 +555,30 @@ async def patch_routing_rule(
 
         if patch.fallback is not None:
             # Validate all fallback services exist
-            for service in patch.fallback:
-                if service not in config.services:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Unknown service: {service}"
-                    )
+            unknown = set(patch.fallback) - service_names
+            if unknown:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unknown service: {', '.join(sorted(unknown))}"
+                )
             rule.fallback = patch.fallback
 
         if patch.timeout_seconds is not None:
             rule.timeout_seconds = patch.timeout_seconds
 
-        # Save configuration back to file
-        from pathlib import Path
-        config_path = Path(__file__).parent.parent.parent.parent.parent.parent / "config" / "default.yaml"
-        save_config(config, config_path)
+        # Capture the response before the reload swaps in a new config object
+        patched = rule.model_dump()
 
-        # Reload
-        manager.reload()
+        # Save configuration back to file and reload, off the event loop
+        await asyncio.to_thread(_save_and_reload, config, manager)
+        _invalidate_dump_cache()
 
         logger.info(f"Routing rule for '{task_type}' updated")
 
         return {
             "status": "updated",
             "task_type": task_type,
-            "rule": rule.model_dump(mode="json")
+            "rule": patched
         }
 
     except HTTPException:
@@ -9,17 +9,22 @@ Provides REST API for LLM cost analytics:
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 import csv
 import io
+import sqlite3
 import time
 
 from ....analytics import get_cost_tracker
 from ....utils.logging import get_logger
+from ..responses import OrjsonResponse
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/costs", tags=["costs"])
 
+# Number of cost rows encoded per streamed CSV chunk
+_CSV_BATCH_ROWS = 1000
+
 
 # Request/Response models
 class BudgetRequest(BaseModel):
@@ -52,7 +57,7 @@ class BudgetAlert(BaseModel):
 
 # API Endpoints
 
-@router.get("/stats", response_model=CostStats)
+@router.get("/stats", response_model=None, response_class=OrjsonResponse, responses={200: {"model": CostStats}})
 async def get_cost_stats():
     """
     Get cost statistics.
@@ -67,7 +72,8 @@ async def get_cost_stats():
         tracker = get_cost_tracker()
         stats = tracker.get_statistics()
 
-        return CostStats(**stats)
+        # get_statistics() already returns exactly the CostStats fields
+        return OrjsonResponse(content=stats)
 
     except Exception as e:
         logger.error(f"Failed to get cost stats: {e}")
@@ -245,50 +251,43 @@ async def export_costs_csv(
     Export cost data as CSV.
 
     Downloads a CSV file with all cost records in the time range.
+    Rows are streamed from the database cursor, so memory use does not
+    grow with the size of the export.
     """
     try:
         tracker = get_cost_tracker()
 
-        # Get all cost records (via SQL query)
-        import sqlite3
-        conn = sqlite3.connect(str(tracker.db_path))
-        cursor = conn.cursor()
-
-        query = "SELECT task_id, service, tokens_input, tokens_output, cost_usd, timestamp FROM llm_costs WHERE 1=1"
-        params = []
+        # Get all cost records (via SQL query). The connection is handed to the
+        # streaming generator, which runs in a threadpool and closes it when done.
+        conn = sqlite3.connect(str(tracker.db_path), check_same_thread=False)
+        try:
+            conn.execute("PRAGMA query_only = 1")
 
-        if start_time:
-            query += " AND timestamp >= ?"
-            params.append(start_time)
+            # Columns are formatted by SQLite so rows can be written to CSV as-is
+            query = (
+                "SELECT task_id, service, tokens_input, tokens_output, printf('%.6f', cost_usd), timestamp, "
+                "strftime('%Y-%m-%dT%H:%M:%S', timestamp, 'unixepoch', 'localtime') "
+                "FROM llm_costs WHERE 1=1"
+            )
+            params = []
 
-        if end_time:
-            query += " AND timestamp <= ?"
-            params.append(end_time)
+            if start_time:
+                query += " AND timestamp >= ?"
+                params.append(start_time)
 
-        query += " ORDER BY timestamp DESC"
+            if end_time:
+                query += " AND timestamp <= ?"
+                params.append(end_time)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+            query += " ORDER BY timestamp DESC"
 
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["task_id", "service", "tokens_input", "tokens_output", "cost_usd", "timestamp", "date"])
+            cursor = conn.execute(query, params)
+        except Exception:
+            conn.close()
+            raise
 
-        # Data
-        for row in rows:
-            task_id, service, tokens_in, tokens_out, cost, timestamp = row
-            from datetime import datetime
-            date_str = datetime.fromtimestamp(timestamp).isoformat()
-            writer.writerow([task_id, service, tokens_in, tokens_out, f"{cost:.6f}", timestamp, date_str])
-
-        # Prepare response
-        output.seek(0)
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _iter_costs_csv(conn, cursor),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=oxide_costs_{int(time.time())}.csv"
@@ -300,6 +299,33 @@ async def export_costs_csv(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _iter_costs_csv(conn, cursor) -> Iterator[str]:
+    """
+    Encode cost rows as CSV, yielding one chunk per _CSV_BATCH_ROWS rows.
+
+    Args:
+        conn: Open SQLite connection (closed when iteration ends)
+        cursor: Executed cursor over pre-formatted cost rows
+    """
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # Header
+        writer.writerow(["task_id", "service", "tokens_input", "tokens_output", "cost_usd", "timestamp", "date"])
+
+        # Data
+        while rows := cursor.fetchmany(_CSV_BATCH_ROWS):
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        yield buffer.getvalue()
+    finally:
+        conn.close()
+
+
 @router.get("/pricing")
 async def get_pricing():
     """
@@ -310,14 +336,10 @@ async def get_pricing():
     try:
         tracker = get_cost_tracker()
 
-        pricing_list = []
-        for service, pricing in tracker.pricing.items():
-            pricing_list.append({
-                "service": pricing.service,
-                "cost_per_input_token": pricing.cost_per_input_token,
-                "cost_per_output_token": pricing.cost_per_output_token,
-                "currency": pricing.currency
-            })
+        # ServicePricing is a flat dataclass, so a shallow copy of its
+        # __dict__ gives the same fields as dataclasses.asdict() without
+        # the recursive deep copy
+        pricing_list = [dict(vars(pricing)) for pricing in tracker.pricing.values()]
 
         return {"pricing": pricing_list}
 
@@ -4,18 +4,32 @@ Machine monitoring API routes.
 Endpoints for multi-machine metrics and monitoring.
 """
 import asyncio
+import time
 import psutil
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse
 from fastapi import APIRouter, Depends
 import aiohttp
 
 from ....core.orchestrator import Orchestrator
 from ....utils.logging import logger
+from ....utils.system_metrics import get_system_metrics_sampler
+from ..responses import OrjsonResponse
 
 
 router = APIRouter()
 
+# Hostnames treated as the local machine
+_LOCAL_HOSTNAMES = frozenset({"localhost", "127.0.0.1", "::1"})
+
+# Seconds a service status snapshot is reused across machine list polls
+_STATUS_TTL_SECONDS = 2.0
+
+# Last service status snapshot: (orchestrator, monotonic time, status)
+_status_cache: Optional[Tuple[Orchestrator, float, Dict[str, Any]]] = None
+_status_lock: Optional[asyncio.Lock] = None
+
 
 def get_orchestrator() -> Orchestrator:
     """Dependency to get orchestrator instance."""
@@ -23,7 +37,68 @@ def get_orchestrator() -> Orchestrator:
     return get_orchestrator()
 
 
-@router.get("/")
+def _fresh_service_status(orchestrator: Orchestrator) -> Optional[Dict[str, Any]]:
+    """Return the cached service status if it is recent and from this orchestrator."""
+    cached = _status_cache
+    if (
+        cached is not None
+        and cached[0] is orchestrator
+        and time.monotonic() - cached[1] < _STATUS_TTL_SECONDS
+    ):
+        return cached[2]
+    return None
+
+
+async def _get_service_status(orchestrator: Orchestrator) -> Dict[str, Any]:
+    """
+    Get service status, reusing a snapshot younger than _STATUS_TTL_SECONDS.
+
+    Concurrent requests that miss the cache wait on a single refresh
+    instead of each running their own round of health checks.
+
+    Args:
+        orchestrator: Orchestrator to query
+
+    Returns:
+        Service status dict as returned by Orchestrator.get_service_status()
+    """
+    global _status_cache, _status_lock
+
+    status = _fresh_service_status(orchestrator)
+    if status is not None:
+        return status
+
+    if _status_lock is None:
+        _status_lock = asyncio.Lock()
+
+    async with _status_lock:
+        # Another request may have refreshed while we waited
+        status = _fresh_service_status(orchestrator)
+        if status is None:
+            status = await orchestrator.get_service_status()
+            _status_cache = (orchestrator, time.monotonic(), status)
+
+    return status
+
+
+@lru_cache(maxsize=256)
+def _classify_url(base_url: str) -> Tuple[str, int, bool, str]:
+    """
+    Parse a service base URL into its machine attributes.
+
+    Args:
+        base_url: Service base URL
+
+    Returns:
+        Tuple of (hostname, port, is_local, machine_id)
+    """
+    parsed = urlparse(base_url)
+    hostname = parsed.hostname or "unknown"
+    port = parsed.port or 80
+    return hostname, port, hostname in _LOCAL_HOSTNAMES, f"remote_{hostname.replace('.', '_')}"
+
+
+@router.get("/", response_class=OrjsonResponse)
 async def list_machines(orchestrator: Orchestrator = Depends(get_orchestrator)) -> Dict[str, Any]:
     """
     Get list of all machines with their metrics.
@@ -35,8 +110,7 @@ async def list_machines(orchestrator: Orchestrator = Depends(get_orchestrator))
         machines = {}
 
         # Local machine
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
+        cpu_percent, memory = get_system_metrics_sampler().latest()
 
         machines['local'] = {
             "id": "local",
@@ -53,7 +127,7 @@ async def list_machines(orchestrator: Orchestrator = Depends(get_orchestrator))
         }
 
         # Extract remote machines from HTTP services
-        service_status = await orchestrator.get_service_status()
+        service_status = await _get_service_status(orchestrator)
 
         for service_name, status in service_status.items():
             info = status.get("info", {})
@@ -63,12 +137,7 @@ async def list_machines(orchestrator: Orchestrator = Depends(get_orchestrator))
             if "http" in service_type:
                 base_url = info.get("base_url", "")
                 if base_url:
-                    parsed = urlparse(base_url)
-                    hostname = parsed.hostname or "unknown"
-                    port = parsed.port or 80
-
-                    # Check if it's localhost
-                    is_local = hostname in ["localhost", "127.0.0.1", "::1"]
+                    hostname, port, is_local, machine_id = _classify_url(base_url)
 
                     if is_local:
                         # Add to local machine services
@@ -79,8 +148,6 @@ async def list_machines(orchestrator: Orchestrator = Depends(get_orchestrator))
                         })
                     else:
                         # Create or update remote machine entry
-                        machine_id = f"remote_{hostname.replace('.', '_')}"
-
                         if machine_id not in machines:
                             machines[machine_id] = {
                                 "id": machine_id,
@@ -104,11 +171,11 @@ async def list_machines(orchestrator: Orchestrator = Depends(get_orchestrator))
                         if status.get("healthy"):
                             machines[machine_id]['status'] = "online"
 
-        return {
+        return OrjsonResponse(content={
             "machines": list(machines.values()),
             "total": len(machines),
             "online": sum(1 for m in machines.values() if m["status"] == "online"),
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error listing machines: {e}")
@@ -120,7 +187,7 @@ async def list_machines(orchestrator: Orchestrator = Depends(get_orchestrator))
         }
 
 
-@router.get("/{machine_id}")
+@router.get("/{machine_id}", response_class=OrjsonResponse)
 async def get_machine(
     machine_id: str,
     orchestrator: Orchestrator = Depends(get_orchestrator)
@@ -137,8 +204,7 @@ async def get_machine(
     try:
         if machine_id == "local":
             # Local machine
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
+            cpu_percent, memory = get_system_metrics_sampler().latest()
             disk = psutil.disk_usage('/')
 
             return {
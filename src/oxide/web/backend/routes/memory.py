@@ -8,15 +8,18 @@ Provides REST API for context memory operations:
 - Prune old conversations
 - Get memory statistics
 """
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import AsyncIterator, Optional, List, Dict, Any
 
 from ....memory.context_memory import get_context_memory
 from ....utils.logging import get_logger
+from ..responses import OrjsonResponse
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/api/memory", tags=["memory"])
+router = APIRouter(prefix="/api/memory", tags=["memory"], default_response_class=OrjsonResponse)
 
 
 # Request/Response models
@@ -78,9 +81,45 @@ class PruneResponse(BaseModel):
     message: str
 
 
+# Conversation summaries encoded per streamed chunk
+_STREAM_BATCH_SIZE = 50
+
+
+def _summary(conv: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a plain dict in the ConversationSummary shape (skips re-validation)."""
+    return {
+        "id": conv["id"],
+        "created_at": conv["created_at"],
+        "updated_at": conv["updated_at"],
+        "message_count": len(conv["messages"]),
+        "metadata": conv.get("metadata", {})
+    }
+
+
+async def _stream_summaries(conversations: List[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode conversation summaries as a JSON array, one batch per chunk.
+
+    The first bytes go out before the whole page is serialized, and only
+    one batch of encoded summaries is held at a time.
+
+    Args:
+        conversations: Conversations of the requested page
+
+    Yields:
+        Chunks of the JSON array
+    """
+    yield b"["
+    for start in range(0, len(conversations), _STREAM_BATCH_SIZE):
+        batch = conversations[start:start + _STREAM_BATCH_SIZE]
+        chunk = b",".join(orjson.dumps(_summary(conv)) for conv in batch)
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]"
+
+
 # API Endpoints
 
-@router.get("/conversations", response_model=List[ConversationSummary])
+@router.get("/conversations", response_model=None, responses={200: {"model": List[ConversationSummary]}})
 async def list_conversations(
     limit: int = Query(50, ge=1, le=500, description="Maximum number of conversations to return"),
     offset: int = Query(0, ge=0, description="Number of conversations to skip")
@@ -92,35 +131,19 @@ async def list_conversations(
     """
     try:
         memory = get_context_memory()
-        conversations = []
-
-        # Get all conversations
-        all_convs = list(memory._memory.values())
-
-        # Sort by updated_at (newest first)
-        all_convs.sort(key=lambda x: x["updated_at"], reverse=True)
-
-        # Apply pagination
-        paginated = all_convs[offset:offset + limit]
 
-        for conv in paginated:
-            conversations.append(ConversationSummary(
-                id=conv["id"],
-                created_at=conv["created_at"],
-                updated_at=conv["updated_at"],
-                message_count=len(conv["messages"]),
-                metadata=conv.get("metadata", {})
-            ))
+        # Newest first, paginated
+        conversations = memory.list_conversations(limit=limit, offset=offset)
 
         logger.info(f"Listed {len(conversations)} conversations (offset={offset}, limit={limit})")
-        return conversations
+        return StreamingResponse(_stream_summaries(conversations), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Failed to list conversations: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/conversations/{conversation_id}", response_model=Conversation)
+@router.get("/conversations/{conversation_id}", response_model=None, responses={200: {"model": Conversation}})
 async def get_conversation(conversation_id: str):
     """
     Get full conversation by ID.
@@ -134,25 +157,9 @@ async def get_conversation(conversation_id: str):
         if not conv:
             raise HTTPException(status_code=404, detail=f"Conversation '{conversation_id}' not found")
 
-        # Convert to response model
-        messages = [
-            Message(
-                id=msg["id"],
-                role=msg["role"],
-                content=msg["content"],
-                timestamp=msg["timestamp"],
-                metadata=msg.get("metadata", {})
-            )
-            for msg in conv["messages"]
-        ]
-
-        return Conversation(
-            id=conv["id"],
-            created_at=conv["created_at"],
-            updated_at=conv["updated_at"],
-            messages=messages,
-            metadata=conv.get("metadata", {})
-        )
+        # Stored conversations already have the Conversation shape, so they
+        # are serialized as-is instead of being rebuilt message by message
+        return OrjsonResponse(content=conv)
 
     except HTTPException:
         raise
@@ -196,7 +203,7 @@ async def get_recent_messages(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/search", response_model=List[SearchResult])
+@router.get("/search", response_model=None, responses={200: {"model": List[SearchResult]}})
 async def search_conversations(
     query: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(5, ge=1, le=50, description="Maximum results"),
@@ -205,7 +212,7 @@ async def search_conversations(
     """
     Search for conversations similar to query.
 
-    Uses keyword-based similarity matching.
+    Uses keyword-based similarity matching over the memory's word index.
     """
     try:
         memory = get_context_memory()
@@ -215,17 +222,8 @@ async def search_conversations(
             min_similarity=min_similarity
         )
 
-        return [
-            SearchResult(
-                conversation_id=result["conversation_id"],
-                similarity=result["similarity"],
-                created_at=result["created_at"],
-                updated_at=result["updated_at"],
-                message_count=result["message_count"],
-                metadata=result.get("metadata", {})
-            )
-            for result in results
-        ]
+        # Results are built in the SearchResult shape by the memory
+        return OrjsonResponse(content=results)
 
     except Exception as e:
         logger.error(f"Failed to search conversations: {e}")
@@ -283,12 +281,9 @@ async def delete_conversation(conversation_id: str):
     try:
         memory = get_context_memory()
 
-        if conversation_id not in memory._memory:
+        if not memory.delete_conversation(conversation_id):
             raise HTTPException(status_code=404, detail=f"Conversation '{conversation_id}' not found")
 
-        del memory._memory[conversation_id]
-        memory._save_memory()
-
         logger.info(f"Deleted conversation: {conversation_id}")
 
         return {"message": f"Conversation '{conversation_id}' deleted successfully"}
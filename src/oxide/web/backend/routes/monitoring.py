@@ -4,17 +4,18 @@ Monitoring API routes.
 Endpoints for system metrics and monitoring with performance optimizations.
 """
 import asyncio
-import psutil
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, Request
 
 from ....core.orchestrator import Orchestrator
 from ....utils.logging import logger
 from ....utils.metrics_cache import MetricsCache
+from ....utils.system_metrics import get_system_metrics_sampler
+from ..responses import OrjsonResponse
 from ..websocket import WebSocketManager
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 def get_orchestrator(request: Request) -> Orchestrator:
@@ -44,26 +45,16 @@ async def get_metrics(
     """
     Get system metrics with caching for performance.
 
-    Uses MetricsCache to prevent expensive operations like CPU monitoring
-    from blocking the event loop on every request.
+    CPU and memory are read from the background system metrics sampler and
+    service status goes through MetricsCache, so nothing blocks the event
+    loop on a request.
 
     Returns:
         System metrics including CPU, memory, services, etc.
     """
     try:
-        # CPU monitoring (blocking - run in executor with cache)
-        cpu_percent = await metrics_cache.get_or_compute_async(
-            "cpu_percent",
-            lambda: psutil.cpu_percent(interval=0.1),
-            use_executor=True
-        )
-
-        # Memory monitoring (fast, but cache for consistency)
-        memory = await metrics_cache.get_or_compute_async(
-            "memory",
-            lambda: psutil.virtual_memory(),
-            use_executor=False
-        )
+        # CPU and memory come from the background sampler (never blocks)
+        cpu_percent, memory = get_system_metrics_sampler().latest()
 
         # Service status (async, cache to reduce load)
         service_status = await metrics_cache.get_or_compute_async(
@@ -74,8 +65,12 @@ async def get_metrics(
 
         # Count services
         total_services = len(service_status)
-        enabled_services = sum(1 for s in service_status.values() if s.get("enabled"))
-        healthy_services = sum(1 for s in service_status.values() if s.get("healthy"))
+        enabled_services = healthy_services = 0
+        for status in service_status.values():
+            if status.get("enabled"):
+                enabled_services += 1
+            if status.get("healthy"):
+                healthy_services += 1
 
         # Get task stats (fast, no caching needed)
         from ....utils.task_storage import get_task_storage
@@ -133,10 +128,11 @@ async def get_stats(orchestrator: Orchestrator = Depends(get_orchestrator)) -> D
         from ....utils.task_storage import get_task_storage
         task_storage = get_task_storage()
 
-        # Get all tasks
-        tasks = task_storage.list_tasks(limit=1000)
+        # Aggregated by the storage backend over the 1000 most recent tasks
+        stats = task_storage.get_aggregate_stats(limit=1000)
+        total = stats["total"]
 
-        if not tasks:
+        if not total:
             return {
                 "total_tasks": 0,
                 "avg_duration": 0,
@@ -144,31 +140,14 @@ async def get_stats(orchestrator: Orchestrator = Depends(get_orchestrator)) -> D
                 "tasks_by_status": {}
             }
 
-        # Calculate stats
-        completed = [t for t in tasks if t["status"] == "completed"]
-
-        # Average duration
-        if completed:
-            durations = [t.get("duration", 0) for t in completed if t.get("duration")]
-            avg_duration = sum(durations) / len(durations) if durations else 0
-        else:
-            avg_duration = 0
-
-        # Success rate
-        total = len(tasks)
-        succeeded = len(completed)
-        failed = sum(1 for t in tasks if t["status"] == "failed")
-        success_rate = (succeeded / total * 100) if total > 0 else 0
-
-        # Tasks by status
-        tasks_by_status = {}
-        for task in tasks:
-            status = task["status"]
-            tasks_by_status[status] = tasks_by_status.get(status, 0) + 1
+        tasks_by_status = stats["by_status"]
+        succeeded = tasks_by_status.get("completed", 0)
+        failed = tasks_by_status.get("failed", 0)
+        success_rate = succeeded / total * 100
 
         return {
             "total_tasks": total,
-            "avg_duration": round(avg_duration, 2),
+            "avg_duration": round(stats["avg_duration"], 2),
             "success_rate": round(success_rate, 2),
             "tasks_by_status": tasks_by_status,
             "completed": succeeded,
@@ -189,9 +168,8 @@ async def health_check() -> Dict[str, Any]:
         System health status
     """
     try:
-        # Check if system is responsive
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
+        # Check if system is responsive (latest background sample, never blocks)
+        cpu_percent, memory = get_system_metrics_sampler().latest()
 
         # Determine health status
         is_healthy = True
@@ -3,15 +3,74 @@ Routing Rules API routes.
 
 Endpoints for managing custom task-to-service routing assignments.
 """
+from functools import lru_cache
 from typing import Dict, Any, List
-from fastapi import APIRouter, HTTPException
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
-from ....utils.routing_rules import get_routing_rules_manager
+from ....utils.routing_rules import RoutingRulesManager, get_routing_rules_manager
 from ....utils.logging import logger
+from ..responses import OrjsonResponse
+
+
+router = APIRouter(default_response_class=OrjsonResponse)
+
+# Standard task types from the classifier
+_TASK_TYPES = [
+    {
+        "name": "coding",
+        "label": "Code Generation",
+        "description": "Writing new code, implementing features",
+        "recommended_services": ["qwen", "gemini"]
+    },
+    {
+        "name": "code_review",
+        "label": "Code Review",
+        "description": "Reviewing code for bugs, improvements",
+        "recommended_services": ["qwen", "gemini"]
+    },
+    {
+        "name": "bug_search",
+        "label": "Bug Search",
+        "description": "Finding and analyzing bugs in code",
+        "recommended_services": ["qwen", "gemini"]
+    },
+    {
+        "name": "refactoring",
+        "label": "Refactoring",
+        "description": "Code refactoring and optimization",
+        "recommended_services": ["qwen", "gemini"]
+    },
+    {
+        "name": "documentation",
+        "label": "Documentation",
+        "description": "Writing documentation, comments",
+        "recommended_services": ["gemini", "qwen"]
+    },
+    {
+        "name": "codebase_analysis",
+        "label": "Codebase Analysis",
+        "description": "Analyzing large codebases, architecture",
+        "recommended_services": ["gemini"]
+    },
+    {
+        "name": "quick_query",
+        "label": "Quick Query",
+        "description": "Simple questions, quick responses",
+        "recommended_services": ["ollama_local", "ollama_remote"]
+    },
+    {
+        "name": "general",
+        "label": "General",
+        "description": "General purpose tasks",
+        "recommended_services": ["ollama_local", "qwen"]
+    }
+]
 
-
-router = APIRouter()
+# The task type list never changes, so it is serialized once at import
+_TASK_TYPES_JSON = orjson.dumps({"task_types": _TASK_TYPES})
 
 
 class RoutingRule(BaseModel):
@@ -20,8 +79,30 @@ class RoutingRule(BaseModel):
     service: str
 
 
+@lru_cache(maxsize=1)
+def _rules_payload(rules_manager: RoutingRulesManager, version: int) -> bytes:
+    """
+    Serialize the rules listing, memoized per rules version.
+
+    The version is read before the rules are exported, so a write racing
+    with this call can only make the cached payload newer than its key,
+    never stale.
+
+    Args:
+        rules_manager: Routing rules manager
+        version: Rules version the payload is cached under
+
+    Returns:
+        JSON-encoded rules and statistics
+    """
+    return orjson.dumps({
+        "rules": rules_manager.export_rules(),
+        "stats": rules_manager.get_stats()
+    })
+
+
 @router.get("/rules")
-async def list_routing_rules() -> Dict[str, Any]:
+async def list_routing_rules() -> Response:
     """
     Get all custom routing rules.
 
@@ -30,11 +111,9 @@ async def list_routing_rules() -> Dict[str, Any]:
     """
     try:
         rules_manager = get_routing_rules_manager()
+        content = _rules_payload(rules_manager, rules_manager.version)
 
-        return {
-            "rules": rules_manager.export_rules(),
-            "stats": rules_manager.get_stats()
-        }
+        return Response(content=content, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error listing routing rules: {e}")
@@ -182,65 +261,11 @@ async def clear_routing_rules() -> Dict[str, Any]:
 
 
 @router.get("/task-types")
-async def get_available_task_types() -> Dict[str, Any]:
+async def get_available_task_types() -> Response:
     """
     Get list of available task types that can be configured.
 
     Returns:
         List of task types with descriptions
     """
-    # Standard task types from the classifier
-    task_types = [
-        {
-            "name": "coding",
-            "label": "Code Generation",
-            "description": "Writing new code, implementing features",
-            "recommended_services": ["qwen", "gemini"]
-        },
-        {
-            "name": "code_review",
-            "label": "Code Review",
-            "description": "Reviewing code for bugs, improvements",
-            "recommended_services": ["qwen", "gemini"]
-        },
-        {
-            "name": "bug_search",
-            "label": "Bug Search",
-            "description": "Finding and analyzing bugs in code",
-            "recommended_services": ["qwen", "gemini"]
-        },
-        {
-            "name": "refactoring",
-            "label": "Refactoring",
-            "description": "Code refactoring and optimization",
-            "recommended_services": ["qwen", "gemini"]
-        },
-        {
-            "name": "documentation",
-            "label": "Documentation",
-            "description": "Writing documentation, comments",
-            "recommended_services": ["gemini", "qwen"]
-        },
-        {
-            "name": "codebase_analysis",
-            "label": "Codebase Analysis",
-            "description": "Analyzing large codebases, architecture",
-            "recommended_services": ["gemini"]
-        },
-        {
-            "name": "quick_query",
-            "label": "Quick Query",
-            "description": "Simple questions, quick responses",
-            "recommended_services": ["ollama_local", "ollama_remote"]
-        },
-        {
-            "name": "general",
-            "label": "General",
-            "description": "General purpose tasks",
-            "recommended_services": ["ollama_local", "qwen"]
-        }
-    ]
-
-    return {
-        "task_types": task_types
-    }
+    return Response(content=_TASK_TYPES_JSON, media_type="application/json")
@@ -3,24 +3,38 @@ Tasks API routes.
 
 Endpoints for executing and monitoring tasks.
 """
-import uuid
 import asyncio
-from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from pydantic import BaseModel
+import hashlib
+import io
+import secrets
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from pydantic import BaseModel, ConfigDict
 
 from ....core.orchestrator import Orchestrator
 from ....utils.logging import logger
 from ....utils.exceptions import NoServiceAvailableError, ExecutionError
 from ....utils.task_storage import get_task_storage
-from ....utils.path_validator import validate_paths, SecurityError
+from ....utils.task_queue import get_task_queue
+from ....utils.path_validator import get_path_validator, validate_paths, SecurityError
+from ..websocket import WebSocketManager
 
 
 router = APIRouter()
 
+# Fingerprint -> task ID of /execute tasks that are queued or running
+_inflight: Dict[str, str] = {}
+
 
 class TaskRequest(BaseModel):
     """Request to execute a task."""
+    # Read-only once validated: unknown fields dropped, no assignment checks
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     prompt: str
     files: Optional[List[str]] = None
     preferences: Optional[Dict[str, Any]] = None
@@ -28,28 +42,239 @@ class TaskRequest(BaseModel):
 
 class ParallelTaskRequest(BaseModel):
     """Request to execute parallel analysis."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     directory: str
     prompt: str
     num_workers: Optional[int] = None
 
 
-def get_orchestrator() -> Orchestrator:
-    """Dependency to get orchestrator instance."""
+class _ChunkBatcher:
+    """
+    Coalesce streamed chunks into fewer WebSocket broadcasts.
+
+    Chunks are buffered per key and handed to ``send`` together once
+    ``max_chunks`` are pending or ``max_delay`` seconds have passed since
+    the first pending chunk, whichever comes first. Sends are serialized,
+    so batches reach clients in stream order.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any, List[Any]], Awaitable[None]],
+        max_chunks: int = 32,
+        max_delay: float = 0.025
+    ):
+        """
+        Initialize chunk batcher.
+
+        Args:
+            send: Coroutine function called with (key, chunks) per flushed key
+            max_chunks: Pending chunks that trigger an immediate flush
+            max_delay: Seconds a chunk may wait before a timed flush
+        """
+        self._send = send
+        self.max_chunks = max_chunks
+        self.max_delay = max_delay
+        self._pending: Dict[Any, List[Any]] = {}
+        self._count = 0
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timed_flushes: Set[asyncio.Task] = set()
+
+    async def add(self, key: Any, chunk: Any):
+        """
+        Buffer a chunk, flushing if the batch is full.
+
+        Args:
+            key: Grouping key (e.g. service name); chunks are sent per key
+            chunk: Chunk to buffer
+        """
+        self._pending.setdefault(key, []).append(chunk)
+        self._count += 1
+
+        if self._count >= self.max_chunks:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._timed_flush)
+
+    def _timed_flush(self):
+        """Timer callback: flush pending chunks in a task"""
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        self._timed_flushes.add(task)
+        task.add_done_callback(self._timed_flushes.discard)
+
+    async def flush(self):
+        """Send all pending chunks, one call per key."""
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            pending, self._pending, self._count = self._pending, {}, 0
+            for key, chunks in pending.items():
+                await self._send(key, chunks)
+
+    async def close(self):
+        """Flush remaining chunks and wait for in-flight timed flushes."""
+        await self.flush()
+        if self._timed_flushes:
+            await asyncio.gather(*self._timed_flushes, return_exceptions=True)
+
+
+def _progress_batcher(ws_manager, task_id: str) -> _ChunkBatcher:
+    """Batch single/parallel mode chunks into joined task_progress messages."""
+    async def send(_key: Any, chunks: List[str]):
+        await ws_manager.broadcast_task_progress(task_id, "".join(chunks))
+
+    return _ChunkBatcher(send)
+
+
+def _broadcast_chunk_batcher(ws_manager, task_id: str) -> _ChunkBatcher:
+    """Batch broadcast_all mode chunks into one task_broadcast_chunk message per service."""
+    async def send(service: str, chunk_objs: List[Dict[str, Any]]):
+        # The newest parsed chunk becomes the envelope for the joined text
+        envelope = chunk_objs[-1]
+        envelope["service"] = service
+        envelope["chunk"] = "".join(obj.get("chunk", "") for obj in chunk_objs)
+        envelope["done"] = False
+        envelope.setdefault("timestamp", 0)
+        await ws_manager.forward_task_broadcast_chunk(task_id, envelope)
+
+    return _ChunkBatcher(send)
+
+
+async def _forward_broadcast_chunk(batcher: _ChunkBatcher, ws_manager, task_id: str, chunk_obj: Dict[str, Any]):
+    """
+    Forward a parsed broadcast_all chunk to WebSocket clients.
+
+    Streaming text is batched per service; completion and error markers
+    flush the pending text first and are sent as-is, so clients still see
+    every service's final state. Parsed chunk dicts are reused as the
+    WebSocket messages rather than rebuilt field by field.
+
+    Args:
+        batcher: Batcher from _broadcast_chunk_batcher()
+        ws_manager: WebSocket manager
+        task_id: Task identifier
+        chunk_obj: Parsed chunk from Orchestrator broadcast execution
+    """
+    if not chunk_obj.get("done", False) and not chunk_obj.get("error"):
+        await batcher.add(chunk_obj.get("service", "unknown"), chunk_obj)
+        return
+
+    await batcher.flush()
+    chunk_obj.setdefault("service", "unknown")
+    chunk_obj.setdefault("chunk", "")
+    chunk_obj.setdefault("done", False)
+    chunk_obj.setdefault("timestamp", 0)
+    await ws_manager.forward_task_broadcast_chunk(task_id, chunk_obj)
+
+
+# Failure message prefixes by exception class; subclasses use their nearest base
+_ERROR_PREFIXES = {
+    NoServiceAvailableError: "No service available",
+    ExecutionError: "Execution error",
+}
+
+
+def _error_message(error: Exception) -> str:
+    """Format the failure message stored and broadcast for a failed task."""
+    prefix = next(
+        (_ERROR_PREFIXES[cls] for cls in type(error).__mro__ if cls in _ERROR_PREFIXES),
+        "Unexpected error"
+    )
+    return f"{prefix}: {error}"
+
+
+def get_orchestrator(request: Request) -> Orchestrator:
+    """Dependency injection for orchestrator."""
     from ..main import get_orchestrator
-    return get_orchestrator()
+    return get_orchestrator(request)
 
 
-def get_ws_manager():
-    """Dependency to get WebSocket manager."""
+def get_ws_manager(request: Request) -> WebSocketManager:
+    """Dependency injection for WebSocket manager."""
     from ..main import get_ws_manager
-    return get_ws_manager()
+    return get_ws_manager(request)
+
+
+def _task_fingerprint(
+    prompt: str,
+    files: Optional[List[str]],
+    preferences: Optional[Dict[str, Any]]
+) -> str:
+    """Key identifying requests that would run the same task."""
+    key = orjson.dumps([prompt, sorted(files or []), preferences or {}], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+# Seconds a validated file list is reused before paths are resolved again
+_PATH_CACHE_TTL = 60.0
+
+
+@lru_cache(maxsize=4096)
+def _validate_paths_cached(files: tuple, validator, ttl_bucket: int) -> tuple:
+    """
+    Resolved paths for a file list, cached per validator and TTL window.
+
+    Keying on the validator drops results when the whitelist is reloaded,
+    and the TTL bucket bounds how long a resolved symlink is trusted.
+    Rejected lists raise and are never cached.
+    """
+    return tuple(str(p) for p in validate_paths(list(files), require_exists=False))
+
+
+async def _validate_files(files: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Validate requested file paths off the event loop.
+
+    Path resolution follows symlinks on disk, so it runs in a worker thread.
+    Repeated file lists are served from _validate_paths_cached().
+
+    Raises:
+        HTTPException: 403 if any path fails security validation
+    """
+    if not files:
+        return files
+
+    try:
+        validated_paths = await asyncio.to_thread(
+            _validate_paths_cached,
+            tuple(files),
+            get_path_validator(),
+            int(time.monotonic() // _PATH_CACHE_TTL)
+        )
+    except SecurityError as e:
+        logger.error("Security validation failed: %s", e)
+        raise HTTPException(
+            status_code=403,
+            detail=f"Security validation failed: {str(e)}"
+        )
+    return list(validated_paths)
+
+
+def _enqueue(task_id: str, func: Callable[..., Awaitable[None]], *args: Any, **kwargs: Any):
+    """
+    Queue a stored task for the worker pool.
+
+    Raises:
+        HTTPException: 503 if the queue is full; the stored task is marked failed
+    """
+    try:
+        get_task_queue().submit(func, *args, **kwargs)
+    except asyncio.QueueFull:
+        logger.warning("Task queue full, rejecting task %s", task_id)
+        get_task_storage().update_task(task_id, status="failed", error="Task queue is full")
+        raise HTTPException(status_code=503, detail="Task queue is full, retry later")
 
 
 @router.post("/execute")
 async def execute_task(
     request: TaskRequest,
-    background_tasks: BackgroundTasks,
-    orchestrator: Orchestrator = Depends(get_orchestrator)
+    orchestrator: Orchestrator = Depends(get_orchestrator),
+    ws_manager: WebSocketManager = Depends(get_ws_manager)
 ) -> Dict[str, Any]:
     """
     Execute a task with intelligent routing.
@@ -62,28 +287,25 @@ async def execute_task(
     """
     try:
         # Validate file paths for security
-        validated_files = request.files
-        if request.files:
-            try:
-                validated_paths = validate_paths(request.files, require_exists=False)
-                validated_files = [str(p) for p in validated_paths]
-            except SecurityError as e:
-                logger.error(f"Security validation failed: {e}")
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Security validation failed: {str(e)}"
-                )
+        validated_files = await _validate_files(request.files)
+
+        # Join an identical task that is still queued or running
+        fingerprint = _task_fingerprint(request.prompt, validated_files, request.preferences)
+        if fingerprint in _inflight:
+            return {
+                "task_id": _inflight[fingerprint],
+                "status": "queued",
+                "message": "Identical task already in progress"
+            }
 
         # Generate task ID
-        task_id = str(uuid.uuid4())
+        task_id = secrets.token_hex(16)
 
         # Get task storage
         task_storage = get_task_storage()
 
         # Classify task to get type and service
-        from ....core.classifier import TaskClassifier
-        classifier = TaskClassifier()
-        task_info = classifier.classify(request.prompt, validated_files)
+        task_info = orchestrator.classifier.classify(request.prompt, validated_files)
         service = task_info.recommended_services[0] if task_info.recommended_services else "unknown"
 
         # Store task info
@@ -96,15 +318,22 @@ async def execute_task(
             task_type=task_info.task_type.value
         )
 
-        # Execute task in background
-        background_tasks.add_task(
+        # Execute task on the worker pool
+        _enqueue(
+            task_id,
             _execute_task_background,
             task_id,
             request.prompt,
             request.files,
             request.preferences,
-            orchestrator
+            orchestrator,
+            ws_manager,
+            task_storage,
+            service=service,
+            task_type=task_info.task_type.value,
+            fingerprint=fingerprint
         )
+        _inflight[fingerprint] = task_id
 
         return {
             "task_id": task_id,
@@ -112,8 +341,10 @@ async def execute_task(
             "message": "Task queued for execution"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error queuing task: {e}")
+        logger.error("Error queuing task: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -122,108 +353,144 @@ async def _execute_task_background(
     prompt: str,
     files: Optional[List[str]],
     preferences: Optional[Dict[str, Any]],
-    orchestrator: Orchestrator
+    orchestrator: Orchestrator,
+    ws_manager: WebSocketManager,
+    task_storage,
+    service: str = "unknown",
+    task_type: str = "unknown",
+    execution_mode: str = "single",
+    fingerprint: Optional[str] = None
 ):
     """
     Execute task in background and update status.
 
+    Task details and the WebSocket manager and storage are passed in by
+    the route that stored the task, so nothing is looked up again here.
+
     Args:
         task_id: Task identifier
         prompt: Task prompt
         files: Optional file paths
         preferences: Optional routing preferences
         orchestrator: Orchestrator instance
+        ws_manager: WebSocket manager resolved by the route
+        task_storage: Task storage the task was stored in
+        service: Service the task was stored with
+        task_type: Task type the task was stored with
+        execution_mode: Execution mode the task was stored with
+        fingerprint: In-flight key to release when the task finishes
     """
-    import json
-    from ..main import get_ws_manager
-
-    ws_manager = get_ws_manager()
-    task_storage = get_task_storage()
 
     try:
         # Update status to running
+        start = time.monotonic()
         task_storage.update_task(task_id, status="running")
 
-        # Get task info for WebSocket broadcast
-        task = task_storage.get_task(task_id)
-        service = task.get("service", "unknown")
-        task_type = task.get("task_type", "unknown")
-        execution_mode = task.get("execution_mode", "single")
-
         # Broadcast task start
         await ws_manager.broadcast_task_start(task_id, task_type, service)
 
         # Execute task
-        chunks = []
         is_broadcast_mode = execution_mode == "broadcast_all"
 
-        async for chunk in orchestrator.execute_task(prompt, files, preferences):
-            chunks.append(chunk)
+        # Only single/parallel mode stores the combined result, so only it
+        # accumulates the response text
+        result_buffer = None if is_broadcast_mode else io.StringIO()
 
-            # Handle broadcast_all mode differently
-            if is_broadcast_mode:
-                # Parse JSON chunk and broadcast with service identifier
-                try:
-                    chunk_obj = json.loads(chunk)
-                    await ws_manager.broadcast_task_broadcast_chunk(
-                        task_id=task_id,
-                        service=chunk_obj.get("service", "unknown"),
-                        chunk=chunk_obj.get("chunk", ""),
-                        done=chunk_obj.get("done", False),
-                        timestamp=chunk_obj.get("timestamp", 0),
-                        error=chunk_obj.get("error"),
-                        total_chunks=chunk_obj.get("total_chunks")
-                    )
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse broadcast chunk in task {task_id}")
-            else:
-                # Standard single/parallel mode - stream as before
-                await ws_manager.broadcast_task_progress(task_id, chunk)
-
-        result = "".join(chunks)
+        # Chunks are coalesced so chatty streams do not cost one WebSocket
+        # message per token
+        if is_broadcast_mode:
+            batcher = _broadcast_chunk_batcher(ws_manager, task_id)
+        else:
+            batcher = _progress_batcher(ws_manager, task_id)
+
+        try:
+            async for chunk in orchestrator.execute_task(prompt, files, preferences):
+                # Handle broadcast_all mode differently
+                if is_broadcast_mode:
+                    # Per-service results are stored by the orchestrator, so
+                    # with no clients connected there is nothing to forward
+                    if not ws_manager.get_connection_count():
+                        continue
+
+                    # Parse JSON chunk and broadcast with service identifier
+                    try:
+                        chunk_obj = orjson.loads(chunk)
+                        await _forward_broadcast_chunk(batcher, ws_manager, task_id, chunk_obj)
+                    except orjson.JSONDecodeError:
+                        logger.warning("Failed to parse broadcast chunk in task %s", task_id)
+                else:
+                    # Standard single/parallel mode
+                    result_buffer.write(chunk)
+                    if ws_manager.get_connection_count():
+                        await batcher.add(None, chunk)
+        finally:
+            await batcher.close()
 
         # Update task as completed
         # For broadcast mode, results are already stored per-service in orchestrator
         # For single/parallel mode, store the combined result
         if not is_broadcast_mode:
+            result = result_buffer.getvalue()
+            result_buffer.close()
             task_storage.update_task(task_id, status="completed", result=result)
         else:
             task_storage.update_task(task_id, status="completed")
 
-        # Get updated task for duration
-        updated_task = task_storage.get_task(task_id)
-        duration = updated_task.get("duration", 0)
-
-        # Broadcast completion
+        # Broadcast completion, timed in-process rather than re-read from storage
+        duration = time.monotonic() - start
         await ws_manager.broadcast_task_complete(task_id, True, duration)
 
-    except NoServiceAvailableError as e:
-        error_msg = f"No service available: {e}"
+    except Exception as e:
+        error_msg = _error_message(e)
         logger.error(error_msg)
 
         task_storage.update_task(task_id, status="failed", error=error_msg)
         await ws_manager.broadcast_task_complete(task_id, False, error=error_msg)
 
-    except ExecutionError as e:
-        error_msg = f"Execution error: {e}"
-        logger.error(error_msg)
+    finally:
+        if fingerprint is not None:
+            _inflight.pop(fingerprint, None)
 
-        task_storage.update_task(task_id, status="failed", error=error_msg)
-        await ws_manager.broadcast_task_complete(task_id, False, error=error_msg)
 
-    except Exception as e:
-        error_msg = f"Unexpected error: {e}"
-        logger.error(error_msg)
+@lru_cache(maxsize=256)
+def _task_payload(task_storage, task_id: str, version: str) -> Optional[bytes]:
+    """Serialized task record, cached per storage version."""
+    task = task_storage.get_task(task_id)
+    return orjson.dumps(task) if task else None
+
+
+@lru_cache(maxsize=32)
+def _task_list_payload(task_storage, status: Optional[str], limit: int, version: str) -> bytes:
+    """Serialized task listing, cached per storage version."""
+    tasks, total = task_storage.list_and_count(status=status, limit=limit)
+
+    return orjson.dumps({
+        "tasks": tasks,
+        "total": total,
+        "filtered": len(tasks)
+    })
 
-        task_storage.update_task(task_id, status="failed", error=error_msg)
-        await ws_manager.broadcast_task_complete(task_id, False, error=error_msg)
+
+def _etag_response(request: Request, payload: bytes, version: str) -> Response:
+    """Return payload with an ETag, or 304 if the client already has it."""
+    etag = f'"{version}"'
+    headers = {"ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @router.get("/{task_id}")
-async def get_task(task_id: str) -> Dict[str, Any]:
+async def get_task(task_id: str, request: Request) -> Response:
     """
     Get task status and result.
 
+    Responses carry an ETag that changes with task storage, and polls
+    sending it back in If-None-Match get 304 Not Modified.
+
     Args:
         task_id: Task identifier
 
@@ -231,22 +498,26 @@ async def get_task(task_id: str) -> Dict[str, Any]:
         Task information
     """
     task_storage = get_task_storage()
-    task = task_storage.get_task(task_id)
+    version = task_storage.version
+    payload = _task_payload(task_storage, task_id, version)
 
-    if not task:
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
 
-    return task
+    return _etag_response(request, payload, version)
 
 
 @router.get("/")
 async def list_tasks(
+    request: Request,
     status: Optional[str] = None,
     limit: int = 50
-) -> Dict[str, Any]:
+) -> Response:
     """
     List recent tasks.
 
+    Responses carry an ETag like get_task().
+
     Args:
         status: Filter by status (queued, running, completed, failed)
         limit: Maximum number of tasks to return
@@ -255,14 +526,10 @@ async def list_tasks(
         List of tasks
     """
     task_storage = get_task_storage()
-    tasks = task_storage.list_tasks(status=status, limit=limit)
-    stats = task_storage.get_stats()
+    version = task_storage.version
+    payload = _task_list_payload(task_storage, status, limit, version)
 
-    return {
-        "tasks": tasks,
-        "total": stats["total"],
-        "filtered": len(tasks)
-    }
+    return _etag_response(request, payload, version)
 
 
 @router.delete("/{task_id}")
@@ -309,8 +576,8 @@ async def clear_tasks(status: Optional[str] = None) -> Dict[str, Any]:
 @router.post("/broadcast")
 async def execute_broadcast_task(
     request: TaskRequest,
-    background_tasks: BackgroundTasks,
-    orchestrator: Orchestrator = Depends(get_orchestrator)
+    orchestrator: Orchestrator = Depends(get_orchestrator),
+    ws_manager: WebSocketManager = Depends(get_ws_manager)
 ) -> Dict[str, Any]:
     """
     Execute a task in broadcast_all mode - sends to ALL available LLMs simultaneously.
@@ -325,32 +592,19 @@ async def execute_broadcast_task(
     """
     try:
         # Validate file paths for security
-        validated_files = request.files
-        if request.files:
-            try:
-                validated_paths = validate_paths(request.files, require_exists=False)
-                validated_files = [str(p) for p in validated_paths]
-            except SecurityError as e:
-                logger.error(f"Security validation failed: {e}")
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Security validation failed: {str(e)}"
-                )
+        validated_files = await _validate_files(request.files)
 
         # Generate task ID
-        task_id = str(uuid.uuid4())
+        task_id = secrets.token_hex(16)
 
         # Get task storage
         task_storage = get_task_storage()
 
         # Add broadcast_all preference
-        preferences = request.preferences or {}
-        preferences["broadcast_all"] = True  # Signal to use broadcast mode
+        preferences = {**(request.preferences or {}), "broadcast_all": True}  # Signal to use broadcast mode
 
         # Classify task to get type
-        from ....core.classifier import TaskClassifier
-        classifier = TaskClassifier()
-        task_info = classifier.classify(request.prompt, validated_files)
+        task_info = orchestrator.classifier.classify(request.prompt, validated_files)
 
         # Store task info with broadcast execution mode
         task_storage.add_task(
@@ -363,14 +617,18 @@ async def execute_broadcast_task(
             execution_mode="broadcast_all"
         )
 
-        # Execute task in background
-        background_tasks.add_task(
+        # Execute task on the worker pool
+        _enqueue(
+            task_id,
             _execute_broadcast_task_background,
             task_id,
             request.prompt,
             request.files,
             preferences,
-            orchestrator
+            orchestrator,
+            ws_manager,
+            task_storage,
+            task_type=task_info.task_type.value
         )
 
         return {
@@ -380,8 +638,10 @@ async def execute_broadcast_task(
             "message": "Task queued for broadcast execution on all available LLMs"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error queuing broadcast task: {e}")
+        logger.error("Error queuing broadcast task: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -390,7 +650,10 @@ async def _execute_broadcast_task_background(
     prompt: str,
     files: Optional[List[str]],
     preferences: Optional[Dict[str, Any]],
-    orchestrator: Orchestrator
+    orchestrator: Orchestrator,
+    ws_manager: WebSocketManager,
+    task_storage,
+    task_type: str = "unknown"
 ):
     """
     Execute task in broadcast_all mode in background.
@@ -401,92 +664,61 @@ async def _execute_broadcast_task_background(
         files: Optional file paths
         preferences: Routing preferences (should include broadcast_all=True)
         orchestrator: Orchestrator instance
+        ws_manager: WebSocket manager resolved by the route
+        task_storage: Task storage the task was stored in
+        task_type: Task type the task was stored with
     """
-    import json
-    from ..main import get_ws_manager
-    from ....core.classifier import TaskClassifier
-
-    ws_manager = get_ws_manager()
-    task_storage = get_task_storage()
 
     try:
         # Update status to running
+        start = time.monotonic()
         task_storage.update_task(task_id, status="running")
 
-        # Get task info
-        task = task_storage.get_task(task_id)
-        task_type = task.get("task_type", "unknown")
-
         # Broadcast task start
         await ws_manager.broadcast_task_start(task_id, task_type, "broadcast_all")
 
-        # Classify task to get routing decision
-        classifier = TaskClassifier()
-        task_info = classifier.classify(prompt, files)
+        # Classify task to get routing decision, reusing the orchestrator's
+        # classifier and router instead of building them (and reloading the
+        # config file) per task
+        task_info = orchestrator.classifier.classify(prompt, files)
 
         # Get broadcast routing decision
-        from ....core.router import TaskRouter
-        from ....config.loader import load_config
-        config = load_config()
-        router = TaskRouter(config, service_health_checker=orchestrator._check_service_health)
-        decision = await router.route_broadcast_all(task_info)
+        decision = await orchestrator.router.route_broadcast_all(task_info)
 
         # Log broadcast info
         logger.info(
-            f"Broadcasting task {task_id} to {len(decision.broadcast_services)} services: "
-            f"{', '.join(decision.broadcast_services)}"
+            "Broadcasting task %s to %d services: %s",
+            task_id, len(decision.broadcast_services), ", ".join(decision.broadcast_services)
         )
 
-        # Execute with broadcast_all routing
-        chunks = []
-        service_responses = {}
-
-        async for chunk in orchestrator.execute_task(prompt, files, preferences):
-            chunks.append(chunk)
-
-            # Parse JSON chunk and broadcast with service identifier
-            try:
-                chunk_obj = json.loads(chunk)
-                service_name = chunk_obj.get("service")
-
-                await ws_manager.broadcast_task_broadcast_chunk(
-                    task_id=task_id,
-                    service=chunk_obj.get("service", "unknown"),
-                    chunk=chunk_obj.get("chunk", ""),
-                    done=chunk_obj.get("done", False),
-                    timestamp=chunk_obj.get("timestamp", 0),
-                    error=chunk_obj.get("error"),
-                    total_chunks=chunk_obj.get("total_chunks")
-                )
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse broadcast chunk in task {task_id}")
+        # Execute with broadcast_all routing. Results are stored per service
+        # by the orchestrator, so the chunks are only forwarded, not kept.
+        batcher = _broadcast_chunk_batcher(ws_manager, task_id)
+
+        try:
+            async for chunk in orchestrator.execute_task(prompt, files, preferences):
+                # Nothing to forward with no clients connected
+                if not ws_manager.get_connection_count():
+                    continue
+
+                # Parse JSON chunk and broadcast with service identifier
+                try:
+                    chunk_obj = orjson.loads(chunk)
+                    await _forward_broadcast_chunk(batcher, ws_manager, task_id, chunk_obj)
+                except orjson.JSONDecodeError:
+                    logger.warning("Failed to parse broadcast chunk in task %s", task_id)
+        finally:
+            await batcher.close()
 
         # Update task as completed
         task_storage.update_task(task_id, status="completed")
 
-        # Get updated task for duration
-        updated_task = task_storage.get_task(task_id)
-        duration = updated_task.get("duration", 0)
-
-        # Broadcast completion
+        # Broadcast completion, timed in-process rather than re-read from storage
+        duration = time.monotonic() - start
         await ws_manager.broadcast_task_complete(task_id, True, duration)
 
-    except NoServiceAvailableError as e:
-        error_msg = f"No service available: {e}"
-        logger.error(error_msg)
-
-        task_storage.update_task(task_id, status="failed", error=error_msg)
-        await ws_manager.broadcast_task_complete(task_id, False, error=error_msg)
-
-    except ExecutionError as e:
-        error_msg = f"Execution error: {e}"
-        logger.error(error_msg)
-
-        task_storage.update_task(task_id, status="failed", error=error_msg)
-        await ws_manager.broadcast_task_complete(task_id, False, error=error_msg)
-
     except Exception as e:
-        error_msg = f"Unexpected error: {e}"
+        error_msg = _error_message(e)
         logger.error(error_msg)
 
         task_storage.update_task(task_id, status="failed", error=error_msg)
@@ -4,12 +4,25 @@ WebSocket manager for real-time updates.
 Handles WebSocket connections and broadcasts events to connected clients.
 """
 import asyncio
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
 from fastapi import WebSocket
-import json
 
 from ...utils.logging import logger
 
+__all__ = ["WebSocketManager"]
+
+
+def _dumps(message: Dict[str, Any]) -> str:
+    """Encode a message as a JSON text frame with orjson."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Fixed-content frames are encoded once at import
+_PING_FRAME = _dumps({"type": "ping"})
+
 
 class WebSocketManager:
     """
@@ -21,24 +34,49 @@ class WebSocketManager:
     - Broadcast rate limiting
     - Connection health monitoring
     - Memory-efficient message batching
+    - Per-connection outbox queues so broadcasters never wait on sockets
 
     Performance optimizations:
     - Set data structure for O(1) add/remove
     - Connection limit to prevent resource exhaustion
-    - Dead connection cleanup during broadcasts
+    - Dead connection cleanup during broadcasts and periodic ping sweeps
     """
 
-    def __init__(self, max_connections: int = 100, max_message_queue: int = 1000):
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_message_queue: int = 1000,
+        send_timeout: float = 0.5,
+        sweep_interval: float = 30.0
+    ):
         """
         Initialize WebSocket manager with connection pooling.
 
         Args:
             max_connections: Maximum number of concurrent connections
-            max_message_queue: Maximum queued messages per connection
+            max_message_queue: Maximum queued messages per connection; a
+                client whose outbox fills up is dropped
+            send_timeout: Seconds a writer waits on one send before treating
+                the client as stalled and dropping it
+            sweep_interval: Seconds between health pings that prune dead
+                connections when no other broadcast is happening
         """
         self.active_connections: set[WebSocket] = set()  # O(1) add/remove with set
         self.max_connections = max_connections
         self.max_message_queue = max_message_queue
+        self.send_timeout = send_timeout
+        self.sweep_interval = sweep_interval
+        self._sweeper: Optional[asyncio.Task] = None
+        # Outbox queue and writer task for each connection, created on first send
+        self._outboxes: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
+        # Hash of the last status/metrics payload sent, keyed by stream
+        self._last_hash: Dict[str, int] = {}
+        # Welcome frame minus the closing brace; only active_clients varies
+        self._welcome_prefix = _dumps({
+            "type": "connected",
+            "message": "Connected to Oxide WebSocket",
+            "max_clients": max_connections
+        })[:-1]
         self.logger = logger.getChild("websocket")
         self.total_connections = 0  # Counter for monitoring
         self.rejected_connections = 0
@@ -57,8 +95,8 @@ class WebSocketManager:
         if len(self.active_connections) >= self.max_connections:
             self.rejected_connections += 1
             self.logger.warning(
-                f"Connection rejected: limit reached ({self.max_connections}). "
-                f"Total rejected: {self.rejected_connections}"
+                "Connection rejected: limit reached (%d). Total rejected: %d",
+                self.max_connections, self.rejected_connections
             )
             await websocket.close(
                 code=1008,  # Policy Violation
@@ -70,21 +108,23 @@ class WebSocketManager:
         await websocket.accept()
         self.active_connections.add(websocket)
         self.total_connections += 1
+        self._last_hash.clear()  # New client needs the current status/metrics
+
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._health_sweeper())
 
         self.logger.info(
-            f"New WebSocket connection. Active: {len(self.active_connections)}/{self.max_connections}"
+            "New WebSocket connection. Active: %d/%d",
+            len(self.active_connections), self.max_connections
         )
 
         # Send welcome message
         try:
-            await websocket.send_json({
-                "type": "connected",
-                "message": "Connected to Oxide WebSocket",
-                "active_clients": len(self.active_connections),
-                "max_clients": self.max_connections
-            })
+            await websocket.send_text(
+                f'{self._welcome_prefix},"active_clients":{len(self.active_connections)}}}'
+            )
         except Exception as e:
-            self.logger.error(f"Error sending welcome message: {e}")
+            self.logger.error("Error sending welcome message: %s", e)
             self.disconnect(websocket)
             return False
 
@@ -97,11 +137,19 @@ class WebSocketManager:
         Args:
             websocket: WebSocket connection to remove
         """
-        self.active_connections.discard(websocket)  # discard doesn't raise if not found
+        self._drop(websocket)
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox is not None:
+            outbox[1].cancel()
         self.logger.debug(
-            f"WebSocket disconnected. Active: {len(self.active_connections)}/{self.max_connections}"
+            "WebSocket disconnected. Active: %d/%d",
+            len(self.active_connections), self.max_connections
         )
 
+    def _drop(self, websocket: WebSocket):
+        """Forget a connection without cancelling its writer."""
+        self.active_connections.discard(websocket)  # discard doesn't raise if not found
+
     async def send_personal(self, message: Dict[str, Any], websocket: WebSocket):
         """
         Send message to a specific client.
@@ -111,45 +159,133 @@ class WebSocketManager:
             websocket: Target WebSocket connection
         """
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(_dumps(message))
         except Exception as e:
-            self.logger.error(f"Error sending personal message: {e}")
+            self.logger.error("Error sending personal message: %s", e)
 
     async def broadcast(self, message: Dict[str, Any]):
         """
         Broadcast message to all connected clients with automatic cleanup.
 
-        Dead connections are automatically detected and removed during broadcast.
+        The message is serialized once (and not at all when nobody is
+        connected) and the same text frame is queued for every client.
 
         Args:
             message: Message to broadcast
         """
-        if not self.active_connections:
-            return  # Early exit if no connections
+        if self.active_connections:
+            await self.broadcast_raw(_dumps(message))
+
+    async def broadcast_raw(self, payload: str):
+        """
+        Broadcast an already-encoded JSON text frame with automatic cleanup.
 
-        disconnected = set()
+        The frame is only put on each client's outbox; per-connection writer
+        tasks do the actual sends, so a slow client never holds up the
+        caller or the other clients. A client whose outbox is full is
+        closed and removed.
 
-        # Use asyncio.gather for parallel sends (more efficient)
-        async def send_to_client(connection: WebSocket):
+        Args:
+            payload: JSON text frame to send
+        """
+        # Snapshot once: connect/disconnect may run while evictions are awaited
+        conns = tuple(self.active_connections)
+        if not conns:
+            return  # Early exit if no connections
+
+        overflowed = []
+        for connection in conns:
             try:
-                await connection.send_json(message)
-            except Exception as e:
-                self.logger.debug(f"Connection failed during broadcast: {e}")
-                disconnected.add(connection)
-
-        # Send to all clients in parallel
-        await asyncio.gather(
-            *[send_to_client(conn) for conn in self.active_connections],
-            return_exceptions=True
-        )
+                self._outbox(connection).put_nowait(payload)
+            except asyncio.QueueFull:
+                overflowed.append(connection)
 
-        # Remove disconnected clients (O(n) where n = disconnected)
-        if disconnected:
-            self.active_connections -= disconnected
-            self.logger.info(
-                f"Cleaned up {len(disconnected)} dead connections. "
-                f"Active: {len(self.active_connections)}"
+        if overflowed:
+            for connection in overflowed:
+                self.disconnect(connection)
+            self.logger.warning(
+                "Dropped %d WebSocket clients with full outboxes (%d messages). Active: %d",
+                len(overflowed), self.max_message_queue, len(self.active_connections)
             )
+            await asyncio.gather(*map(self._close_quietly, overflowed))
+
+    async def drain(self):
+        """Wait until every queued frame has been sent or dropped."""
+        queues = [queue for queue, _ in self._outboxes.values()]
+        if queues:
+            await asyncio.gather(*(queue.join() for queue in queues))
+
+    def _outbox(self, websocket: WebSocket) -> asyncio.Queue:
+        """Get a connection's outbox, starting its writer on first use."""
+        outbox = self._outboxes.get(websocket)
+        if outbox is None:
+            queue = asyncio.Queue(maxsize=self.max_message_queue)
+            writer = asyncio.create_task(self._writer(websocket, queue))
+            outbox = self._outboxes[websocket] = (queue, writer)
+        return outbox[0]
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        Send queued frames to one client until it fails or is disconnected.
+
+        Args:
+            websocket: Connection to write to
+            queue: Outbox of encoded frames for this connection
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                try:
+                    await asyncio.wait_for(websocket.send_text(payload), timeout=self.send_timeout)
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        "Dropping WebSocket client: send exceeded %ss", self.send_timeout
+                    )
+                    self._drop(websocket)
+                    await self._close_quietly(websocket)
+                    return
+                except Exception as e:
+                    self.logger.debug("Connection failed during broadcast: %s", e)
+                    self._drop(websocket)
+                    return
+                finally:
+                    queue.task_done()
+        finally:
+            if self._outboxes.get(websocket, (None,))[0] is queue:
+                del self._outboxes[websocket]
+            # Release drain() waiters for frames this writer will never send
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+
+    async def _close_quietly(self, websocket: WebSocket, **close_kwargs):
+        """
+        Close a client within send_timeout, ignoring errors.
+
+        Never raises, so callers can run closes side by side without
+        exception handling.
+
+        Args:
+            websocket: Connection to close
+            **close_kwargs: Passed to websocket.close (default code 1011)
+        """
+        close_kwargs.setdefault("code", 1011)  # Internal Error
+        try:
+            await asyncio.wait_for(websocket.close(**close_kwargs), timeout=self.send_timeout)
+        except Exception:
+            pass
+
+    async def _health_sweeper(self):
+        """
+        Periodically ping every client so dead connections are pruned.
+
+        Broadcasts already drop clients that fail or stall, but an idle
+        dashboard may see none for a long time. The ping is a normal JSON
+        text frame, so clients that ignore unknown types are unaffected.
+        """
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self.broadcast_raw(_PING_FRAME)
 
     async def broadcast_task_start(self, task_id: str, task_type: str, service: str):
         """
@@ -165,7 +301,7 @@ class WebSocketManager:
             "task_id": task_id,
             "task_type": task_type,
             "service": service,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic()
         })
 
     async def broadcast_task_progress(
@@ -177,6 +313,10 @@ class WebSocketManager:
         """
         Broadcast task progress/streaming chunk.
 
+        Streaming callers should coalesce tokens before calling this (the
+        task routes send joined batches via _ChunkBatcher), so clients get
+        one frame per batch rather than per token.
+
         Args:
             task_id: Task identifier
             chunk: Response chunk
@@ -218,22 +358,33 @@ class WebSocketManager:
             error: Error message if service failed
             total_chunks: Total number of chunks from this service (if done)
         """
-        message = {
+        await self.broadcast({
             "type": "task_broadcast_chunk",
             "task_id": task_id,
             "service": service,
             "chunk": chunk,
             "done": done,
-            "timestamp": timestamp
-        }
+            "timestamp": timestamp,
+            **({"error": error} if error else {}),
+            **({"total_chunks": total_chunks} if total_chunks is not None else {})
+        })
 
-        if error:
-            message["error"] = error
+    async def forward_task_broadcast_chunk(self, task_id: str, chunk: Dict[str, Any]):
+        """
+        Broadcast a broadcast_all chunk dict without copying it.
 
-        if total_chunks is not None:
-            message["total_chunks"] = total_chunks
+        The chunk already carries the task_broadcast_chunk fields (service,
+        chunk, done, timestamp and optional error/total_chunks), so it is
+        tagged in place and sent as the message itself. Callers hand over
+        ownership of the dict.
 
-        await self.broadcast(message)
+        Args:
+            task_id: Task identifier
+            chunk: Chunk dict from broadcast_all execution
+        """
+        chunk["type"] = "task_broadcast_chunk"
+        chunk["task_id"] = task_id
+        await self.broadcast(chunk)
 
     async def broadcast_task_complete(
         self,
@@ -255,7 +406,7 @@ class WebSocketManager:
             "type": "task_complete",
             "task_id": task_id,
             "success": success,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic()
         }
 
         if duration_seconds is not None:
@@ -266,32 +417,62 @@ class WebSocketManager:
 
         await self.broadcast(message)
 
+    def _unchanged(self, key: str, data: Dict[str, Any]) -> bool:
+        """
+        Check whether data matches the last payload sent for key.
+
+        Records data as the last payload when it differs.
+
+        Args:
+            key: Stream identifier
+            data: Payload about to be broadcast
+
+        Returns:
+            True if the same payload was already sent
+        """
+        h = hash(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS))
+        if self._last_hash.get(key) == h:
+            return True
+        self._last_hash[key] = h
+        return False
+
     async def broadcast_service_status(self, service_name: str, status: Dict[str, Any]):
         """
         Broadcast service status change.
 
+        Skipped when the status is identical to the last one sent for this
+        service, since it is polled on a timer.
+
         Args:
             service_name: Service identifier
             status: Service status information
         """
+        if self._unchanged(f"service_status:{service_name}", status):
+            return
+
         await self.broadcast({
             "type": "service_status",
             "service": service_name,
             "status": status,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic()
         })
 
     async def broadcast_metrics(self, metrics: Dict[str, Any]):
         """
         Broadcast system metrics.
 
+        Skipped when the metrics are identical to the last ones sent.
+
         Args:
             metrics: System metrics data
         """
+        if self._unchanged("metrics", metrics):
+            return
+
         await self.broadcast({
             "type": "metrics",
             "data": metrics,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic()
         })
 
     def get_connection_count(self) -> int:
@@ -304,15 +485,24 @@ class WebSocketManager:
 
         Used during application shutdown.
         """
-        self.logger.info(f"Closing {len(self.active_connections)} WebSocket connections...")
-
-        close_tasks = [
-            conn.close(code=1001, reason="Server shutting down")
-            for conn in self.active_connections
-        ]
-
-        if close_tasks:
-            await asyncio.gather(*close_tasks, return_exceptions=True)
+        self.logger.info("Closing %d WebSocket connections...", len(self.active_connections))
+
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+        for _, writer in self._outboxes.values():
+            writer.cancel()
+        self._outboxes.clear()
+
+        # Closes are scheduled as we iterate rather than collected up front;
+        # each is bounded and never raises, so a stalled client cannot hold
+        # up shutdown or cancel the others
+        async with asyncio.TaskGroup() as tg:
+            for conn in tuple(self.active_connections):
+                tg.create_task(
+                    self._close_quietly(conn, code=1001, reason="Server shutting down")
+                )
 
         self.active_connections.clear()
         self.logger.info("All WebSocket connections closed")
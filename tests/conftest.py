@@ -8,21 +8,35 @@ This module provides common fixtures used across all test suites including:
 - Mock HTTP sessions
 - FastAPI test clients
 """
-import asyncio
+import importlib
 import json
+import uuid
 from pathlib import Path
-from typing import Dict, Any, List, AsyncIterator
+from typing import Dict, Any, List, AsyncIterator, Optional
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+import respx
 from fastapi.testclient import TestClient
 
+from oxide.config.loader import Config, ServiceConfig, RoutingRuleConfig, LoggingConfig, ExecutionConfig
+from oxide.core.orchestrator import Orchestrator
+from oxide.utils import task_storage as task_storage_module
+from oxide.utils.task_storage import MemoryTaskStorage, TaskStorage
+from oxide.web.backend.main import app, set_orchestrator
+from oxide.web.backend.routes import machines, monitoring, services, tasks
+
 # Configuration Fixtures
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config_dict() -> Dict[str, Any]:
-    """Provide a complete mock configuration dictionary."""
+    """
+    Provide a complete mock configuration dictionary.
+
+    Built once per session and shared, so treat it as read-only; tests
+    that need to change configuration should modify mock_config instead.
+    """
     return {
         "logging": {
             "level": "INFO",
@@ -86,23 +100,20 @@ def mock_config_dict() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
-def mock_config(mock_config_dict):
-    """Provide a mock Config object."""
-    from oxide.config.loader import Config, ServiceConfig, RoutingRuleConfig, LoggingConfig, ExecutionConfig
-
+def _build_config(config_dict: Dict[str, Any]):
+    """Build a Config from a configuration dictionary."""
     # Create config objects from dict
-    logging_config = LoggingConfig(**mock_config_dict["logging"])
-    execution_config = ExecutionConfig(**mock_config_dict["execution"])
+    logging_config = LoggingConfig(**config_dict["logging"])
+    execution_config = ExecutionConfig(**config_dict["execution"])
 
     services = {
         name: ServiceConfig(**svc_data)
-        for name, svc_data in mock_config_dict["services"].items()
+        for name, svc_data in config_dict["services"].items()
     }
 
     routing_rules = {
         name: RoutingRuleConfig(**rule_data)
-        for name, rule_data in mock_config_dict["routing_rules"].items()
+        for name, rule_data in config_dict["routing_rules"].items()
     }
 
     return Config(
@@ -113,6 +124,28 @@ def mock_config(mock_config_dict):
     )
 
 
+@pytest.fixture
+def mock_config(mock_config_dict):
+    """
+    Provide a mock Config object.
+
+    Rebuilt per test from the shared dict; constructing the models is
+    cheaper than deep-copying a cached Config.
+    """
+    return _build_config(mock_config_dict)
+
+
+@pytest.fixture(scope="session")
+def shared_config(mock_config_dict):
+    """
+    Provide one Config shared by the whole session.
+
+    For tests whose code under test only reads its config; anything that
+    may modify the config must use mock_config.
+    """
+    return _build_config(mock_config_dict)
+
+
 # Task and Classification Fixtures
 
 
@@ -131,9 +164,14 @@ def sample_prompts() -> Dict[str, str]:
     }
 
 
-@pytest.fixture
-def sample_task_files(tmp_path: Path) -> List[str]:
-    """Create sample files for testing."""
+@pytest.fixture(scope="session")
+def sample_task_files(tmp_path_factory) -> List[str]:
+    """
+    Create sample files for testing.
+
+    Written once per session; tests only read them.
+    """
+    tmp_path = tmp_path_factory.mktemp("sample_files")
     files = []
 
     # Create a few sample code files
@@ -149,16 +187,21 @@ def function_{i}():
     return files
 
 
-@pytest.fixture
-def large_file_set(tmp_path: Path) -> List[str]:
-    """Create a large set of files for codebase analysis tests."""
+@pytest.fixture(scope="session")
+def large_file_set(tmp_path_factory) -> List[str]:
+    """
+    Create a large set of files for codebase analysis tests.
+
+    Written once per session; tests only read them.
+    """
+    tmp_path = tmp_path_factory.mktemp("large_set")
     files = []
 
     # Create 25 files to trigger large codebase detection
+    body = ("def func(): pass\n" * 50).encode()
     for i in range(25):
         file_path = tmp_path / f"module_{i}.py"
-        content = f"# Module {i}\n" + ("def func(): pass\n" * 50)
-        file_path.write_text(content)
+        file_path.write_bytes(b"# Module %d\n%s" % (i, body))
         files.append(str(file_path))
 
     return files
@@ -167,12 +210,8 @@ def large_file_set(tmp_path: Path) -> List[str]:
 # Adapter Fixtures
 
 
-@pytest.fixture
-def mock_base_adapter():
-    """Provide a mock BaseAdapter."""
-    from oxide.adapters.base import BaseAdapter
-
-    adapter = MagicMock(spec=BaseAdapter)
+def _configure_mock_adapter(adapter):
+    """Set the BaseAdapter attributes and methods tests rely on."""
     adapter.service_name = "mock_adapter"
     adapter.config = {"type": "mock", "enabled": True}
 
@@ -199,27 +238,53 @@ def mock_base_adapter():
 
 
 @pytest.fixture
-def mock_subprocess_process():
-    """Provide a mock subprocess process for CLI adapter tests."""
-    process = AsyncMock()
-    process.pid = 12345
-    process.returncode = 0
+def mock_base_adapter():
+    """
+    Provide a mock BaseAdapter.
+
+    A plain Mock with the adapter interface filled in; spec'd mocks
+    introspect the class on every construction.
+    """
+    return _configure_mock_adapter(Mock())
+
 
-    # Mock stdout
-    stdout = AsyncMock()
-    stdout.readline = AsyncMock(side_effect=[b"Test output\n", b""])
-    process.stdout = stdout
+class _FakeStream:
+    """Async byte stream replaying fixed chunks, then EOF."""
 
-    # Mock stderr
-    stderr = AsyncMock()
-    process.stderr = stderr
+    def __init__(self, chunks=()):
+        self._chunks = iter(chunks)
 
-    async def mock_wait():
-        return 0
+    async def readline(self) -> bytes:
+        return next(self._chunks, b"")
 
-    process.wait = mock_wait
+    async def read(self, n: int = -1) -> bytes:
+        return b"".join(self._chunks)
 
-    return process
+
+class _FakeProcess:
+    """Minimal stand-in for asyncio.subprocess.Process.
+
+    Plain coroutines instead of an AsyncMock chain: no call recording or
+    attribute auto-creation, so every awaited call is a cheap native await.
+    """
+
+    def __init__(self, stdout_lines=(), returncode: int = 0, pid: int = 12345):
+        self.pid = pid
+        self.returncode = returncode
+        self.stdout = _FakeStream(stdout_lines)
+        self.stderr = _FakeStream()
+
+    async def wait(self) -> int:
+        return self.returncode
+
+    def kill(self) -> None:
+        pass
+
+
+@pytest.fixture
+def mock_subprocess_process():
+    """Provide a fake subprocess process for CLI adapter tests."""
+    return _FakeProcess(stdout_lines=[b"Test output\n", b""])
 
 
 @pytest.fixture
@@ -246,9 +311,7 @@ def mock_aiohttp_response():
 @pytest.fixture
 def mock_service_manager():
     """Provide a mock ServiceManager."""
-    from oxide.utils.service_manager import ServiceManager
-
-    manager = MagicMock(spec=ServiceManager)
+    manager = Mock()
 
     async def mock_ensure_ollama_running(base_url="http://localhost:11434", **kwargs):
         return True
@@ -279,12 +342,47 @@ def mock_service_manager():
 
 
 @pytest.fixture
-def temp_task_storage(tmp_path: Path):
-    """Provide an isolated TaskStorage instance for testing."""
-    from oxide.utils.task_storage import TaskStorage
+def temp_task_storage(tmp_path: Path, monkeypatch):
+    """
+    Provide an isolated TaskStorage instance for testing.
+
+    Installed as the global task storage, so routes calling
+    get_task_storage() read and write it too.
+    """
+    storage = TaskStorage(storage_path=tmp_path / "test_tasks.json")
+    monkeypatch.setattr("oxide.utils.task_storage._task_storage", storage)
+    return storage
 
-    storage_file = tmp_path / "test_tasks.json"
-    return TaskStorage(storage_path=storage_file)
+
+@pytest.fixture
+def nodb_task_storage(monkeypatch):
+    """
+    Provide an in-memory TaskStorage for tests that never inspect the file.
+
+    Installed as the global task storage, so routes calling
+    get_task_storage() read and write it too.
+    """
+    storage = MemoryTaskStorage()
+    monkeypatch.setattr("oxide.utils.task_storage._task_storage", storage)
+    return storage
+
+
+@pytest.fixture
+def make_task(temp_task_storage):
+    """
+    Provide a factory that adds one task to temp_task_storage in a single write.
+
+    The factory takes the status (default "completed") plus any
+    add_tasks_bulk spec fields and returns the new task id.
+    """
+    def _make_task(status: Optional[str] = "completed", **fields) -> str:
+        fields.setdefault("task_id", f"task-{uuid.uuid4().hex[:8]}")
+        fields.setdefault("prompt", "test")
+        fields.setdefault("service", "gemini")
+        fields.setdefault("task_type", "quick_query")
+        return temp_task_storage.add_tasks_bulk([{"status": status, **fields}])[0]["id"]
+
+    return _make_task
 
 
 @pytest.fixture
@@ -292,33 +390,35 @@ def populated_task_storage(temp_task_storage):
     """Provide a TaskStorage with sample tasks."""
     storage = temp_task_storage
 
-    # Add various tasks
-    storage.add_task(
-        task_id="task-1",
-        prompt="Test prompt 1",
-        files=[],
-        service="qwen",
-        task_type="quick_query"
-    )
-    storage.update_task("task-1", status="completed", result="Test result 1")
-
-    storage.add_task(
-        task_id="task-2",
-        prompt="Test prompt 2",
-        files=["file1.py"],
-        service="gemini",
-        task_type="code_review"
-    )
-    storage.update_task("task-2", status="running")
-
-    storage.add_task(
-        task_id="task-3",
-        prompt="Test prompt 3",
-        files=[],
-        service="ollama_local",
-        task_type="code_generation"
-    )
-    storage.update_task("task-3", status="failed", error="Service unavailable")
+    # Add various tasks in one write
+    storage.add_tasks_bulk([
+        {
+            "task_id": "task-1",
+            "prompt": "Test prompt 1",
+            "files": [],
+            "service": "qwen",
+            "task_type": "quick_query",
+            "status": "completed",
+            "result": "Test result 1"
+        },
+        {
+            "task_id": "task-2",
+            "prompt": "Test prompt 2",
+            "files": ["file1.py"],
+            "service": "gemini",
+            "task_type": "code_review",
+            "status": "running"
+        },
+        {
+            "task_id": "task-3",
+            "prompt": "Test prompt 3",
+            "files": [],
+            "service": "ollama_local",
+            "task_type": "code_generation",
+            "status": "failed",
+            "error": "Service unavailable"
+        }
+    ])
 
     return storage
 
@@ -329,8 +429,6 @@ def populated_task_storage(temp_task_storage):
 @pytest.fixture
 def mock_orchestrator(mock_config, mock_base_adapter):
     """Provide a mock Orchestrator."""
-    from oxide.core.orchestrator import Orchestrator
-
     with patch('oxide.core.orchestrator.TaskClassifier'), \
          patch('oxide.core.orchestrator.TaskRouter'), \
          patch('oxide.core.orchestrator.get_context_memory'), \
@@ -349,25 +447,55 @@ def mock_orchestrator(mock_config, mock_base_adapter):
 # FastAPI Test Client Fixtures
 
 
-@pytest.fixture
-def api_client(mock_orchestrator, temp_task_storage, mock_websocket_manager):
-    """Provide FastAPI TestClient with mocked dependencies."""
-    from oxide.web.backend.main import app, set_orchestrator
-    import oxide.web.backend.main as main_module
+@pytest.fixture(scope="session")
+def api_test_client():
+    """Provide one FastAPI TestClient for the whole session."""
+    return TestClient(app)
 
-    # Inject mocked orchestrator
-    set_orchestrator(mock_orchestrator)
 
-    # Inject mocked WebSocket manager
-    main_module.ws_manager = mock_websocket_manager
+@pytest.fixture
+def api_client(request, api_test_client, mock_websocket_manager, monkeypatch):
+    """
+    Provide the shared FastAPI TestClient with mocked dependencies.
+
+    Mocks are swapped in per test through app state and
+    dependency_overrides, and removed again afterwards. The mock
+    orchestrator is only built once a route actually depends on it, so
+    tests that never reach the orchestrator skip its construction.
+
+    Routes use whichever storage fixture the test requests
+    (temp_task_storage, nodb_task_storage, ...); without one they get an
+    empty in-memory storage rather than the real ~/.oxide data.
+    """
+    app = api_test_client.app
+
+    if task_storage_module._task_storage is None:
+        monkeypatch.setattr(task_storage_module, "_task_storage", MemoryTaskStorage())
+
+    def lazy_orchestrator():
+        # Cached per test, so this returns the same instance the test sees
+        orchestrator = request.getfixturevalue("mock_orchestrator")
+        set_orchestrator(app, orchestrator)
+        return orchestrator
+
+    # Inject mocked orchestrator and WebSocket manager
+    set_orchestrator(app, None)
+    app.state.oxide.ws_manager = mock_websocket_manager
+    # The app outlives the test, so start from an empty metrics cache
+    app.state.oxide.metrics_cache.clear()
 
-    # Create test client
-    client = TestClient(app)
+    for routes in (machines, monitoring, services, tasks):
+        app.dependency_overrides[routes.get_orchestrator] = lazy_orchestrator
+    for routes in (monitoring, tasks):
+        app.dependency_overrides[routes.get_ws_manager] = lambda: mock_websocket_manager
 
-    yield client
+    yield api_test_client
 
     # Cleanup
-    main_module.ws_manager = None
+    app.dependency_overrides.clear()
+    app.state.oxide.orchestrator = None
+    app.state.oxide.ws_manager = None
+    app.state.oxide.metrics_cache.clear()
 
 
 # Memory and Analytics Fixtures
@@ -376,13 +504,11 @@ def api_client(mock_orchestrator, temp_task_storage, mock_websocket_manager):
 @pytest.fixture
 def mock_context_memory():
     """Provide a mock ContextMemory."""
-    from oxide.memory.context_memory import ContextMemory
-
-    memory = MagicMock(spec=ContextMemory)
+    memory = Mock()
 
-    memory.add_context = MagicMock(return_value=None)
-    memory.get_context_for_task = MagicMock(return_value=[])
-    memory.clear_conversation = MagicMock(return_value=None)
+    memory.add_context = Mock(return_value=None)
+    memory.get_context_for_task = Mock(return_value=[])
+    memory.clear_conversation = Mock(return_value=None)
 
     return memory
 
@@ -390,13 +516,11 @@ def mock_context_memory():
 @pytest.fixture
 def mock_cost_tracker():
     """Provide a mock CostTracker."""
-    from oxide.analytics.cost_tracker import CostTracker
+    tracker = Mock()
 
-    tracker = MagicMock(spec=CostTracker)
-
-    tracker.record_cost = MagicMock(return_value=None)
-    tracker.get_total_cost = MagicMock(return_value=0.0)
-    tracker.get_cost_by_service = MagicMock(return_value={})
+    tracker.record_cost = Mock(return_value=None)
+    tracker.get_total_cost = Mock(return_value=0.0)
+    tracker.get_cost_by_service = Mock(return_value={})
 
     return tracker
 
@@ -415,30 +539,29 @@ def mock_logger():
     return logger
 
 
+def _singleton_slots():
+    """Collect the (module, attribute) pairs holding global singletons."""
+    slots = []
+    for module_name, attr in (
+        ("oxide.utils.task_storage", "_task_storage"),
+        ("oxide.utils.service_manager", "_service_manager"),
+        ("oxide.analytics.cost_tracker", "_cost_tracker"),
+        ("oxide.memory.context_memory", "_context_memory"),
+    ):
+        module = importlib.import_module(module_name)
+        if hasattr(module, attr):
+            slots.append((module, attr))
+    return slots
+
+
+_SINGLETONS = _singleton_slots()
+
+
 @pytest.fixture(autouse=True)
 def reset_singletons():
     """Reset singleton instances between tests."""
-    # Reset task storage singleton
-    import oxide.utils.task_storage as task_storage_module
-    task_storage_module._task_storage = None
-
-    # Reset service manager singleton
-    import oxide.utils.service_manager as service_manager_module
-    service_manager_module._service_manager = None
-
-    # Reset cost tracker singleton
-    try:
-        import oxide.analytics.cost_tracker as cost_tracker_module
-        cost_tracker_module._cost_tracker = None
-    except AttributeError:
-        pass
-
-    # Reset context memory singleton
-    try:
-        import oxide.memory.context_memory as context_memory_module
-        context_memory_module._context_memory = None
-    except AttributeError:
-        pass
+    for module, attr in _SINGLETONS:
+        setattr(module, attr, None)
 
     yield
 
@@ -455,34 +578,33 @@ def mock_platform(monkeypatch):
     return _mock_platform
 
 
-# Async Helper Fixtures
+# HTTP Mocking Fixtures (for integration tests)
 
 
-@pytest.fixture
-def event_loop():
-    """Provide a fresh event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session")
+def ollama_api_router():
+    """Build the mocked Ollama API routes once per session."""
+    router = respx.mock(base_url="http://localhost:11434", assert_all_called=False)
 
+    # Mock health check
+    router.get("/api/tags").respond(json={"models": [{"name": "qwen2.5-coder:7b"}]})
 
-# HTTP Mocking Fixtures (for integration tests)
+    # Mock generate endpoint
+    router.post("/api/generate").respond(json={"response": "Mock response", "done": True})
 
+    return router
 
-@pytest.fixture
-def mock_ollama_api(respx_mock):
-    """Mock Ollama API endpoints."""
-    # Mock health check
-    respx_mock.get("http://localhost:11434/api/tags").mock(
-        return_value={"models": [{"name": "qwen2.5-coder:7b"}]}
-    )
 
-    # Mock generate endpoint
-    respx_mock.post("http://localhost:11434/api/generate").mock(
-        return_value={"response": "Mock response", "done": True}
-    )
+@pytest.fixture
+def mock_ollama_api(ollama_api_router):
+    """
+    Mock Ollama API endpoints.
 
-    return respx_mock
+    Activates the session router for this test only; leaving it clears the
+    recorded calls but keeps the routes.
+    """
+    with ollama_api_router:
+        yield ollama_api_router
 
 
 # File System Fixtures
@@ -498,50 +620,50 @@ def mock_file_system(fs):
     return fs
 
 
-# Test Data Fixtures
+# WebSocket Fixtures
 
 
-@pytest.fixture
-def sample_config_yaml(tmp_path: Path) -> Path:
-    """Create a sample config YAML file."""
-    config_file = tmp_path / "config.yaml"
-    config_content = """
-logging:
-  level: INFO
-  console: true
-
-execution:
-  timeout_seconds: 120
-  max_retries: 2
-
-services:
-  gemini:
-    type: cli
-    executable: gemini
-    enabled: true
-
-routing_rules:
-  quick_query:
-    primary: ollama_local
-    fallback: []
-"""
-    config_file.write_text(config_content)
-    return config_file
+class _FakeWebSocketManager:
+    """Minimal stand-in for WebSocketManager whose broadcasts are no-ops.
 
+    Set ``connections`` to control what get_connection_count() reports.
+    """
 
-# WebSocket Fixtures
+    def __init__(self, connections: int = 0):
+        self.connections = connections
 
+    def get_connection_count(self) -> int:
+        return self.connections
 
-@pytest.fixture
-def mock_websocket_manager():
-    """Provide a mock WebSocketManager."""
-    manager = MagicMock()
+    async def broadcast(self, message: Dict[str, Any]) -> None:
+        pass
 
-    async def mock_broadcast(*args, **kwargs):
+    async def broadcast_raw(self, payload: str) -> None:
         pass
 
-    manager.broadcast_task_start = mock_broadcast
-    manager.broadcast_task_progress = mock_broadcast
-    manager.broadcast_task_complete = mock_broadcast
+    async def broadcast_task_start(self, task_id: str, task_type: str, service: str) -> None:
+        pass
 
-    return manager
+    async def broadcast_task_progress(self, task_id: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def broadcast_task_broadcast_chunk(self, task_id: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def forward_task_broadcast_chunk(self, task_id: str, chunk: Dict[str, Any]) -> None:
+        pass
+
+    async def broadcast_task_complete(self, task_id: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def broadcast_service_status(self, service_name: str, status: Dict[str, Any]) -> None:
+        pass
+
+    async def broadcast_metrics(self, metrics: Dict[str, Any]) -> None:
+        pass
+
+
+@pytest.fixture
+def mock_websocket_manager():
+    """Provide a fake WebSocketManager with no-op broadcasts."""
+    return _FakeWebSocketManager()
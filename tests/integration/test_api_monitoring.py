@@ -7,13 +7,23 @@ Tests all endpoints in src/oxide/web/backend/routes/monitoring.py including:
 - GET /api/monitoring/health - System health check
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+@contextmanager
+def _psutil(cpu: float, mem: float):
+    """Patch psutil to report the given CPU and memory usage percentages."""
+    with patch('psutil.cpu_percent', return_value=cpu), \
+         patch('psutil.virtual_memory', return_value=SimpleNamespace(percent=mem)):
+        yield
 
 
 class TestMonitoringAPI:
     """Test suite for Monitoring API endpoints."""
 
-    def test_get_metrics_success(self, api_client, mock_orchestrator, populated_task_storage):
+    def test_get_metrics_success(self, api_client, mock_orchestrator, mock_websocket_manager, populated_task_storage):
         """Test getting system metrics."""
         # Mock service status
         async def mock_status():
@@ -25,13 +35,9 @@ class TestMonitoringAPI:
 
         mock_orchestrator.get_service_status = mock_status
 
-        # Mock WebSocket manager
-        with patch('oxide.web.backend.routes.monitoring.get_ws_manager') as mock_ws:
-            ws_manager = MagicMock()
-            ws_manager.get_connection_count.return_value = 5
-            mock_ws.return_value = ws_manager
+        mock_websocket_manager.connections = 5
 
-            response = api_client.get("/api/monitoring/metrics")
+        response = api_client.get("/api/monitoring/metrics")
 
         assert response.status_code == 200
         data = response.json()
@@ -98,7 +104,7 @@ class TestMonitoringAPI:
         assert data["tasks_by_status"]["running"] == 1
         assert data["tasks_by_status"]["failed"] == 1
 
-    def test_get_stats_no_tasks(self, api_client, temp_task_storage):
+    def test_get_stats_no_tasks(self, api_client, nodb_task_storage):
         """Test getting statistics with no tasks."""
         response = api_client.get("/api/monitoring/stats")
 
@@ -110,18 +116,11 @@ class TestMonitoringAPI:
         assert data["success_rate"] == 0
         assert data["tasks_by_status"] == {}
 
-    def test_get_stats_success_rate_calculation(self, api_client, temp_task_storage):
+    def test_get_stats_success_rate_calculation(self, api_client, make_task):
         """Test that success rate is calculated correctly."""
-        storage = temp_task_storage
-
         # Add 7 completed and 3 failed tasks
-        for i in range(7):
-            storage.add_task(f"task-{i}", "test", [], "gemini", "quick_query")
-            storage.update_task(f"task-{i}", status="completed")
-
-        for i in range(7, 10):
-            storage.add_task(f"task-{i}", "test", [], "gemini", "quick_query")
-            storage.update_task(f"task-{i}", status="failed")
+        for i in range(10):
+            make_task(status="completed" if i < 7 else "failed")
 
         response = api_client.get("/api/monitoring/stats")
 
@@ -133,80 +132,26 @@ class TestMonitoringAPI:
         assert data["failed"] == 3
         assert data["success_rate"] == 70.0
 
-    def test_health_check_healthy(self, api_client):
-        """Test health check when system is healthy."""
-        with patch('psutil.cpu_percent', return_value=50.0), \
-             patch('psutil.virtual_memory') as mock_memory:
-
-            # Mock memory with safe values
-            memory = MagicMock()
-            memory.percent = 60.0
-            mock_memory.return_value = memory
-
+    @pytest.mark.parametrize("cpu,mem,expected_status,expected_issues", [
+        (50.0, 60.0, "healthy", []),
+        (95.0, 50.0, "degraded", ["High CPU usage"]),
+        (50.0, 95.0, "degraded", ["High memory usage"]),
+        (95.0, 95.0, "degraded", ["High CPU usage", "High memory usage"]),
+    ], ids=["healthy", "high_cpu", "high_memory", "multiple_issues"])
+    def test_health_check_thresholds(self, api_client, cpu, mem, expected_status, expected_issues):
+        """Test health check status and issues across CPU/memory thresholds."""
+        with _psutil(cpu, mem):
             response = api_client.get("/api/monitoring/health")
 
         assert response.status_code == 200
         data = response.json()
 
-        assert data["status"] == "healthy"
-        assert data["healthy"] is True
-        assert data["issues"] == []
+        assert data["status"] == expected_status
+        assert data["healthy"] is (expected_status == "healthy")
+        assert data["issues"] == expected_issues
         assert "cpu_percent" in data
         assert "memory_percent" in data
 
-    def test_health_check_high_cpu(self, api_client):
-        """Test health check with high CPU usage."""
-        with patch('psutil.cpu_percent', return_value=95.0), \
-             patch('psutil.virtual_memory') as mock_memory:
-
-            memory = MagicMock()
-            memory.percent = 50.0
-            mock_memory.return_value = memory
-
-            response = api_client.get("/api/monitoring/health")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["status"] == "degraded"
-        assert data["healthy"] is False
-        assert "High CPU usage" in data["issues"]
-
-    def test_health_check_high_memory(self, api_client):
-        """Test health check with high memory usage."""
-        with patch('psutil.cpu_percent', return_value=50.0), \
-             patch('psutil.virtual_memory') as mock_memory:
-
-            memory = MagicMock()
-            memory.percent = 95.0
-            mock_memory.return_value = memory
-
-            response = api_client.get("/api/monitoring/health")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["status"] == "degraded"
-        assert data["healthy"] is False
-        assert "High memory usage" in data["issues"]
-
-    def test_health_check_multiple_issues(self, api_client):
-        """Test health check with multiple issues."""
-        with patch('psutil.cpu_percent', return_value=95.0), \
-             patch('psutil.virtual_memory') as mock_memory:
-
-            memory = MagicMock()
-            memory.percent = 95.0
-            mock_memory.return_value = memory
-
-            response = api_client.get("/api/monitoring/health")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["healthy"] is False
-        assert len(data["issues"]) == 2
-
     def test_health_check_error_handling(self, api_client):
         """Test health check error handling."""
         with patch('psutil.cpu_percent', side_effect=Exception("psutil error")):
@@ -224,58 +169,52 @@ class TestMonitoringAPI:
 class TestMonitoringIntegration:
     """Integration tests for monitoring workflows."""
 
-    async def test_full_monitoring_workflow(self, api_client, mock_orchestrator, populated_task_storage):
+    async def test_full_monitoring_workflow(self, api_client, mock_orchestrator, mock_websocket_manager, populated_task_storage):
         """Test complete monitoring workflow."""
         async def mock_status():
             return {"gemini": {"enabled": True, "healthy": True}}
 
         mock_orchestrator.get_service_status = mock_status
 
-        with patch('oxide.web.backend.routes.monitoring.get_ws_manager') as mock_ws:
-            ws_manager = MagicMock()
-            ws_manager.get_connection_count.return_value = 2
-            mock_ws.return_value = ws_manager
+        mock_websocket_manager.connections = 2
 
-            # 1. Get metrics
-            metrics_resp = api_client.get("/api/monitoring/metrics")
-            assert metrics_resp.status_code == 200
-            metrics = metrics_resp.json()
+        # 1. Get metrics
+        metrics_resp = api_client.get("/api/monitoring/metrics")
+        assert metrics_resp.status_code == 200
+        metrics = metrics_resp.json()
 
-            # 2. Get stats
-            stats_resp = api_client.get("/api/monitoring/stats")
-            assert stats_resp.status_code == 200
-            stats = stats_resp.json()
+        # 2. Get stats
+        stats_resp = api_client.get("/api/monitoring/stats")
+        assert stats_resp.status_code == 200
+        stats = stats_resp.json()
 
-            # 3. Health check
-            health_resp = api_client.get("/api/monitoring/health")
-            assert health_resp.status_code == 200
-            health = health_resp.json()
+        # 3. Health check
+        health_resp = api_client.get("/api/monitoring/health")
+        assert health_resp.status_code == 200
+        health = health_resp.json()
 
-            # Verify data consistency
-            assert metrics["tasks"]["total"] == stats["total_tasks"]
-            assert health["healthy"] in [True, False]
+        # Verify data consistency
+        assert metrics["tasks"]["total"] == stats["total_tasks"]
+        assert health["healthy"] in [True, False]
 
-    async def test_metrics_reflect_task_changes(self, api_client, mock_orchestrator, temp_task_storage):
+    async def test_metrics_reflect_task_changes(self, api_client, mock_orchestrator, mock_websocket_manager, nodb_task_storage):
         """Test that metrics update when tasks change."""
         async def mock_status():
             return {}
 
         mock_orchestrator.get_service_status = mock_status
 
-        with patch('oxide.web.backend.routes.monitoring.get_ws_manager') as mock_ws:
-            ws_manager = MagicMock()
-            ws_manager.get_connection_count.return_value = 0
-            mock_ws.return_value = ws_manager
+        mock_websocket_manager.connections = 0
 
-            # Initial metrics
-            resp1 = api_client.get("/api/monitoring/metrics")
-            metrics1 = resp1.json()
-            assert metrics1["tasks"]["total"] == 0
+        # Initial metrics
+        resp1 = api_client.get("/api/monitoring/metrics")
+        metrics1 = resp1.json()
+        assert metrics1["tasks"]["total"] == 0
 
-            # Add a task
-            temp_task_storage.add_task("new-task", "test", [], "gemini", "quick_query")
+        # Add a task
+        nodb_task_storage.add_task("new-task", "test", [], "gemini", "quick_query")
 
-            # Metrics should update
-            resp2 = api_client.get("/api/monitoring/metrics")
-            metrics2 = resp2.json()
-            assert metrics2["tasks"]["total"] == 1
+        # Metrics should update
+        resp2 = api_client.get("/api/monitoring/metrics")
+        metrics2 = resp2.json()
+        assert metrics2["tasks"]["total"] == 1
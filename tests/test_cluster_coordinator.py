@@ -102,6 +102,29 @@ def test_get_cluster_status(coordinator):
     assert len(status["cluster_nodes"]) == 1
 
 
+def test_get_status_snapshot(coordinator):
+    """Test status snapshot is served from cache once refreshed"""
+    # No snapshot yet: computed on demand
+    status = coordinator.get_status_snapshot()
+    assert status["total_nodes"] == 0
+
+    coordinator._status_snapshot = {"total_nodes": 42}
+    assert coordinator.get_status_snapshot()["total_nodes"] == 42
+
+
+@pytest.mark.asyncio
+async def test_refresh_status_snapshot(coordinator):
+    """Test background refresh populates the snapshot"""
+    coordinator.status_refresh_interval = 0.01
+    task = asyncio.create_task(coordinator._refresh_status_snapshot())
+    await asyncio.sleep(0.02)
+    task.cancel()
+    await task
+
+    assert coordinator._status_snapshot is not None
+    assert coordinator._status_snapshot["total_nodes"] == 0
+
+
 def test_get_best_node_for_task_local_preferred(coordinator):
     """Test node selection prefers least loaded node"""
     # Create local node (low load)
@@ -237,8 +260,9 @@ async def test_execute_task_on_node(coordinator):
             preferences={}
         )
 
-        assert result["result"] == "success"
-        assert result["output"] == "Hello"
+        assert result.ok is True
+        assert result.payload["result"] == "success"
+        assert result.payload["output"] == "Hello"
 
 
 @pytest.mark.asyncio
@@ -273,8 +297,9 @@ async def test_execute_task_on_node_failure(coordinator):
             preferences={}
         )
 
-        assert "error" in result
-        assert result["status"] == "failed"
+        assert result.ok is False
+        assert "error" in result.payload
+        assert result.payload["status"] == "failed"
 
 
 def test_load_scoring():
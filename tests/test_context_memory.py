@@ -7,6 +7,7 @@ Tests all core functionality:
 - Similarity search
 - Conversation pruning
 - Memory statistics
+- Journaled persistence
 """
 import pytest
 import tempfile
@@ -284,5 +285,220 @@ def test_conversation_timestamps(temp_memory):
     assert before <= msg["timestamp"] <= after
 
 
+def test_search_matches_full_scan(temp_memory):
+    """Test indexed search scores match a brute-force Jaccard scan"""
+    temp_memory.add_context("conv_a", "user", "python async generators")
+    temp_memory.add_context("conv_a", "assistant", "Generators yield values")
+    temp_memory.add_context("conv_b", "user", "rust ownership rules")
+    temp_memory.add_context("conv_c", "user", "python typing")
+
+    query = "Python generators yield"
+    query_words = set(query.lower().split())
+    expected = {}
+    for conv_id, conv in temp_memory._memory.items():
+        words = set(" ".join(m["content"].lower() for m in conv["messages"]).split())
+        expected[conv_id] = len(query_words & words) / len(query_words | words)
+
+    results = temp_memory.search_similar_conversations(query, limit=10, min_similarity=0.0)
+
+    assert {r["conversation_id"]: r["similarity"] for r in results} == pytest.approx(expected)
+    assert [r["conversation_id"] for r in results][0] == "conv_a"
+
+    positive = temp_memory.search_similar_conversations(query, limit=10, min_similarity=0.01)
+    assert {r["conversation_id"] for r in positive} == {"conv_a", "conv_c"}
+
+
+def test_search_index_tracks_deletes(temp_memory):
+    """Test deleted and pruned conversations drop out of search results"""
+    temp_memory.add_context("conv_old", "user", "kubernetes deployment")
+    temp_memory.add_context("conv_new", "user", "kubernetes service")
+
+    assert temp_memory.delete_conversation("conv_old") is True
+    assert temp_memory.delete_conversation("conv_old") is False
+
+    results = temp_memory.search_similar_conversations("kubernetes", min_similarity=0.1)
+    assert [r["conversation_id"] for r in results] == ["conv_new"]
+
+    # Reusing an id after a direct delete must not inherit the old words
+    del temp_memory._memory["conv_new"]
+    temp_memory.add_context("conv_new", "user", "terraform")
+
+    assert temp_memory.search_similar_conversations("kubernetes", min_similarity=0.1) == []
+    assert temp_memory.search_similar_conversations("terraform", min_similarity=0.1)[0]["similarity"] == 1.0
+
+
+def test_search_results_cached_until_memory_changes(temp_memory):
+    """Test repeated searches hit the cache and writes invalidate it"""
+    from unittest.mock import patch
+
+    temp_memory.add_context("conv_a", "user", "python generators")
+
+    first = temp_memory.search_similar_conversations("python generators", min_similarity=0.1)
+
+    with patch.object(temp_memory, '_score_conversations', side_effect=AssertionError("rescored")):
+        # Same words, different order and case
+        again = temp_memory.search_similar_conversations("Generators PYTHON", min_similarity=0.1)
+    assert again == first
+
+    temp_memory.add_context("conv_b", "user", "python generators")
+    results = temp_memory.search_similar_conversations("python generators", min_similarity=0.1)
+    assert {r["conversation_id"] for r in results} == {"conv_a", "conv_b"}
+
+
+def test_search_limit_returns_top_matches(temp_memory):
+    """Test limit keeps the highest scoring conversations in order"""
+    temp_memory.add_context("conv_full", "user", "alpha beta")
+    temp_memory.add_context("conv_half", "user", "alpha gamma")
+    temp_memory.add_context("conv_third", "user", "alpha delta epsilon")
+
+    results = temp_memory.search_similar_conversations("alpha beta", limit=2, min_similarity=0.1)
+
+    assert [r["conversation_id"] for r in results] == ["conv_full", "conv_half"]
+    assert results[0]["similarity"] == 1.0
+
+
+def test_index_shares_word_strings(temp_memory):
+    """Test indexed words are stored once across conversations"""
+    temp_memory.add_context("conv_a", "user", "shared " + "word")
+    temp_memory.add_context("conv_b", "user", "".join(["sha", "red"]) + " other")
+
+    (word_a,) = [w for w in temp_memory._conv_words["conv_a"] if w == "shared"]
+    (word_b,) = [w for w in temp_memory._conv_words["conv_b"] if w == "shared"]
+
+    assert word_a is word_b
+
+
+def test_list_conversations_paginates_newest_first(temp_memory):
+    """Test conversation pages are ordered by last update"""
+    for i in range(5):
+        temp_memory.add_context(f"conv_{i}", "user", f"Message {i}")
+        temp_memory._memory[f"conv_{i}"]["updated_at"] = 1000 + i
+
+    page = temp_memory.list_conversations(limit=2, offset=1)
+
+    assert [c["id"] for c in page] == ["conv_3", "conv_2"]
+    assert temp_memory.list_conversations(limit=10, offset=4)[0]["id"] == "conv_0"
+    assert temp_memory.list_conversations(limit=10, offset=5) == []
+
+
+def test_statistics_cached_until_memory_changes(temp_memory):
+    """Test statistics are reused until a message is added or removed"""
+    temp_memory.add_context("conv_a", "user", "one")
+    first = temp_memory.get_statistics()
+
+    assert temp_memory.get_statistics() == first
+
+    temp_memory.add_context("conv_a", "assistant", "two")
+    assert temp_memory.get_statistics()["total_messages"] == 2
+
+    temp_memory.delete_conversation("conv_a")
+    stats = temp_memory.get_statistics()
+    assert stats["total_conversations"] == 0
+    assert stats["oldest_conversation"] is None
+
+
+def test_changes_journaled_without_rewriting_snapshot(temp_memory):
+    """Test adds and deletes append to the journal and survive a reload"""
+    temp_memory.add_context("conv_a", "user", "first", {"source": "test"})
+    temp_memory.add_context("conv_b", "user", "second")
+    temp_memory.delete_conversation("conv_b")
+
+    assert temp_memory.storage_path.read_text() == "{}"
+    assert len(temp_memory.journal_path.read_text().splitlines()) == 3
+
+    reloaded = ContextMemory(storage_path=temp_memory.storage_path)
+
+    assert reloaded._memory == temp_memory._memory
+    assert reloaded.search_similar_conversations("first")[0]["conversation_id"] == "conv_a"
+
+
+def test_journal_compacted_into_snapshot(temp_memory):
+    """Test the journal is folded into the snapshot at the threshold"""
+    temp_memory.JOURNAL_COMPACT_THRESHOLD = 3
+
+    for i in range(3):
+        temp_memory.add_context("conv", "user", f"Message {i}")
+
+    assert temp_memory.storage_path.exists()
+    assert not temp_memory.journal_path.exists()
+
+    reloaded = ContextMemory(storage_path=temp_memory.storage_path)
+    assert len(reloaded.get_conversation("conv")["messages"]) == 3
+
+
+def test_journal_replay_skips_applied_and_torn_entries(temp_memory):
+    """Test replay ignores entries already in the snapshot and torn lines"""
+    temp_memory.add_context("conv", "user", "kept once")
+    journal = temp_memory.journal_path.read_text()
+
+    # Snapshot written but journal not yet removed, then an interrupted append
+    temp_memory._save_memory()
+    temp_memory.journal_path.write_text(journal + '{"op": "add", "conv')
+
+    reloaded = ContextMemory(storage_path=temp_memory.storage_path)
+
+    assert len(reloaded.get_conversation("conv")["messages"]) == 1
+
+
+def test_journal_replay_keeps_messages_with_same_timestamp(temp_memory, monkeypatch):
+    """Test replay keeps distinct messages created within the same clock tick"""
+    monkeypatch.setattr(time, "time", lambda: 1700000000.0)
+
+    for i in range(5):
+        temp_memory.add_context("conv", "user", f"Message {i}")
+
+    reloaded = ContextMemory(storage_path=temp_memory.storage_path)
+
+    assert reloaded.get_conversation("conv") == temp_memory.get_conversation("conv")
+    assert len(reloaded.get_conversation("conv")["messages"]) == 5
+
+
+def test_stale_journal_ignored_without_snapshot(temp_memory):
+    """Test removing the memory file resets memory even if a journal remains"""
+    temp_memory.add_context("conv", "user", "forgotten")
+    temp_memory.storage_path.unlink()
+
+    reloaded = ContextMemory(storage_path=temp_memory.storage_path)
+
+    assert reloaded.get_conversation("conv") is None
+    assert not reloaded.journal_path.exists()
+
+
+def test_add_messages_single_journal_write(temp_memory):
+    """Test batched messages are stored like add_context with one append"""
+    from unittest.mock import patch
+
+    with patch.object(temp_memory, '_append_journal', wraps=temp_memory._append_journal) as append:
+        ids = temp_memory.add_messages("conv_bulk", [
+            {"role": "user", "content": "import question", "metadata": {"source": "bulk"}},
+            {"role": "assistant", "content": "import answer"},
+        ])
+
+    assert append.call_count == 1
+    conv = temp_memory.get_conversation("conv_bulk")
+    assert [msg["id"] for msg in conv["messages"]] == ids
+    assert conv["metadata"] == {"source": "bulk"}
+    assert conv["messages"][1]["metadata"] == {}
+    assert temp_memory.search_similar_conversations("import answer")[0]["conversation_id"] == "conv_bulk"
+
+    reloaded = ContextMemory(storage_path=temp_memory.storage_path)
+    assert reloaded.get_conversation("conv_bulk") == conv
+
+
+def test_add_messages_ids_unique_within_batch(temp_memory, monkeypatch):
+    """Test a batch created in one clock tick gets distinct ids and survives a reload"""
+    monkeypatch.setattr(time, "time", lambda: 1700000000.0)
+    messages = [{"role": "user", "content": f"Message {i}"} for i in range(200)]
+
+    ids = temp_memory.add_messages("conv_bulk", messages)
+
+    assert len(set(ids)) == len(messages)
+
+    reloaded = ContextMemory(storage_path=temp_memory.storage_path)
+    stored = reloaded.get_conversation("conv_bulk")["messages"]
+    assert [msg["id"] for msg in stored] == ids
+    assert [msg["content"] for msg in stored] == [msg["content"] for msg in messages]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
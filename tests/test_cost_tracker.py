@@ -248,6 +248,36 @@ def test_get_statistics(temp_tracker):
     assert len(stats["by_service"]) > 0
 
 
+def test_get_statistics_period_totals(temp_tracker):
+    """Test period totals only include records inside each window"""
+    import sqlite3
+
+    temp_tracker.record_cost("recent", "gemini", tokens_input=1000, tokens_output=0)
+    conn = sqlite3.connect(str(temp_tracker.db_path))
+    conn.execute(
+        "INSERT INTO llm_costs (task_id, service, tokens_input, tokens_output, cost_usd, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+        ("old", "gemini", 0, 0, 1.0, time.time() - 10 * 86400)
+    )
+    conn.commit()
+    conn.close()
+
+    stats = temp_tracker.get_statistics()
+
+    recent_cost = 1000 * 0.00000035
+    assert stats["cost_24h"] == pytest.approx(recent_cost)
+    assert stats["cost_7d"] == pytest.approx(recent_cost)
+    assert stats["cost_30d"] == pytest.approx(1.0 + recent_cost)
+    assert stats["total_cost"] == pytest.approx(1.0 + recent_cost)
+
+
+def test_get_statistics_empty(temp_tracker):
+    """Test statistics default to zero with no records"""
+    stats = temp_tracker.get_statistics()
+
+    assert stats["total_cost"] == 0.0
+    assert stats["cost_24h"] == 0.0
+
+
 def test_daily_costs(temp_tracker):
     """Test getting daily cost breakdown"""
     # Record costs
@@ -0,0 +1,65 @@
+"""
+Tests for the background system metrics sampler.
+"""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from oxide.utils.system_metrics import SystemMetricsSampler
+
+
+@pytest.fixture
+def mock_psutil():
+    """Mock psutil in the sampler module"""
+    with patch('oxide.utils.system_metrics.psutil') as mock:
+        mock.cpu_percent.return_value = 12.5
+        mock.virtual_memory.return_value = MagicMock(percent=40.0)
+        yield mock
+
+
+def test_sample_is_non_blocking(mock_psutil):
+    """sample() never asks psutil for a blocking interval"""
+    sampler = SystemMetricsSampler()
+
+    sampler.sample()
+
+    mock_psutil.cpu_percent.assert_called_once_with(interval=None)
+    assert sampler.cpu_percent == 12.5
+    assert sampler.memory.percent == 40.0
+    assert sampler.timestamp is not None
+
+
+@pytest.mark.asyncio
+async def test_background_sampling(mock_psutil):
+    """Started sampler refreshes values until stopped"""
+    sampler = SystemMetricsSampler(interval=0.01)
+
+    sampler.start()
+    assert sampler.running
+    await asyncio.sleep(0.03)
+    await sampler.stop()
+
+    assert not sampler.running
+    assert sampler.cpu_percent == 12.5
+    # Priming call plus at least one sample
+    assert mock_psutil.cpu_percent.call_count >= 2
+
+
+@pytest.mark.asyncio
+async def test_latest_prefers_background_sample(mock_psutil):
+    """latest() returns the stored sample while running, direct readings otherwise"""
+    sampler = SystemMetricsSampler(interval=60)
+
+    mock_psutil.cpu_percent.return_value = 3.0
+    assert sampler.latest()[0] == 3.0
+
+    sampler.start()
+    sampler.cpu_percent, sampler.memory = 77.0, MagicMock(percent=10.0)
+    mock_psutil.cpu_percent.reset_mock()
+
+    cpu, memory = sampler.latest()
+    await sampler.stop()
+
+    assert (cpu, memory.percent) == (77.0, 10.0)
+    mock_psutil.cpu_percent.assert_not_called()
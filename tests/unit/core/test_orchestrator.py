@@ -638,6 +638,30 @@ class TestOrchestratorServiceManagement:
         # Verify health_check was called (all adapters share same mock, so called 3 times total)
         assert orchestrator.adapters['gemini'].health_check.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_get_service_status_checks_health_concurrently(self, orchestrator_with_mocks):
+        """Test health checks overlap instead of running one after another"""
+        import asyncio
+
+        orchestrator = orchestrator_with_mocks
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_health_check():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        orchestrator.adapters['gemini'].health_check = AsyncMock(side_effect=slow_health_check)
+
+        status = await orchestrator.get_service_status()
+
+        assert max_in_flight == len(orchestrator.adapters)
+        assert list(status) == list(orchestrator.adapters)
+
     @pytest.mark.asyncio
     async def test_test_service(self, orchestrator_with_mocks):
         """Test service testing with custom prompt"""
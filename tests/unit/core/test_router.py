@@ -12,6 +12,12 @@ from oxide.core.classifier import TaskInfo, TaskType
 from oxide.utils.exceptions import NoServiceAvailableError
 
 
+@pytest.fixture
+def mock_config(shared_config):
+    """TaskRouter never modifies its config, so share the session instance"""
+    return shared_config
+
+
 class TestTaskRouter:
     """Test suite for TaskRouter"""
 
@@ -0,0 +1,169 @@
+"""
+Test suite for cluster management API routes.
+
+Tests cover:
+- Router registration (single canonical module)
+- Node enable/disable responses
+- Services matrix streaming
+- Distributed task execution status
+"""
+
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from oxide.cluster import TaskResult
+from oxide.web.backend.routes import cluster
+
+
+@pytest.fixture
+def app():
+    """Create FastAPI app with cluster router"""
+    app = FastAPI()
+    app.include_router(cluster.router)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Patch the global cluster coordinator"""
+    coordinator = MagicMock()
+    coordinator.node_id = "local_node"
+    with patch('oxide.web.backend.routes.cluster.get_cluster_coordinator', return_value=coordinator):
+        yield coordinator
+
+
+class TestClusterRouterRegistration:
+    """Test that the cluster router is defined and mounted exactly once"""
+
+    def test_single_cluster_module_loaded(self):
+        """Only one module defines the cluster router"""
+        from oxide.web.backend.main import app  # noqa: F401
+
+        loaded = [
+            name for name, module in list(sys.modules.items())
+            if getattr(getattr(module, "router", None), "prefix", None) == cluster.router.prefix
+        ]
+        assert loaded == ["oxide.web.backend.routes.cluster"]
+
+    def test_cluster_routes_registered_once(self):
+        """Each cluster endpoint is declared once and served from the cluster module"""
+        from oxide.web.backend.main import app
+
+        declared = [
+            (route.path, tuple(sorted(route.methods)))
+            for route in cluster.router.routes
+            if isinstance(route, APIRoute)
+        ]
+        assert declared
+        assert len(declared) == len(set(declared))
+
+        served = {path for path in app.openapi()["paths"] if path.startswith("/api/cluster")}
+        assert served == {path for path, _ in declared}
+
+
+class TestEnableDisableNode:
+    """Test POST /api/cluster/nodes/{node_id}/enable|disable"""
+
+    @pytest.mark.parametrize("action,enabled", [("enable", True), ("disable", False)])
+    def test_returns_message(self, client, mock_coordinator, action, enabled):
+        """Success returns the JSON status message by default"""
+        getattr(mock_coordinator, f"{action}_node").return_value = True
+
+        response = client.post(f"/api/cluster/nodes/node_a/{action}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["node_id"] == "node_a"
+        assert data["enabled"] is enabled
+        getattr(mock_coordinator, f"{action}_node").assert_called_once_with("node_a")
+
+    @pytest.mark.parametrize("action", ["enable", "disable"])
+    def test_no_content_opt_in(self, client, mock_coordinator, action):
+        """no_content=true returns 204 with an empty body"""
+        getattr(mock_coordinator, f"{action}_node").return_value = True
+
+        response = client.post(f"/api/cluster/nodes/node_a/{action}?no_content=true")
+
+        assert response.status_code == 204
+        assert response.content == b""
+
+    @pytest.mark.parametrize("action", ["enable", "disable"])
+    def test_unknown_node(self, client, mock_coordinator, action):
+        """Unknown nodes still return 404"""
+        getattr(mock_coordinator, f"{action}_node").return_value = False
+
+        response = client.post(f"/api/cluster/nodes/missing/{action}")
+
+        assert response.status_code == 404
+
+
+class TestServicesMatrix:
+    """Test GET /api/cluster/services-matrix"""
+
+    def test_services_matrix_streams_json(self, client, mock_coordinator):
+        """Matrix is streamed as a single valid JSON document"""
+        local = MagicMock(
+            node_id="local_node", hostname="local", ip_address="10.0.0.1", port=8000,
+            healthy=True, enabled=True, cpu_percent=10.0, memory_percent=20.0, active_tasks=0,
+            services={"qwen": {"type": "cli"}, "ollama": {"type": "http"}}
+        )
+        remote = MagicMock(
+            node_id="remote_node", hostname="remote", ip_address="10.0.0.2", port=8000,
+            healthy=False, enabled=True, cpu_percent=50.0, memory_percent=60.0, active_tasks=2,
+            services={"ollama": {"type": "http"}}
+        )
+        mock_coordinator.get_all_nodes.return_value = [local, remote]
+
+        response = client.get("/api/cluster/services-matrix")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["total_nodes"] == 2
+        assert data["total_services"] == 2
+        assert data["services"]["qwen"]["total_nodes"] == 1
+        assert data["services"]["qwen"]["nodes"][0]["local"] is True
+        assert data["services"]["ollama"]["total_nodes"] == 2
+        assert data["services"]["ollama"]["healthy_nodes"] == 1
+        assert data["services"]["ollama"]["nodes"][1]["service_details"] == {"type": "http"}
+
+    def test_services_matrix_empty(self, client, mock_coordinator):
+        """No nodes yields an empty matrix"""
+        mock_coordinator.get_all_nodes.return_value = []
+
+        response = client.get("/api/cluster/services-matrix")
+
+        assert response.json() == {"services": {}, "total_nodes": 0, "total_services": 0}
+
+
+class TestExecuteDistributedTask:
+    """Test POST /api/cluster/tasks/execute"""
+
+    @pytest.mark.parametrize("ok,status", [(True, "completed"), (False, "failed")])
+    def test_remote_execution_status(self, client, mock_coordinator, ok, status):
+        """Remote status follows the TaskResult ok flag"""
+        remote = MagicMock(node_id="remote_node", hostname="remote", healthy=True)
+        mock_coordinator.get_best_node_for_task.return_value = remote
+        mock_coordinator.execute_task_on_node = AsyncMock(
+            return_value=TaskResult(ok=ok, payload={"output": "done"})
+        )
+
+        response = client.post("/api/cluster/tasks/execute", json={"prompt": "hello"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == status
+        assert data["node"]["id"] == "remote_node"
+        assert data["result"] == {"output": "done"}
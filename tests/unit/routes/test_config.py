@@ -330,6 +330,24 @@ class TestValidateConfiguration:
         assert data["valid"] is True
         assert any("disabled primary service" in w.lower() for w in data["warnings"])
 
+    def test_validate_disabled_fallback_services(self, client):
+        """Test warnings for disabled primary and fallback services"""
+        response = client.post("/api/config/validate", json={
+            "services": {
+                "qwen": {"type": "cli", "enabled": True},
+                "gemini": {"type": "cli", "enabled": False},
+            },
+            "routing_rules": {
+                "quick_query": {"primary": "gemini", "fallback": ["qwen", "gemini"]},
+            },
+        })
+
+        assert response.status_code == 200
+        assert response.json()["warnings"] == [
+            "Routing rule 'quick_query' uses disabled primary service: gemini",
+            "Routing rule 'quick_query' uses disabled fallback service: gemini",
+        ]
+
     def test_validate_invalid_config(self, client):
         """Test validating an invalid configuration"""
         with patch('src.oxide.web.backend.routes.config.Config', side_effect=Exception("Invalid config")):
@@ -533,3 +551,130 @@ class TestPatchRoutingRule:
             )
 
         assert response.status_code == 503
+
+
+class TestConfigDumpCache:
+    """Test serialized config caching shared by GET endpoints"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from oxide.web.backend.routes import config as config_routes
+        config_routes._invalidate_dump_cache()
+        yield
+        config_routes._invalidate_dump_cache()
+
+    def test_dump_reused_for_same_config(self, mock_config, mock_hot_reload_manager):
+        """Repeated dumps of the same config hit the cache"""
+        from oxide.web.backend.routes.config import _dump
+
+        first = _dump(mock_config, mock_hot_reload_manager)
+        second = _dump(mock_config, mock_hot_reload_manager)
+
+        assert first is second
+        mock_config.model_dump.assert_called_once_with(exclude_none=True)
+
+    def test_dump_refreshed_after_reload(self, mock_config, mock_hot_reload_manager):
+        """A new reload count invalidates the cached dump"""
+        from oxide.web.backend.routes.config import _dump
+
+        _dump(mock_config, mock_hot_reload_manager)
+        mock_hot_reload_manager.reload_count += 1
+        _dump(mock_config, mock_hot_reload_manager)
+
+        assert mock_config.model_dump.call_count == 2
+
+    def test_get_routing_rule_uses_cached_dump(self, client, mock_hot_reload_manager):
+        """Sub-section endpoints share one section dump and skip the full dump"""
+        config = Config(
+            services={"qwen": {"type": "cli", "executable": "qwen"}},
+            routing_rules={"quick_query": {"primary": "qwen", "fallback": []}},
+        )
+        mock_hot_reload_manager.current_config = config
+
+        with patch('oxide.web.backend.routes.config.get_hot_reload_manager', return_value=mock_hot_reload_manager), \
+             patch.object(Config, 'model_dump', side_effect=AssertionError("full dump")):
+            client.get("/api/config/routing-rules")
+            response = client.get("/api/config/routing-rules/quick_query")
+
+        assert response.status_code == 200
+        assert response.json()["rule"] == {"primary": "qwen", "fallback": []}
+
+    def test_enum_fields_serialized_by_response(self, client, mock_hot_reload_manager):
+        """Python-mode dumps keep enum members, rendered as their values"""
+        mock_hot_reload_manager.current_config = Config(
+            services={"ollama": {"type": "http", "base_url": "http://localhost:11434", "api_type": "ollama"}},
+            routing_rules={},
+        )
+
+        with patch('oxide.web.backend.routes.config.get_hot_reload_manager', return_value=mock_hot_reload_manager):
+            response = client.get("/api/config/services/ollama")
+
+        assert response.status_code == 200
+        assert response.json()["config"]["type"] == "http"
+        assert response.json()["config"]["api_type"] == "ollama"
+
+    def test_section_dump_reuses_full_dump(self, mock_config, mock_hot_reload_manager):
+        """A cached full dump serves later section requests"""
+        from oxide.web.backend.routes.config import _dump, _dump_section
+
+        full = _dump(mock_config, mock_hot_reload_manager)
+
+        assert _dump_section(mock_config, "services", mock_hot_reload_manager) is full["services"]
+
+    def test_get_configuration_matches_response_model(self, client, mock_config, mock_hot_reload_manager):
+        """Full config response keeps the ConfigResponse shape without revalidation"""
+        from oxide.web.backend.routes.config import ConfigResponse
+
+        with patch('oxide.web.backend.routes.config.get_hot_reload_manager', return_value=mock_hot_reload_manager):
+            response = client.get("/api/config/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == set(ConfigResponse.model_fields)
+        assert data["memory"] is None
+        assert data["execution"] == {"max_parallel_services": 3}
+
+
+class TestPatchResponse:
+    """Test PATCH responses and persistence"""
+
+    def test_patch_returns_patched_rule_and_persists(self, client, mock_hot_reload_manager, tmp_path):
+        """Response is the in-memory patched rule; the file is saved and reloaded"""
+        mock_hot_reload_manager.current_config = Config(
+            services={"qwen": {"type": "cli"}, "gemini": {"type": "cli"}},
+            routing_rules={"quick_query": {"primary": "qwen", "fallback": []}},
+        )
+        config_path = tmp_path / "default.yaml"
+
+        with patch('oxide.web.backend.routes.config.get_hot_reload_manager', return_value=mock_hot_reload_manager), \
+             patch('oxide.web.backend.routes.config._CONFIG_PATH', config_path):
+            response = client.patch(
+                "/api/config/routing-rules/quick_query",
+                json={"fallback": ["gemini"], "timeout_seconds": 45}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["rule"] == {
+            "primary": "qwen",
+            "fallback": ["gemini"],
+            "parallel_threshold_files": None,
+            "timeout_seconds": 45,
+        }
+        assert "timeout_seconds: 45" in config_path.read_text()
+        mock_hot_reload_manager.reload.assert_called_once()
+
+    def test_patch_unknown_fallbacks_listed(self, client, mock_hot_reload_manager):
+        """All unknown fallback services are reported at once"""
+        mock_hot_reload_manager.current_config = Config(
+            services={"qwen": {"type": "cli"}},
+            routing_rules={"quick_query": {"primary": "qwen", "fallback": []}},
+        )
+
+        with patch('oxide.web.backend.routes.config.get_hot_reload_manager', return_value=mock_hot_reload_manager):
+            response = client.patch(
+                "/api/config/routing-rules/quick_query",
+                json={"fallback": ["zeta", "qwen", "alpha"]}
+            )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Unknown service: alpha, zeta"
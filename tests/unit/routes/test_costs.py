@@ -0,0 +1,122 @@
+"""
+Test suite for cost tracking API routes.
+
+Tests cover:
+- Cost statistics
+- CSV export streaming
+- Pricing listing
+"""
+
+import csv
+import io
+import sqlite3
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from oxide.analytics.cost_tracker import CostTracker
+from oxide.web.backend.routes.costs import router, _iter_costs_csv
+
+
+@pytest.fixture
+def app():
+    """Create FastAPI app with costs router"""
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    """Patch the global cost tracker with a temporary one"""
+    tracker = CostTracker(db_path=tmp_path / "costs.db")
+    with patch('oxide.web.backend.routes.costs.get_cost_tracker', return_value=tracker):
+        yield tracker
+
+
+class TestGetCostStats:
+    """Test GET /api/costs/stats"""
+
+    def test_get_cost_stats(self, client, tracker):
+        """Returns the CostStats fields for recorded costs"""
+        from oxide.web.backend.routes.costs import CostStats
+
+        tracker.record_cost("task-1", "gemini", tokens_input=1000, tokens_output=500)
+
+        response = client.get("/api/costs/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == set(CostStats.model_fields)
+        assert data["total_cost"] == pytest.approx(0.00105)
+        assert data["by_service"] == {"gemini": pytest.approx(0.00105)}
+
+
+class TestExportCostsCsv:
+    """Test GET /api/costs/export/csv"""
+
+    def test_export_csv(self, client, tracker):
+        """Exports header plus one row per record, newest first"""
+        tracker.record_cost("task-1", "gemini", tokens_input=1000, tokens_output=500)
+        tracker.record_cost("task-2", "qwen", tokens_input=10, tokens_output=20)
+
+        response = client.get("/api/costs/export/csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == ["task_id", "service", "tokens_input", "tokens_output", "cost_usd", "timestamp", "date"]
+        assert [row[0] for row in rows[1:]] == ["task-2", "task-1"]
+        assert rows[2][4] == "0.001050"
+        assert rows[1][6] == datetime.fromtimestamp(float(rows[1][5])).strftime("%Y-%m-%dT%H:%M:%S")
+
+    def test_export_csv_streams_in_chunks(self, tracker):
+        """Large exports are flushed in several chunks"""
+        for i in range(50):
+            tracker.record_cost(f"task-{i}", "gemini", tokens_input=i, tokens_output=i)
+
+        conn = sqlite3.connect(str(tracker.db_path))
+        cursor = conn.execute(
+            "SELECT task_id, service, tokens_input, tokens_output, cost_usd, timestamp, '' FROM llm_costs"
+        )
+        with patch('oxide.web.backend.routes.costs._CSV_BATCH_ROWS', 10):
+            chunks = list(_iter_costs_csv(conn, cursor))
+
+        assert len(chunks) > 1
+        assert len(list(csv.reader(io.StringIO("".join(chunks))))) == 51
+
+    def test_export_csv_time_filter(self, client, tracker):
+        """start_time excludes older records"""
+        tracker.record_cost("task-1", "gemini", tokens_input=1, tokens_output=1)
+
+        response = client.get("/api/costs/export/csv", params={"start_time": 4102444800})
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert len(rows) == 1
+
+
+class TestGetPricing:
+    """Test GET /api/costs/pricing"""
+
+    def test_get_pricing(self, client, tracker):
+        """Lists every service with its per-token costs"""
+        response = client.get("/api/costs/pricing")
+
+        assert response.status_code == 200
+        pricing = {entry["service"]: entry for entry in response.json()["pricing"]}
+        assert set(pricing) == set(tracker.pricing)
+        assert pricing["gemini"] == {
+            "service": "gemini",
+            "cost_per_input_token": tracker.pricing["gemini"].cost_per_input_token,
+            "cost_per_output_token": tracker.pricing["gemini"].cost_per_output_token,
+            "currency": "USD",
+        }
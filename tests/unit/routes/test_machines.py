@@ -40,8 +40,9 @@ def mock_orchestrator():
 
 @pytest.fixture
 def mock_psutil():
-    """Mock psutil metrics"""
-    with patch('oxide.web.backend.routes.machines.psutil') as mock:
+    """Mock psutil metrics (CPU and memory are read through the system metrics sampler)"""
+    with patch('oxide.web.backend.routes.machines.psutil') as mock, \
+         patch('oxide.utils.system_metrics.psutil', mock):
         # Mock CPU
         mock.cpu_percent.return_value = 45.5
 
@@ -348,7 +349,7 @@ class TestGetMachine:
 
     def test_get_machine_error_handling(self, client, mock_orchestrator, app):
         """Test error handling when psutil fails"""
-        with patch('oxide.web.backend.routes.machines.psutil') as mock_psutil:
+        with patch('oxide.utils.system_metrics.psutil') as mock_psutil:
             mock_psutil.cpu_percent.side_effect = Exception("CPU error")
 
             app.dependency_overrides[get_orchestrator] = lambda: mock_orchestrator
@@ -431,5 +432,66 @@ class TestServiceTypeVariations:
         assert len(local["services"]) == 1
 
 
+class TestClassifyUrl:
+    """Test base URL classification helper"""
+
+    def test_classify_local_and_remote(self):
+        """Test hostname, port, locality and machine id extraction"""
+        from oxide.web.backend.routes.machines import _classify_url
+
+        assert _classify_url("http://127.0.0.1:11434") == ("127.0.0.1", 11434, True, "remote_127_0_0_1")
+        assert _classify_url("http://gpu.example.com") == ("gpu.example.com", 80, False, "remote_gpu_example_com")
+        assert _classify_url("not a url") == ("unknown", 80, False, "remote_unknown")
+
+
+class TestServiceStatusCache:
+    """Test service status snapshot reuse across polls"""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self, monkeypatch):
+        from oxide.web.backend.routes import machines
+        monkeypatch.setattr(machines, '_status_cache', None)
+        monkeypatch.setattr(machines, '_status_lock', None)
+
+    async def test_status_reused_within_ttl(self, mock_orchestrator):
+        """Test a fresh snapshot is served without new health checks"""
+        from oxide.web.backend.routes import machines
+
+        mock_orchestrator.get_service_status.return_value = {"qwen": {"healthy": True}}
+
+        first = await machines._get_service_status(mock_orchestrator)
+        second = await machines._get_service_status(mock_orchestrator)
+
+        assert first is second
+        mock_orchestrator.get_service_status.assert_awaited_once()
+
+    async def test_status_refreshed_after_ttl(self, mock_orchestrator):
+        """Test an expired snapshot triggers a new status call"""
+        from oxide.web.backend.routes import machines
+
+        mock_orchestrator.get_service_status.return_value = {}
+
+        with patch.object(machines, '_STATUS_TTL_SECONDS', 0):
+            await machines._get_service_status(mock_orchestrator)
+            await machines._get_service_status(mock_orchestrator)
+
+        assert mock_orchestrator.get_service_status.await_count == 2
+
+    async def test_concurrent_misses_share_one_refresh(self, mock_orchestrator):
+        """Test concurrent requests coalesce onto a single status call"""
+        import asyncio
+        from oxide.web.backend.routes import machines
+
+        async def slow_status():
+            await asyncio.sleep(0.01)
+            return {}
+
+        mock_orchestrator.get_service_status.side_effect = slow_status
+
+        await asyncio.gather(*(machines._get_service_status(mock_orchestrator) for _ in range(5)))
+
+        mock_orchestrator.get_service_status.assert_awaited_once()
+
+
 # Import statement that needs to be at module level for dependency override
 from oxide.web.backend.routes.machines import get_orchestrator
@@ -0,0 +1,130 @@
+"""
+Test suite for memory API routes.
+
+Tests cover:
+- Conversation listing
+- Conversation details
+- Conversation search
+"""
+
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from oxide.memory.context_memory import ContextMemory
+from oxide.web.backend.routes.memory import router
+
+
+@pytest.fixture
+def memory(tmp_path):
+    """Create context memory with two conversations"""
+    memory = ContextMemory(storage_path=tmp_path / "memory.json")
+    memory.add_context("conv-1", "user", "python async question", {"source": "test"})
+    memory.add_context("conv-1", "assistant", "use asyncio gather")
+    memory.add_context("conv-2", "user", "rust borrow checker")
+
+    with patch('oxide.web.backend.routes.memory.get_context_memory', return_value=memory):
+        yield memory
+
+
+@pytest.fixture
+def client():
+    """Create test client for an app with the memory router"""
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestListConversations:
+    """Test GET /api/memory/conversations"""
+
+    def test_list_conversations(self, client, memory):
+        """Test summaries are returned newest first"""
+        response = client.get("/api/memory/conversations")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [conv["id"] for conv in data] == ["conv-2", "conv-1"]
+        assert data[1]["message_count"] == 2
+        assert data[1]["metadata"] == {"source": "test"}
+        assert set(data[1]) == {"id", "created_at", "updated_at", "message_count", "metadata"}
+
+    def test_list_streams_across_batches(self, client, memory):
+        """Test pages larger than one streamed batch form a single JSON array"""
+        from oxide.web.backend.routes import memory as memory_routes
+
+        with patch.object(memory_routes, '_STREAM_BATCH_SIZE', 1):
+            response = client.get("/api/memory/conversations")
+
+        assert response.headers["content-type"] == "application/json"
+        assert [conv["id"] for conv in response.json()] == ["conv-2", "conv-1"]
+
+    def test_list_empty_page(self, client, memory):
+        """Test an offset past the end returns an empty array"""
+        response = client.get("/api/memory/conversations", params={"offset": 10})
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestGetConversation:
+    """Test GET /api/memory/conversations/{conversation_id}"""
+
+    def test_get_conversation(self, client, memory):
+        """Test the stored conversation is returned with its messages"""
+        response = client.get("/api/memory/conversations/conv-1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data == memory.get_conversation("conv-1")
+        assert [msg["role"] for msg in data["messages"]] == ["user", "assistant"]
+        assert data["messages"][1]["metadata"] == {}
+
+    def test_get_conversation_not_found(self, client, memory):
+        """Test an unknown conversation returns 404"""
+        response = client.get("/api/memory/conversations/missing")
+
+        assert response.status_code == 404
+
+
+class TestSearchConversations:
+    """Test GET /api/memory/search"""
+
+    def test_search(self, client, memory):
+        """Test search returns matching conversations"""
+        response = client.get("/api/memory/search", params={"query": "rust borrow checker", "min_similarity": 0.1})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["conversation_id"] == "conv-2"
+        assert data[0]["message_count"] == 1
+
+    def test_response_models_documented(self, client):
+        """Test response schemas stay in the OpenAPI document"""
+        paths = client.app.openapi()["paths"]
+
+        schema = paths["/api/memory/conversations/{conversation_id}"]["get"]["responses"]["200"]
+        assert schema["content"]["application/json"]["schema"]["$ref"].endswith("/Conversation")
+
+
+class TestCompression:
+    """Test response compression configured on the main app"""
+
+    def test_large_listing_gzipped(self, memory):
+        """Test the streamed listing is gzip-encoded by the app middleware"""
+        from fastapi.middleware.gzip import GZipMiddleware
+        from oxide.web.backend.main import app as main_app
+
+        gzip = [m for m in main_app.user_middleware if m.cls is GZipMiddleware]
+        assert len(gzip) == 1
+
+        for i in range(40):
+            memory.add_context(f"conv-extra-{i}", "user", "message")
+
+        app = FastAPI(middleware=gzip)
+        app.include_router(router)
+        response = TestClient(app).get("/api/memory/conversations", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 42
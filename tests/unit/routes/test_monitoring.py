@@ -0,0 +1,171 @@
+"""
+Test suite for monitoring API routes.
+
+Tests cover:
+- Router registration
+- System metrics collection
+- Task statistics
+- Health check
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from oxide.utils.metrics_cache import MetricsCache
+from oxide.web.backend.routes import monitoring
+from oxide.web.backend.routes.monitoring import router
+
+
+@pytest.fixture
+def mock_orchestrator():
+    """Create mock orchestrator"""
+    orchestrator = MagicMock()
+
+    async def get_service_status():
+        return {
+            "gemini": {"enabled": True, "healthy": True},
+            "qwen": {"enabled": True, "healthy": False},
+        }
+
+    orchestrator.get_service_status = get_service_status
+    return orchestrator
+
+
+@pytest.fixture
+def mock_ws_manager():
+    """Create mock WebSocket manager"""
+    ws_manager = MagicMock()
+    ws_manager.get_connection_count.return_value = 2
+    return ws_manager
+
+
+@pytest.fixture
+def mock_task_storage():
+    """Patch the global task storage"""
+    storage = MagicMock()
+    storage.get_stats.return_value = {"total": 4, "by_status": {"completed": 3, "failed": 1}}
+    with patch('oxide.utils.task_storage.get_task_storage', return_value=storage):
+        yield storage
+
+
+@pytest.fixture
+def app(mock_orchestrator, mock_ws_manager):
+    """Create FastAPI app with monitoring router"""
+    app = FastAPI()
+    app.include_router(router, prefix="/api/monitoring")
+    app.dependency_overrides[monitoring.get_orchestrator] = lambda: mock_orchestrator
+    app.dependency_overrides[monitoring.get_ws_manager] = lambda: mock_ws_manager
+    app.dependency_overrides[monitoring.get_metrics_cache] = lambda: MetricsCache(ttl=2.0)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client"""
+    return TestClient(app)
+
+
+class TestMonitoringRouter:
+    """Test monitoring router registration"""
+
+    def test_single_cached_metrics_route(self):
+        """Test /metrics/ is registered once and served by the cached handler"""
+        import inspect
+
+        metrics_routes = [r for r in router.routes if r.path == "/metrics/"]
+
+        assert len(metrics_routes) == 1
+        assert metrics_routes[0].endpoint is monitoring.get_metrics
+        assert "metrics_cache" in inspect.signature(monitoring.get_metrics).parameters
+
+    def test_routes_render_with_orjson(self):
+        """Test monitoring routes default to the orjson response class"""
+        from oxide.web.backend.responses import OrjsonResponse
+
+        assert all(route.response_class is OrjsonResponse for route in router.routes)
+
+
+class TestGetMetrics:
+    """Test GET /api/monitoring/metrics/"""
+
+    def test_get_metrics(self, client, mock_task_storage):
+        """Test metrics aggregate services, tasks, system and websocket data"""
+        response = client.get("/api/monitoring/metrics/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["services"] == {"total": 2, "enabled": 2, "healthy": 1, "unhealthy": 1}
+        assert data["tasks"]["completed"] == 3
+        assert data["tasks"]["failed"] == 1
+        assert data["websocket"]["connections"] == 2
+        assert "cpu_percent" in data["system"]
+
+    def test_metrics_error(self, client, mock_orchestrator, mock_task_storage):
+        """Test a failing metric returns an error payload"""
+        async def get_service_status():
+            raise RuntimeError("boom")
+
+        mock_orchestrator.get_service_status = get_service_status
+
+        response = client.get("/api/monitoring/metrics/")
+
+        assert response.status_code == 200
+        assert response.json()["error"] == "boom"
+
+
+class TestHealthCheck:
+    """Test GET /api/monitoring/health/"""
+
+    def test_health_uses_sampler_reading(self, client):
+        """Test health check reads the sampler instead of sampling CPU inline"""
+        sampler = MagicMock()
+        sampler.latest.return_value = (95.0, MagicMock(percent=20.0))
+
+        with patch('oxide.web.backend.routes.monitoring.get_system_metrics_sampler', return_value=sampler):
+            response = client.get("/api/monitoring/health/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "degraded"
+        assert data["issues"] == ["High CPU usage"]
+        assert data["cpu_percent"] == 95.0
+
+
+class TestGetStats:
+    """Test GET /api/monitoring/stats/"""
+
+    def test_stats_from_storage_aggregate(self, client, mock_task_storage):
+        """Test stats are built from the storage aggregate, not a task scan"""
+        mock_task_storage.get_aggregate_stats.return_value = {
+            "total": 4,
+            "by_status": {"completed": 3, "failed": 1},
+            "avg_duration": 1.2345,
+        }
+
+        response = client.get("/api/monitoring/stats/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data == {
+            "total_tasks": 4,
+            "avg_duration": 1.23,
+            "success_rate": 75.0,
+            "tasks_by_status": {"completed": 3, "failed": 1},
+            "completed": 3,
+            "failed": 1,
+        }
+        mock_task_storage.get_aggregate_stats.assert_called_once_with(limit=1000)
+        mock_task_storage.list_tasks.assert_not_called()
+
+    def test_stats_no_tasks(self, client, mock_task_storage):
+        """Test stats with no tasks return zeroes"""
+        mock_task_storage.get_aggregate_stats.return_value = {
+            "total": 0, "by_status": {}, "avg_duration": 0,
+        }
+
+        response = client.get("/api/monitoring/stats/")
+
+        assert response.json()["total_tasks"] == 0
+        assert response.json()["tasks_by_status"] == {}
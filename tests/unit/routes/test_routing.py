@@ -263,3 +263,28 @@ class TestGetAvailableTaskTypes:
         assert "coding" in task_names
         assert "code_review" in task_names
         assert "quick_query" in task_names
+
+
+class TestListRoutingRulesCache:
+    """Test serialized payload caching of GET /api/routing/rules"""
+
+    def test_payload_reused_until_rules_change(self, client, tmp_path):
+        """Test the rules are re-exported only after a write"""
+        from oxide.utils.routing_rules import RoutingRulesManager
+
+        manager = RoutingRulesManager(storage_path=tmp_path / "rules.json")
+        manager.add_rule("coding", "qwen")
+
+        with patch('oxide.web.backend.routes.routing.get_routing_rules_manager', return_value=manager), \
+                patch.object(manager, 'export_rules', wraps=manager.export_rules) as export_rules:
+            first = client.get("/api/routing/rules").json()
+            second = client.get("/api/routing/rules").json()
+            assert export_rules.call_count == 1
+
+            manager.add_rule("review", "gemini")
+            third = client.get("/api/routing/rules").json()
+            assert export_rules.call_count == 2
+
+        assert first == second
+        assert first["rules"] == [{"task_type": "coding", "service": "qwen"}]
+        assert third["stats"]["total_rules"] == 2
@@ -0,0 +1,446 @@
+"""
+Test suite for tasks API routes.
+
+Tests cover:
+- Task submission
+- Task listing and lookup
+- Streamed chunk batching
+- Background task execution
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from oxide.utils.exceptions import ExecutionError, NoServiceAvailableError
+from oxide.utils.exceptions import TimeoutError as OxideTimeoutError
+from oxide.web.backend.routes import tasks
+from oxide.web.backend.routes.tasks import _ChunkBatcher, router
+
+
+@pytest.fixture(autouse=True)
+def inflight():
+    """Isolate the in-flight task registry and path cache per test"""
+    tasks._validate_paths_cached.cache_clear()
+    with patch.dict(tasks._inflight, clear=True):
+        yield tasks._inflight
+
+
+@pytest.fixture
+def mock_ws_manager():
+    """Create mock WebSocket manager with async broadcast methods"""
+    ws_manager = MagicMock()
+    ws_manager.get_connection_count.return_value = 1
+    ws_manager.broadcast_task_start = AsyncMock()
+    ws_manager.broadcast_task_progress = AsyncMock()
+    ws_manager.forward_task_broadcast_chunk = AsyncMock()
+    ws_manager.broadcast_task_complete = AsyncMock()
+    return ws_manager
+
+
+@pytest.fixture
+def mock_task_storage():
+    """Create mock task storage"""
+    storage = MagicMock()
+    with patch('oxide.web.backend.routes.tasks.get_task_storage', return_value=storage):
+        yield storage
+
+
+@pytest.fixture
+def mock_orchestrator():
+    """Create mock orchestrator with classifier and router"""
+    orchestrator = MagicMock()
+    task_info = MagicMock(recommended_services=["qwen"])
+    task_info.task_type.value = "coding"
+    orchestrator.classifier.classify.return_value = task_info
+    return orchestrator
+
+
+@pytest.fixture
+def client(mock_orchestrator, mock_ws_manager):
+    """Create test client with the tasks router"""
+    app = FastAPI()
+    app.include_router(router, prefix="/api/tasks")
+    app.dependency_overrides[tasks.get_orchestrator] = lambda: mock_orchestrator
+    app.dependency_overrides[tasks.get_ws_manager] = lambda: mock_ws_manager
+    return TestClient(app)
+
+
+def _orchestrator(chunks, orchestrator=None):
+    """Create orchestrator stub streaming the given chunks"""
+    orchestrator = orchestrator or MagicMock()
+
+    async def execute_task(prompt, files, preferences):
+        for chunk in chunks:
+            yield chunk
+
+    orchestrator.execute_task = execute_task
+    return orchestrator
+
+
+class TestExecuteTask:
+    """Test POST /api/tasks/execute"""
+
+    def test_execute_uses_orchestrator_classifier(self, client, mock_orchestrator, mock_task_storage):
+        """Test tasks are classified by the orchestrator's shared classifier"""
+        queue = MagicMock()
+        with patch('oxide.core.classifier.TaskClassifier') as classifier_cls, \
+                patch.object(tasks, 'get_task_queue', return_value=queue):
+            response = client.post("/api/tasks/execute", json={"prompt": "write code"})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "queued"
+        classifier_cls.assert_not_called()
+        mock_orchestrator.classifier.classify.assert_called_once_with("write code", None)
+        assert mock_task_storage.add_task.call_args.kwargs["service"] == "qwen"
+        assert mock_task_storage.add_task.call_args.kwargs["task_type"] == "coding"
+        assert queue.submit.call_args.args[0] is tasks._execute_task_background
+        kwargs = queue.submit.call_args.kwargs
+        assert (kwargs["service"], kwargs["task_type"]) == ("qwen", "coding")
+
+        task_id = response.json()["task_id"]
+        assert len(task_id) == 32
+        int(task_id, 16)
+
+    def test_execute_resolves_dependencies_from_app_state(self, mock_orchestrator, mock_ws_manager, mock_task_storage):
+        """Test the route resolves the orchestrator and WebSocket manager per request and hands them to the job"""
+        app = FastAPI()
+        app.include_router(router, prefix="/api/tasks")
+        app.state.oxide = MagicMock(orchestrator=mock_orchestrator, ws_manager=mock_ws_manager)
+        queue = MagicMock()
+
+        with patch.object(tasks, 'get_task_queue', return_value=queue):
+            response = TestClient(app).post("/api/tasks/execute", json={"prompt": "write code"})
+
+        assert response.status_code == 200
+        func, *args = queue.submit.call_args.args
+        assert args[4:] == [mock_orchestrator, mock_ws_manager, mock_task_storage]
+
+    def test_execute_rejected_when_queue_full(self, client, mock_task_storage):
+        """Test a saturated worker queue returns 503 and fails the stored task"""
+        queue = MagicMock()
+        queue.submit.side_effect = asyncio.QueueFull
+
+        with patch.object(tasks, 'get_task_queue', return_value=queue):
+            response = client.post("/api/tasks/execute", json={"prompt": "write code"})
+
+        assert response.status_code == 503
+        task_id = mock_task_storage.add_task.call_args.kwargs["task_id"]
+        mock_task_storage.update_task.assert_called_once_with(task_id, status="failed", error="Task queue is full")
+
+    def test_identical_request_joins_inflight_task(self, client, mock_task_storage, inflight):
+        """Test a duplicate of a running task returns its ID without new work"""
+        queue = MagicMock()
+        with patch.object(tasks, 'get_task_queue', return_value=queue):
+            first = client.post("/api/tasks/execute", json={"prompt": "p", "preferences": {"a": 1, "b": 2}})
+            second = client.post("/api/tasks/execute", json={"prompt": "p", "preferences": {"b": 2, "a": 1}})
+            other = client.post("/api/tasks/execute", json={"prompt": "q"})
+
+        assert second.json()["task_id"] == first.json()["task_id"]
+        assert other.json()["task_id"] != first.json()["task_id"]
+        assert queue.submit.call_count == 2
+        assert mock_task_storage.add_task.call_count == 2
+        assert len(inflight) == 2
+
+    async def test_inflight_released_when_task_finishes(self, mock_ws_manager, mock_task_storage, inflight):
+        """Test the fingerprint is released even if the task fails"""
+        orchestrator = MagicMock()
+
+        async def execute_task(prompt, files, preferences):
+            raise RuntimeError("boom")
+            yield
+
+        orchestrator.execute_task = execute_task
+        inflight["fp"] = "t1"
+
+        await tasks._execute_task_background(
+            "t1", "p", None, None, orchestrator, mock_ws_manager, mock_task_storage, fingerprint="fp"
+        )
+
+        assert inflight == {}
+        mock_task_storage.update_task.assert_any_call("t1", status="failed", error="Unexpected error: boom")
+
+    def test_execute_validates_files_off_loop(self, client, mock_task_storage):
+        """Test file paths are validated in a worker thread"""
+        on_loop = []
+
+        def validate_paths(files, require_exists=False):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return files
+
+        with patch.object(tasks, 'validate_paths', side_effect=validate_paths), \
+                patch.object(tasks, 'get_task_queue', return_value=MagicMock()):
+            response = client.post("/api/tasks/execute", json={"prompt": "p", "files": ["a.py"]})
+
+        assert response.status_code == 200
+        assert on_loop == [False]
+        assert mock_task_storage.add_task.call_args.kwargs["files"] == ["a.py"]
+
+    def test_validated_files_cached(self, client, mock_task_storage):
+        """Test a repeated file list is not resolved again"""
+        with patch.object(tasks, 'validate_paths', side_effect=lambda files, require_exists: files) as validate, \
+                patch.object(tasks, 'get_task_queue', return_value=MagicMock()):
+            client.post("/api/tasks/execute", json={"prompt": "p", "files": ["a.py"]})
+            client.post("/api/tasks/broadcast", json={"prompt": "p", "files": ["a.py"]})
+
+        validate.assert_called_once()
+        assert mock_task_storage.add_task.call_args.kwargs["files"] == ["a.py"]
+
+    def test_execute_rejects_unsafe_files(self, client, mock_task_storage):
+        """Test a path failing security validation returns 403"""
+        from oxide.utils.path_validator import SecurityError
+
+        with patch.object(tasks, 'validate_paths', side_effect=SecurityError("outside whitelist")):
+            response = client.post("/api/tasks/execute", json={"prompt": "p", "files": ["/etc/passwd"]})
+
+        assert response.status_code == 403
+        mock_task_storage.add_task.assert_not_called()
+
+
+class TestExecuteBroadcastTask:
+    """Test POST /api/tasks/broadcast"""
+
+    def test_broadcast_preferences_copied(self, client, mock_task_storage):
+        """Test broadcast mode is flagged on a copy of the request preferences"""
+        queue = MagicMock()
+        with patch.object(tasks, 'get_task_queue', return_value=queue):
+            response = client.post(
+                "/api/tasks/broadcast",
+                json={"prompt": "p", "preferences": {"timeout": 5}, "unknown": True}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["execution_mode"] == "broadcast_all"
+        assert mock_task_storage.add_task.call_args.kwargs["preferences"] == {"timeout": 5, "broadcast_all": True}
+
+    def test_task_request_frozen(self):
+        """Test validated requests cannot be reassigned"""
+        from pydantic import ValidationError
+
+        request = tasks.TaskRequest(prompt="p", extra_field=1)
+
+        assert not hasattr(request, "extra_field")
+        with pytest.raises(ValidationError):
+            request.prompt = "changed"
+
+
+class TestGetTasks:
+    """Test GET /api/tasks/ and /api/tasks/{task_id}"""
+
+    def test_list_tasks(self, client, mock_task_storage):
+        """Test listing renders stored tasks with orjson"""
+        mock_task_storage.list_and_count.return_value = ([{"id": "t1", "result": "ok \u2713"}], 3)
+
+        response = client.get("/api/tasks/", params={"limit": 1})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"tasks": [{"id": "t1", "result": "ok \u2713"}], "total": 3, "filtered": 1}
+        mock_task_storage.list_and_count.assert_called_once_with(status=None, limit=1)
+        mock_task_storage.get_stats.assert_not_called()
+
+    def test_get_task_etag(self, client, tmp_path):
+        """Test polls revalidate with the ETag until the task changes"""
+        from oxide.utils.task_storage import TaskStorage
+
+        storage = TaskStorage(storage_path=tmp_path / "tasks.json")
+        storage.add_task(task_id="t1", prompt="p")
+
+        with patch.object(tasks, 'get_task_storage', return_value=storage), \
+                patch.object(storage, 'get_task', wraps=storage.get_task) as get_task:
+            first = client.get("/api/tasks/t1")
+            etag = first.headers["etag"]
+            cached = client.get("/api/tasks/t1", headers={"If-None-Match": etag})
+
+            storage.update_task("t1", status="running")
+            changed = client.get("/api/tasks/t1", headers={"If-None-Match": etag})
+
+        assert first.json()["status"] == "queued"
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert changed.status_code == 200
+        assert changed.json()["status"] == "running"
+        assert changed.headers["etag"] != etag
+        assert get_task.call_count == 2
+
+    def test_list_tasks_etag(self, client, mock_task_storage):
+        """Test an unchanged listing is served from cache as 304"""
+        mock_task_storage.version = "v1"
+        mock_task_storage.list_and_count.return_value = ([], 0)
+
+        first = client.get("/api/tasks/")
+        second = client.get("/api/tasks/", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        mock_task_storage.list_and_count.assert_called_once()
+
+    def test_get_task_not_found(self, client, mock_task_storage):
+        """Test an unknown task returns 404"""
+        mock_task_storage.get_task.return_value = None
+
+        response = client.get("/api/tasks/missing")
+
+        assert response.status_code == 404
+
+
+class TestChunkBatcher:
+    """Test _ChunkBatcher"""
+
+    async def test_flushes_when_full(self):
+        """Test a full batch is sent immediately, per key"""
+        sent = []
+
+        async def send(key, chunks):
+            sent.append((key, chunks))
+
+        batcher = _ChunkBatcher(send, max_chunks=3, max_delay=60)
+        await batcher.add("a", 1)
+        await batcher.add("b", 2)
+        assert sent == []
+
+        await batcher.add("a", 3)
+        assert sent == [("a", [1, 3]), ("b", [2])]
+
+    async def test_flushes_after_delay(self):
+        """Test pending chunks are sent once the delay elapses"""
+        sent = []
+
+        async def send(key, chunks):
+            sent.append(chunks)
+
+        batcher = _ChunkBatcher(send, max_chunks=100, max_delay=0.01)
+        await batcher.add(None, "x")
+        await batcher.add(None, "y")
+
+        await asyncio.sleep(0.05)
+        assert sent == [["x", "y"]]
+
+        await batcher.close()
+        assert sent == [["x", "y"]]
+
+    async def test_close_flushes_remaining(self):
+        """Test close sends whatever is still pending"""
+        send = AsyncMock()
+        batcher = _ChunkBatcher(send, max_chunks=100, max_delay=60)
+        await batcher.add(None, "tail")
+
+        await batcher.close()
+
+        send.assert_awaited_once_with(None, ["tail"])
+
+
+class TestExecuteTaskBackground:
+    """Test _execute_task_background"""
+
+    async def test_progress_chunks_coalesced(self, mock_ws_manager, mock_task_storage):
+        """Test streamed chunks reach clients in fewer, joined messages"""
+        chunks = [f"c{i} " for i in range(40)]
+
+        await tasks._execute_task_background(
+            "t1", "p", None, None, _orchestrator(chunks), mock_ws_manager, mock_task_storage
+        )
+
+        sent = [call.args[1] for call in mock_ws_manager.broadcast_task_progress.await_args_list]
+        assert "".join(sent) == "".join(chunks)
+        assert len(sent) < len(chunks)
+        mock_task_storage.update_task.assert_any_call("t1", status="completed", result="".join(chunks))
+        mock_task_storage.get_task.assert_not_called()
+        success, duration = mock_ws_manager.broadcast_task_complete.await_args.args[1:]
+        assert success is True
+        assert duration >= 0
+
+    async def test_broadcast_done_sent_after_pending_text(self, mock_ws_manager, mock_task_storage):
+        """Test a service's completion marker follows its batched text"""
+        chunks = [
+            json.dumps({"service": "qwen", "chunk": "Hel", "done": False, "timestamp": 1.0}),
+            json.dumps({"service": "qwen", "chunk": "lo", "done": False, "timestamp": 2.0}),
+            json.dumps({"service": "qwen", "chunk": "", "done": True, "timestamp": 3.0, "total_chunks": 2}),
+        ]
+
+        await tasks._execute_task_background(
+            "t1", "p", None, None, _orchestrator(chunks), mock_ws_manager, mock_task_storage,
+            execution_mode="broadcast_all"
+        )
+
+        calls = [call.args[1] for call in mock_ws_manager.forward_task_broadcast_chunk.await_args_list]
+        assert calls[0]["chunk"] == "Hello"
+        assert calls[0]["done"] is False
+        assert calls[0]["timestamp"] == 2.0
+        assert calls[1]["done"] is True
+        assert calls[1]["total_chunks"] == 2
+
+
+    @pytest.mark.parametrize("execution_mode", ["single", "broadcast_all"])
+    async def test_no_clients_skips_forwarding(self, mock_ws_manager, mock_task_storage, execution_mode):
+        """Test chunks are not forwarded while no WebSocket client is connected"""
+        mock_ws_manager.get_connection_count.return_value = 0
+        chunks = ["a", "b"] if execution_mode == "single" else [
+            json.dumps({"service": "qwen", "chunk": "a", "done": False, "timestamp": 1.0}),
+        ]
+
+        await tasks._execute_task_background(
+            "t1", "p", None, None, _orchestrator(chunks), mock_ws_manager, mock_task_storage,
+            execution_mode=execution_mode
+        )
+
+        mock_ws_manager.broadcast_task_progress.assert_not_awaited()
+        mock_ws_manager.forward_task_broadcast_chunk.assert_not_awaited()
+        if execution_mode == "single":
+            mock_task_storage.update_task.assert_any_call("t1", status="completed", result="ab")
+        mock_ws_manager.broadcast_task_complete.assert_awaited_once()
+
+    async def test_malformed_broadcast_chunk_skipped(self, mock_ws_manager, mock_task_storage):
+        """Test an unparsable broadcast chunk is skipped without failing the task"""
+        chunks = [
+            "not json",
+            json.dumps({"service": "qwen", "chunk": "", "done": True, "timestamp": 1.0}),
+        ]
+
+        await tasks._execute_task_background(
+            "t1", "p", None, None, _orchestrator(chunks), mock_ws_manager, mock_task_storage,
+            execution_mode="broadcast_all"
+        )
+
+        mock_ws_manager.forward_task_broadcast_chunk.assert_awaited_once()
+        mock_task_storage.update_task.assert_any_call("t1", status="completed")
+
+class TestErrorMessage:
+    """Test _error_message()"""
+
+    @pytest.mark.parametrize("error, expected", [
+        (NoServiceAvailableError("coding"), "No service available: No service available to handle task type: coding"),
+        (ExecutionError("failed"), "Execution error: failed"),
+        (OxideTimeoutError("qwen", 5, "slow"), "Execution error: slow"),
+        (ValueError("bad"), "Unexpected error: bad"),
+    ])
+    def test_prefix_by_exception_class(self, error, expected):
+        """Test prefixes follow the exception class hierarchy"""
+        assert tasks._error_message(error) == expected
+
+
+class TestExecuteBroadcastTaskBackground:
+    """Test _execute_broadcast_task_background"""
+
+    async def test_routes_with_orchestrator_router(self, mock_ws_manager, mock_task_storage, mock_orchestrator):
+        """Test the broadcast decision comes from the orchestrator's router"""
+        mock_orchestrator.router.route_broadcast_all = AsyncMock(
+            return_value=MagicMock(broadcast_services=["qwen", "gemini"])
+        )
+        orchestrator = _orchestrator([], mock_orchestrator)
+
+        with patch('oxide.config.loader.load_config') as load_config:
+            await tasks._execute_broadcast_task_background(
+                "t1", "p", None, {"broadcast_all": True}, orchestrator, mock_ws_manager, mock_task_storage
+            )
+
+        load_config.assert_not_called()
+        mock_orchestrator.router.route_broadcast_all.assert_awaited_once()
+        mock_task_storage.update_task.assert_any_call("t1", status="completed")
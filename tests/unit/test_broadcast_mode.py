@@ -198,13 +198,14 @@ async def test_websocket_broadcast_chunk_method():
         error=None,
         total_chunks=None
     )
+    await ws_manager.drain()
 
     # Verify both connections received the message
-    assert mock_ws1.send_json.called
-    assert mock_ws2.send_json.called
+    assert mock_ws1.send_text.called
+    assert mock_ws2.send_text.called
 
     # Check message format
-    sent_message = mock_ws1.send_json.call_args[0][0]
+    sent_message = json.loads(mock_ws1.send_text.call_args[0][0])
 
     assert sent_message["type"] == "task_broadcast_chunk"
     assert sent_message["task_id"] == "test_task_1"
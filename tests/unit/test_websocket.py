@@ -8,6 +8,8 @@ Tests cover:
 - Task event broadcasting
 """
 
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import WebSocket
@@ -31,6 +33,11 @@ def mock_websocket():
     return ws
 
 
+def _broadcast_message(websocket):
+    """Decode the last JSON text frame sent to a mock WebSocket"""
+    return json.loads(websocket.send_text.call_args[0][0])
+
+
 class TestWebSocketManager:
     """Test WebSocketManager basic functionality"""
 
@@ -46,13 +53,28 @@ class TestWebSocketManager:
         # Verify
         assert ws_manager.get_connection_count() == 1
         mock_websocket.accept.assert_called_once()
-        mock_websocket.send_json.assert_called_once()
+        mock_websocket.send_text.assert_called_once()
 
         # Verify welcome message
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _broadcast_message(mock_websocket)
         assert call_args['type'] == 'connected'
         assert call_args['clients'] == 1
 
+    @pytest.mark.asyncio
+    async def test_welcome_message(self, mock_websocket):
+        """Test the pre-encoded welcome frame decodes to the full message"""
+        ws_manager = WebSocketManager(max_connections=5)
+
+        await ws_manager.connect(mock_websocket)
+
+        assert _broadcast_message(mock_websocket) == {
+            "type": "connected",
+            "message": "Connected to Oxide WebSocket",
+            "active_clients": 1,
+            "max_clients": 5,
+        }
+        await ws_manager.close_all()
+
     def test_disconnect_websocket(self, ws_manager, mock_websocket):
         """Test disconnecting a WebSocket"""
         # Add connection
@@ -79,7 +101,7 @@ class TestWebSocketManager:
 
         await ws_manager.send_personal(message, mock_websocket)
 
-        mock_websocket.send_json.assert_called_once_with(message)
+        assert _broadcast_message(mock_websocket) == message
 
     @pytest.mark.asyncio
     async def test_broadcast_to_multiple_clients(self, ws_manager):
@@ -93,11 +115,116 @@ class TestWebSocketManager:
 
         message = {"type": "broadcast", "data": "test"}
         await ws_manager.broadcast(message)
+        await ws_manager.drain()
+
+        # Verify all received the same pre-serialized frame
+        ws1.send_text.assert_called_once()
+        payload = ws1.send_text.call_args[0][0]
+        assert json.loads(payload) == message
+        ws2.send_text.assert_called_once_with(payload)
+        ws3.send_text.assert_called_once_with(payload)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_failed_client(self, ws_manager, mock_websocket):
+        """Test a client is sent to through its outbox, and dropped if the send fails"""
+        ws_manager.active_connections = {mock_websocket}
+
+        await ws_manager.broadcast({"type": "test"})
+        await ws_manager.drain()
+
+        assert _broadcast_message(mock_websocket) == {"type": "test"}
+
+        mock_websocket.send_text.side_effect = Exception("Connection closed")
+        await ws_manager.broadcast({"type": "test"})
+        await ws_manager.drain()
+
+        assert ws_manager.get_connection_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_stalled_client(self, mock_websocket):
+        """Test a client whose send exceeds send_timeout is closed and removed"""
+        ws_manager = WebSocketManager(send_timeout=0.01)
+
+        async def stall(payload):
+            await asyncio.sleep(10)
+
+        stalled = AsyncMock(spec=WebSocket)
+        stalled.send_text = AsyncMock(side_effect=stall)
+        ws_manager.active_connections = {mock_websocket, stalled}
+
+        await ws_manager.broadcast({"type": "test"})
+        await asyncio.wait_for(ws_manager.drain(), timeout=1)
+
+        assert ws_manager.active_connections == {mock_websocket}
+        assert _broadcast_message(mock_websocket) == {"type": "test"}
+        stalled.close.assert_called_once_with(code=1011)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_client_with_full_outbox(self, mock_websocket):
+        """Test a client that falls max_message_queue frames behind is closed and removed"""
+        ws_manager = WebSocketManager(max_message_queue=1)
+        ws_manager.active_connections = {mock_websocket}
+
+        await ws_manager.broadcast({"type": "first"})
+        await ws_manager.broadcast({"type": "second"})
+        await asyncio.wait_for(ws_manager.drain(), timeout=1)
+
+        assert ws_manager.get_connection_count() == 0
+        mock_websocket.close.assert_called_once_with(code=1011)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_raw_sends_frame_unchanged(self, ws_manager, mock_websocket):
+        """Test a pre-encoded frame is sent as-is to every client"""
+        ws_manager.active_connections = {mock_websocket}
+
+        await ws_manager.broadcast_raw('{"type":"ping"}')
+        await ws_manager.drain()
+
+        mock_websocket.send_text.assert_called_once_with('{"type":"ping"}')
+
+    @pytest.mark.asyncio
+    async def test_broadcast_skips_encoding_without_clients(self, ws_manager, monkeypatch):
+        """Test nothing is serialized when no client is connected"""
+        dumps = MagicMock()
+        monkeypatch.setattr("oxide.web.backend.websocket._dumps", dumps)
+
+        await ws_manager.broadcast_task_start("task-1", "query", "gemini")
+
+        dumps.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_tolerates_disconnect_during_send(self, ws_manager):
+        """Test clients leaving while frames are queued do not stall delivery"""
+        ws1 = AsyncMock(spec=WebSocket)
+        ws2 = AsyncMock(spec=WebSocket)
+        ws1.send_text = AsyncMock(side_effect=lambda payload: ws_manager.disconnect(ws2))
+        ws2.send_text = AsyncMock(side_effect=lambda payload: ws_manager.disconnect(ws1))
+        ws_manager.active_connections = {ws1, ws2}
 
-        # Verify all received message
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
-        ws3.send_json.assert_called_once_with(message)
+        await ws_manager.broadcast({"type": "test"})
+        await ws_manager.broadcast({"type": "test"})
+        await asyncio.wait_for(ws_manager.drain(), timeout=1)
+
+        assert ws_manager.get_connection_count() == 0
+        assert ws_manager._outboxes == {}
+
+    @pytest.mark.asyncio
+    async def test_health_sweeper_prunes_dead_connections(self, mock_websocket):
+        """Test the periodic ping drops clients that can no longer be sent to"""
+        ws_manager = WebSocketManager(sweep_interval=0.01)
+        await ws_manager.connect(mock_websocket)
+        mock_websocket.send_text.side_effect = Exception("Connection closed")
+
+        for _ in range(100):
+            if not ws_manager.get_connection_count():
+                break
+            await asyncio.sleep(0.01)
+
+        assert ws_manager.get_connection_count() == 0
+        assert json.loads(mock_websocket.send_text.call_args[0][0]) == {"type": "ping"}
+
+        await ws_manager.close_all()
+        assert ws_manager._sweeper is None
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_failed_connections(self, ws_manager):
@@ -105,13 +232,14 @@ class TestWebSocketManager:
         # Create mock websockets, one that fails
         ws1 = AsyncMock(spec=WebSocket)
         ws2 = AsyncMock(spec=WebSocket)
-        ws2.send_json = AsyncMock(side_effect=Exception("Connection closed"))
+        ws2.send_text = AsyncMock(side_effect=Exception("Connection closed"))
         ws3 = AsyncMock(spec=WebSocket)
 
         ws_manager.active_connections = [ws1, ws2, ws3]
 
         message = {"type": "test"}
         await ws_manager.broadcast(message)
+        await ws_manager.drain()
 
         # ws2 should be removed
         assert ws_manager.get_connection_count() == 2
@@ -130,8 +258,10 @@ class TestWebSocketManager:
             service="gemini"
         )
 
+        await ws_manager.drain()
+
         # Verify message structure
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _broadcast_message(mock_websocket)
         assert call_args['type'] == 'task_start'
         assert call_args['task_id'] == 'task-123'
         assert call_args['task_type'] == 'code_review'
@@ -149,13 +279,46 @@ class TestWebSocketManager:
             progress_percent=50.0
         )
 
+        await ws_manager.drain()
+
         # Verify message structure
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _broadcast_message(mock_websocket)
         assert call_args['type'] == 'task_progress'
         assert call_args['task_id'] == 'task-123'
         assert call_args['chunk'] == 'Processing...'
         assert call_args['progress'] == 50.0
 
+    @pytest.mark.asyncio
+    async def test_broadcast_task_broadcast_chunk_optional_fields(self, ws_manager, mock_websocket):
+        """Test error and total_chunks are only included when set"""
+        ws_manager.active_connections = [mock_websocket]
+
+        await ws_manager.broadcast_task_broadcast_chunk(
+            "task-123", "gemini", "", done=True, timestamp=1.0, error="boom", total_chunks=0
+        )
+        await ws_manager.drain()
+        assert _broadcast_message(mock_websocket)["error"] == "boom"
+        assert _broadcast_message(mock_websocket)["total_chunks"] == 0
+
+        await ws_manager.broadcast_task_broadcast_chunk("task-123", "gemini", "hi", False, 2.0)
+        await ws_manager.drain()
+        assert "error" not in _broadcast_message(mock_websocket)
+        assert "total_chunks" not in _broadcast_message(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_forward_task_broadcast_chunk(self, ws_manager, mock_websocket):
+        """Test a broadcast_all chunk dict is sent as the message itself"""
+        ws_manager.active_connections = [mock_websocket]
+        chunk = {"service": "qwen", "chunk": "", "done": True, "timestamp": 1.0, "total_chunks": 3}
+
+        await ws_manager.forward_task_broadcast_chunk("task-123", chunk)
+
+        await ws_manager.drain()
+        call_args = _broadcast_message(mock_websocket)
+        assert call_args['type'] == 'task_broadcast_chunk'
+        assert call_args['task_id'] == 'task-123'
+        assert call_args['total_chunks'] == 3
+
     @pytest.mark.asyncio
     async def test_broadcast_task_complete(self, ws_manager, mock_websocket):
         """Test broadcasting task complete event"""
@@ -167,8 +330,10 @@ class TestWebSocketManager:
             duration_seconds=2.5
         )
 
+        await ws_manager.drain()
+
         # Verify message structure
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _broadcast_message(mock_websocket)
         assert call_args['type'] == 'task_complete'
         assert call_args['task_id'] == 'task-123'
         assert call_args['success'] is True
@@ -186,8 +351,10 @@ class TestWebSocketManager:
             error="Service unavailable"
         )
 
+        await ws_manager.drain()
+
         # Verify message structure
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _broadcast_message(mock_websocket)
         assert call_args['type'] == 'task_complete'
         assert call_args['success'] is False
         assert call_args['error'] == 'Service unavailable'
@@ -205,8 +372,10 @@ class TestWebSocketManager:
 
         await ws_manager.broadcast_service_status("gemini", status)
 
+        await ws_manager.drain()
+
         # Verify message structure
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _broadcast_message(mock_websocket)
         assert call_args['type'] == 'service_status'
         assert call_args['service'] == 'gemini'
         assert call_args['status'] == status
@@ -225,12 +394,46 @@ class TestWebSocketManager:
 
         await ws_manager.broadcast_metrics(metrics)
 
+        await ws_manager.drain()
+
         # Verify message structure
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _broadcast_message(mock_websocket)
         assert call_args['type'] == 'metrics'
         assert call_args['data'] == metrics
         assert 'timestamp' in call_args
 
+    @pytest.mark.asyncio
+    async def test_unchanged_status_and_metrics_not_rebroadcast(self, ws_manager, mock_websocket):
+        """Test identical consecutive status/metrics payloads are sent once"""
+        ws_manager.active_connections = {mock_websocket}
+
+        await ws_manager.broadcast_service_status("gemini", {"healthy": True})
+        await ws_manager.broadcast_service_status("gemini", {"healthy": True})
+        await ws_manager.broadcast_service_status("qwen", {"healthy": True})
+        await ws_manager.broadcast_metrics({"cpu": 10})
+        await ws_manager.broadcast_metrics({"cpu": 10})
+        await ws_manager.broadcast_metrics({"cpu": 20})
+        await ws_manager.drain()
+
+        sent = [json.loads(c[0][0]) for c in mock_websocket.send_text.call_args_list]
+        assert [(m["type"], m.get("service"), m.get("data")) for m in sent] == [
+            ("service_status", "gemini", None),
+            ("service_status", "qwen", None),
+            ("metrics", None, {"cpu": 10}),
+            ("metrics", None, {"cpu": 20}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_new_client_resets_dedup(self, ws_manager, mock_websocket):
+        """Test a newly connected client receives the current metrics"""
+        await ws_manager.broadcast_metrics({"cpu": 10})
+        await ws_manager.connect(mock_websocket)
+        await ws_manager.broadcast_metrics({"cpu": 10})
+        await ws_manager.drain()
+
+        assert _broadcast_message(mock_websocket)["data"] == {"cpu": 10}
+        await ws_manager.close_all()
+
     def test_get_connection_count(self, ws_manager):
         """Test getting connection count"""
         assert ws_manager.get_connection_count() == 0
@@ -239,11 +442,29 @@ class TestWebSocketManager:
         ws_manager.active_connections = [MagicMock() for _ in range(5)]
         assert ws_manager.get_connection_count() == 5
 
+    @pytest.mark.asyncio
+    async def test_close_all_tolerates_failing_and_stalled_closes(self, mock_websocket):
+        """Test shutdown closes every client even if some closes raise or hang"""
+        async def stall(**kwargs):
+            await asyncio.sleep(10)
+
+        ws_manager = WebSocketManager(send_timeout=0.01)
+        failing = AsyncMock(spec=WebSocket)
+        failing.close = AsyncMock(side_effect=RuntimeError("already closed"))
+        stalled = AsyncMock(spec=WebSocket)
+        stalled.close = AsyncMock(side_effect=stall)
+        ws_manager.active_connections = {mock_websocket, failing, stalled}
+
+        await asyncio.wait_for(ws_manager.close_all(), timeout=1)
+
+        mock_websocket.close.assert_called_once_with(code=1001, reason="Server shutting down")
+        assert ws_manager.get_connection_count() == 0
+
     @pytest.mark.asyncio
     async def test_send_personal_handles_error(self, ws_manager):
         """Test send_personal handles errors gracefully"""
         ws = AsyncMock(spec=WebSocket)
-        ws.send_json = AsyncMock(side_effect=Exception("Connection error"))
+        ws.send_text = AsyncMock(side_effect=Exception("Connection error"))
 
         # Should not raise
         await ws_manager.send_personal({"test": "data"}, ws)
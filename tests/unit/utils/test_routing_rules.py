@@ -161,6 +161,19 @@ class TestRoutingRulesManagerCRUD:
         assert count == 0
 
 
+    def test_version_changes_on_write(self, rules_manager):
+        """Test every write bumps the rules version"""
+        version = rules_manager.version
+
+        rules_manager.add_rule("coding", "qwen")
+        assert rules_manager.version == version + 1
+
+        rules_manager.delete_rule("coding")
+        assert rules_manager.version == version + 2
+
+        rules_manager.get_rule("coding")
+        assert rules_manager.version == version + 2
+
 class TestRoutingRulesManagerStats:
     """Test statistics and export functionality"""
 
@@ -0,0 +1,91 @@
+"""
+Test suite for the bounded task queue.
+
+Tests cover:
+- Running queued jobs on the worker pool
+- Concurrency limit
+- Backpressure when full
+"""
+
+import asyncio
+import pytest
+
+from oxide.utils.task_queue import TaskQueue
+
+
+class TestTaskQueue:
+    """Test TaskQueue"""
+
+    async def test_runs_submitted_jobs(self):
+        """Test queued jobs run with their arguments"""
+        results = []
+
+        async def job(value, scale=1):
+            results.append(value * scale)
+
+        queue = TaskQueue(workers=2, maxsize=10)
+        queue.submit(job, 1)
+        queue.submit(job, 2, scale=10)
+        await queue.join()
+        await queue.stop()
+
+        assert sorted(results) == [1, 20]
+
+    async def test_limits_concurrency(self):
+        """Test no more than `workers` jobs run at once"""
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        queue = TaskQueue(workers=2, maxsize=10)
+        for _ in range(6):
+            queue.submit(job)
+        await queue.join()
+        await queue.stop()
+
+        assert peak == 2
+
+    async def test_full_queue_raises(self):
+        """Test submitting past maxsize raises QueueFull"""
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+
+        queue = TaskQueue(workers=1, maxsize=1)
+        queue.submit(job)
+        await asyncio.sleep(0)  # worker takes the first job
+        queue.submit(job)
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.submit(job)
+
+        release.set()
+        await queue.join()
+        await queue.stop()
+
+    async def test_failing_job_keeps_worker_alive(self):
+        """Test an exception in one job does not stop the worker"""
+        results = []
+
+        async def bad():
+            raise RuntimeError("boom")
+
+        async def good():
+            results.append("ok")
+
+        queue = TaskQueue(workers=1, maxsize=10)
+        queue.submit(bad)
+        queue.submit(good)
+        await queue.join()
+
+        assert results == ["ok"]
+        assert queue.running
+        await queue.stop()
+        assert not queue.running
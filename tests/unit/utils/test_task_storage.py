@@ -0,0 +1,234 @@
+"""
+Test suite for task storage backends.
+
+Tests cover:
+- Bulk task creation (JSON, in-memory and SQLite backends)
+- Task updates (JSON, in-memory and SQLite backends, with and without RETURNING)
+- Change version tokens (JSON, in-memory and SQLite backends)
+- Listing with total count (JSON, in-memory and SQLite backends)
+- Aggregate statistics (JSON, in-memory and SQLite backends)
+- In-memory storage isolation
+"""
+
+import pytest
+
+from oxide.utils.task_storage import MemoryTaskStorage, TaskStorage
+from oxide.utils.task_storage_sqlite import TaskStorageSQLite
+
+
+@pytest.fixture
+def json_storage(tmp_path):
+    """Create JSON task storage in a temp file"""
+    return TaskStorage(storage_path=tmp_path / "tasks.json")
+
+
+@pytest.fixture
+def memory_storage():
+    """Create in-memory task storage"""
+    return MemoryTaskStorage()
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    """Create SQLite task storage in a temp file"""
+    return TaskStorageSQLite(storage_path=tmp_path / "tasks.db")
+
+
+@pytest.fixture
+def sqlite_no_returning_storage(sqlite_storage, monkeypatch):
+    """Create SQLite task storage that avoids UPDATE ... RETURNING (SQLite < 3.35)"""
+    monkeypatch.setattr(sqlite_storage, "_USE_RETURNING", False)
+    return sqlite_storage
+
+
+def _set_task(storage, task_id, status, duration=None, created_at=None):
+    """Set status, duration and creation time directly on a stored task"""
+    if isinstance(storage, TaskStorageSQLite):
+        with storage._get_connection() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = ?, duration = ?, created_at = COALESCE(?, created_at) WHERE id = ?",
+                (status, duration, created_at, task_id)
+            )
+    else:
+        tasks = storage._read_tasks()
+        tasks[task_id].update(status=status, duration=duration)
+        if created_at is not None:
+            tasks[task_id]["created_at"] = created_at
+        storage._write_tasks(tasks)
+
+
+@pytest.fixture(params=["json", "memory", "sqlite", "sqlite_no_returning"])
+def storage(request):
+    """Run a test against each storage backend"""
+    return request.getfixturevalue(f"{request.param}_storage")
+
+
+class TestAddTasksBulk:
+    """Test add_tasks_bulk()"""
+
+    def test_adds_tasks_with_status(self, storage):
+        """Test each spec is stored with its status, result and error applied"""
+        records = storage.add_tasks_bulk([
+            {"task_id": "t1", "prompt": "p1", "service": "qwen"},
+            {"task_id": "t2", "prompt": "p2", "status": "completed", "result": "done"},
+            {"task_id": "t3", "prompt": "p3", "status": "failed", "error": "boom"},
+        ])
+
+        assert [r["id"] for r in records] == ["t1", "t2", "t3"]
+        assert storage.get_task("t1")["status"] == "queued"
+        assert storage.get_task("t1")["service"] == "qwen"
+
+        completed = storage.get_task("t2")
+        assert completed["result"] == "done"
+        assert completed["completed_at"] is not None
+        assert completed["duration"] is None
+
+        assert storage.get_task("t3")["error"] == "boom"
+        assert storage.get_stats()["by_status"] == {"queued": 1, "completed": 1, "failed": 1}
+
+    def test_single_write(self, json_storage):
+        """Test the JSON backend writes the file once for the whole batch"""
+        before = json_storage._version
+
+        json_storage.add_tasks_bulk([{"task_id": f"t{i}", "prompt": "p"} for i in range(5)])
+
+        assert json_storage._version == before + 1
+
+
+class TestUpdateTask:
+    """Test update_task()"""
+
+    def test_returns_updated_task(self, storage):
+        """Test the updated record is returned with timestamps set"""
+        storage.add_task(task_id="t1", prompt="p", service="qwen")
+
+        running = storage.update_task("t1", status="running")
+        assert running["status"] == "running"
+        assert running["service"] == "qwen"
+        assert running["started_at"] is not None
+
+        completed = storage.update_task("t1", status="completed", result="done")
+        assert completed["result"] == "done"
+        assert completed["started_at"] == running["started_at"]
+        assert completed["completed_at"] is not None
+        assert completed["duration"] >= 0
+        assert storage.get_task("t1")["status"] == "completed"
+
+    def test_missing_task_returns_none(self, storage):
+        """Test updating an unknown task returns None"""
+        assert storage.update_task("missing", status="running") is None
+
+    def test_failed_without_start_has_no_duration(self, storage):
+        """Test duration stays unset for tasks that never ran"""
+        storage.add_task(task_id="t1", prompt="p")
+
+        task = storage.update_task("t1", status="failed", error="queue full")
+
+        assert task["error"] == "queue full"
+        assert task["completed_at"] is not None
+        assert task["duration"] is None
+
+
+class TestVersion:
+    """Test the version token"""
+
+    def test_changes_on_write_only(self, storage):
+        """Test writes change the version and reads do not"""
+        initial = storage.version
+
+        storage.add_task(task_id="t1", prompt="p")
+        added = storage.version
+        assert added != initial
+
+        storage.get_task("t1")
+        storage.list_tasks()
+        assert storage.version == added
+
+        storage.update_task("t1", status="running")
+        assert storage.version != added
+
+    def test_sees_writes_from_other_instance(self, storage):
+        """Test writes through another instance on the same file change the version"""
+        if storage.storage_path is None:
+            pytest.skip("in-memory storage is not shared between instances")
+        other = type(storage)(storage_path=storage.storage_path)
+        before = storage.version
+
+        other.add_task(task_id="t1", prompt="p")
+
+        assert storage.version != before
+
+
+class TestListAndCount:
+    """Test list_and_count()"""
+
+    def test_page_and_total(self, storage):
+        """Test the page matches list_tasks() and the total counts every task"""
+        for index, status in enumerate(["completed", "failed", "completed", "queued"]):
+            task_id = f"t{index}"
+            storage.add_task(task_id=task_id, prompt="p")
+            _set_task(storage, task_id, status, created_at=1000.0 + index)
+
+        page, total = storage.list_and_count(status="completed", limit=1)
+
+        assert total == 4
+        assert [task["id"] for task in page] == ["t2"]
+        assert page == storage.list_tasks(status="completed", limit=1)
+
+        page, total = storage.list_and_count(limit=10)
+        assert [task["id"] for task in page] == ["t3", "t2", "t1", "t0"]
+        assert total == 4
+
+
+class TestAggregateStats:
+    """Test get_aggregate_stats()"""
+
+    def test_empty_storage(self, storage):
+        """Test aggregation over no tasks"""
+        assert storage.get_aggregate_stats() == {"total": 0, "by_status": {}, "avg_duration": 0}
+
+    def test_counts_and_average_duration(self, storage):
+        """Test status counts and average duration of completed tasks"""
+        for task_id, status, duration in [
+            ("t1", "completed", 2.0),
+            ("t2", "completed", 4.0),
+            ("t3", "completed", None),
+            ("t4", "failed", 10.0),
+            ("t5", "queued", None),
+        ]:
+            storage.add_task(task_id=task_id, prompt="p")
+            _set_task(storage, task_id, status, duration)
+
+        stats = storage.get_aggregate_stats()
+
+        assert stats["total"] == 5
+        assert stats["by_status"] == {"completed": 3, "failed": 1, "queued": 1}
+        assert stats["avg_duration"] == pytest.approx(3.0)
+
+    def test_limit_keeps_most_recent(self, storage):
+        """Test only the most recent tasks are aggregated"""
+        for index, status in enumerate(["failed", "completed", "completed"]):
+            task_id = f"t{index}"
+            storage.add_task(task_id=task_id, prompt="p")
+            _set_task(storage, task_id, status, 1.0, created_at=1000.0 + index)
+
+        stats = storage.get_aggregate_stats(limit=2)
+
+        assert stats["total"] == 2
+        assert stats["by_status"] == {"completed": 2}
+
+
+class TestMemoryTaskStorage:
+    """Test MemoryTaskStorage"""
+
+    def test_no_file_and_detached_records(self, memory_storage, tmp_path, monkeypatch):
+        """Test nothing touches disk and returned records do not alias stored state"""
+        monkeypatch.chdir(tmp_path)
+
+        task = memory_storage.add_task(task_id="t1", prompt="p")
+        task["status"] = "mutated"
+        memory_storage.get_task("t1")["prompt"] = "mutated"
+
+        assert memory_storage.get_task("t1")["status"] == "queued"
+        assert memory_storage.get_task("t1")["prompt"] == "p"
+        assert list(tmp_path.iterdir()) == []